@@ -0,0 +1,73 @@
+"""add_listing_search_and_keyset_indexes
+
+Revision ID: b7c41e9d2a58
+Revises: 726db9c7e235
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c41e9d2a58'
+down_revision: Union[str, Sequence[str], None] = '726db9c7e235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes for admin listing search and keyset pagination."""
+    # Trigram indexes serve the ILIKE '%term%' user search
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_users_email_trgm',
+        'users',
+        ['email'],
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_users_name_trgm',
+        'users',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+    # Keyset pagination on (created_at, id), newest first
+    op.create_index(
+        'idx_users_created_at_id',
+        'users',
+        ['created_at', 'id'],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index(
+        'idx_invite_codes_created_at_id',
+        'invite_codes',
+        ['created_at', 'id']
+    )
+
+    # Keyset pagination on (timestamp, id) within a user or an action
+    op.create_index(
+        'idx_audit_logs_user_id_timestamp_id',
+        'audit_logs',
+        ['user_id', 'timestamp', 'id']
+    )
+    op.create_index(
+        'idx_audit_logs_action_timestamp_id',
+        'audit_logs',
+        ['action', 'timestamp', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Remove admin listing search and keyset pagination indexes."""
+    op.drop_index('idx_audit_logs_action_timestamp_id', 'audit_logs')
+    op.drop_index('idx_audit_logs_user_id_timestamp_id', 'audit_logs')
+    op.drop_index('idx_invite_codes_created_at_id', 'invite_codes')
+    op.drop_index('idx_users_created_at_id', 'users')
+    op.drop_index('idx_users_name_trgm', 'users')
+    op.drop_index('idx_users_email_trgm', 'users')
@@ -0,0 +1,221 @@
+"""partition_log_tables_by_month
+
+Revision ID: c93f5a7e1d04
+Revises: b7c41e9d2a58
+Create Date: 2026-10-16 21:30:00.000000
+
+Converts audit_logs, audit_trail and agent_logs to tables range-partitioned
+by month, so retention drops whole partitions instead of running a
+table-wide DELETE, and time-bounded queries only touch the months they need.
+
+- Partitions are named <table>_pYYYYMM and hold one UTC calendar month
+- <table>_default catches rows outside the created months; its rows are
+  moved out when the matching month is created
+- create_monthly_partitions() and drop_monthly_partitions_before() are
+  called by the maintenance task (shared/tasks.py) and the repositories
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c93f5a7e1d04'
+down_revision: Union[str, Sequence[str], None] = 'b7c41e9d2a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of the current one
+MONTHS_AHEAD = 3
+
+LOG_TABLES = {
+    'audit_logs': {
+        'column': 'timestamp',
+        'comment': 'Authentication audit trail',
+        'indexes': [
+            ('ix_audit_logs_action', ['action'], None),
+            ('ix_audit_logs_timestamp', ['timestamp'], None),
+            ('ix_audit_logs_user_id', ['user_id'], None),
+            ('idx_audit_logs_user_id_timestamp_id', ['user_id', 'timestamp', 'id'], None),
+            ('idx_audit_logs_action_timestamp_id', ['action', 'timestamp', 'id'], None),
+        ],
+        'foreign_keys': [
+            ('user_id', 'users', 'SET NULL'),
+        ],
+    },
+    'audit_trail': {
+        'column': 'created_at',
+        'comment': 'Auditoria completa de mudanças no sistema corporativo',
+        'indexes': [
+            ('idx_audit_tabela', ['table_name'], None),
+            ('idx_audit_registro', ['record_id'], None),
+            ('idx_audit_created', ['created_at'], None),
+            ('idx_audit_empresa', ['company_id'], None),
+            ('idx_audit_usuario', ['user_profile_id'], None),
+        ],
+        'foreign_keys': [
+            ('company_id', 'companies', 'CASCADE'),
+            ('user_profile_id', 'user_profiles', 'SET NULL'),
+        ],
+    },
+    'agent_logs': {
+        'column': 'created_at',
+        'comment': 'Log de execução dos agentes de IA',
+        'indexes': [
+            ('idx_logs_agente_tipo', ['agent_type'], None),
+            ('idx_logs_empresa', ['company_id'], None),
+            ('idx_logs_created', ['created_at'], None),
+            ('idx_logs_sucesso', ['success'], 'NOT success'),
+        ],
+        'foreign_keys': [
+            ('company_id', 'companies', 'CASCADE'),
+        ],
+    },
+}
+
+CREATE_MONTHLY_PARTITIONS = r"""
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent text,
+    column_name text,
+    months_ahead integer,
+    from_month date DEFAULT NULL
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    month date := date_trunc('month', COALESCE(from_month, (now() AT TIME ZONE 'UTC')::date))::date;
+    last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead))::date;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    WHILE month <= last_month LOOP
+        partition_name := format('%s_p%s', parent, to_char(month, 'YYYYMM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            -- Build the partition detached, move the month's rows out of the
+            -- default partition into it, then attach it
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                partition_name, parent
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                parent || '_default',
+                column_name, month::timestamp AT TIME ZONE 'UTC',
+                column_name, (month + interval '1 month')::timestamp AT TIME ZONE 'UTC',
+                partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, partition_name,
+                month::timestamp AT TIME ZONE 'UTC',
+                (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            created := created + 1;
+        END IF;
+        month := (month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$;
+"""
+
+DROP_MONTHLY_PARTITIONS_BEFORE = r"""
+CREATE OR REPLACE FUNCTION drop_monthly_partitions_before(
+    parent text,
+    column_name text,
+    cutoff timestamptz
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    partition_name text;
+    dropped integer := 0;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = parent::regclass
+          AND c.relname ~ ('^' || parent || '_p[0-9]{6}$')
+        ORDER BY c.relname
+    LOOP
+        -- Only partitions whose whole month is older than the cutoff
+        IF (to_date(right(partition_name, 6), 'YYYYMM') + interval '1 month')::timestamp
+                AT TIME ZONE 'UTC' <= cutoff THEN
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, partition_name);
+            EXECUTE format('DROP TABLE %I', partition_name);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+
+    EXECUTE format(
+        'DELETE FROM %I WHERE %I < %L', parent || '_default', column_name, cutoff
+    );
+    RETURN dropped;
+END
+$$;
+"""
+
+
+def _create_indexes_and_foreign_keys(table: str, spec: dict) -> None:
+    for name, columns, where in spec['indexes']:
+        op.create_index(
+            name, table, columns,
+            postgresql_where=sa.text(where) if where else None
+        )
+    for column, referred_table, ondelete in spec['foreign_keys']:
+        op.create_foreign_key(
+            f'{table}_{column}_fkey', table, referred_table,
+            [column], ['id'], ondelete=ondelete
+        )
+    op.execute(f"COMMENT ON TABLE {table} IS '{spec['comment']}'")
+
+
+def upgrade() -> None:
+    """Convert the log tables to monthly range partitions."""
+    op.execute(CREATE_MONTHLY_PARTITIONS)
+    op.execute(DROP_MONTHLY_PARTITIONS_BEFORE)
+
+    for table, spec in LOG_TABLES.items():
+        column = spec['column']
+        old_table = f'{table}_unpartitioned'
+
+        op.rename_table(table, old_table)
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS '
+            f'INCLUDING CONSTRAINTS INCLUDING COMMENTS) PARTITION BY RANGE ("{column}")'
+        )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        # Every month with data, through MONTHS_AHEAD months from now
+        op.execute(
+            f"SELECT create_monthly_partitions('{table}', '{column}', {MONTHS_AHEAD}, "
+            f'(SELECT min("{column}") AT TIME ZONE \'UTC\' FROM {old_table})::date)'
+        )
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+        op.drop_table(old_table)
+
+        # The partition key has to be part of the primary key
+        op.create_primary_key(f'{table}_pkey', table, ['id', column])
+        _create_indexes_and_foreign_keys(table, spec)
+
+
+def downgrade() -> None:
+    """Convert the log tables back to plain tables."""
+    for table, spec in LOG_TABLES.items():
+        old_table = f'{table}_partitioned'
+
+        op.rename_table(table, old_table)
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS '
+            f'INCLUDING CONSTRAINTS INCLUDING COMMENTS)'
+        )
+        op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+        op.drop_table(old_table)
+
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+        _create_indexes_and_foreign_keys(table, spec)
+
+    op.execute('DROP FUNCTION IF EXISTS drop_monthly_partitions_before(text, text, timestamptz)')
+    op.execute('DROP FUNCTION IF EXISTS create_monthly_partitions(text, text, integer, date)')
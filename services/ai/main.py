@@ -5,16 +5,30 @@ Handles AI-powered analysis, chat, and intelligent automation.
 
 import os
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import make_asgi_app
 
 from shared.config.settings import settings
+from services.ai.tools.datawarehouse_tools import dispose_db_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    yield
+
+    # Close pooled data warehouse connections
+    dispose_db_engine()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="AI Service",
     description="AI-powered analysis and automation microservice",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -55,6 +69,9 @@ from services.ai.routers import chat
 # Include routers
 app.include_router(chat.router, prefix="/chat", tags=["Chat"])
 
+# Mount Prometheus metrics endpoint
+app.mount("/metrics", make_asgi_app())
+
 
 if __name__ == "__main__":
     port = int(settings.ai_service_port)
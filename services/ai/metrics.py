@@ -0,0 +1,28 @@
+"""
+Prometheus metrics for the AI service.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Data warehouse connection pool metrics
+dw_pool_checkout_duration_seconds = Histogram(
+    "ai_dw_pool_checkout_duration_seconds",
+    "Time spent waiting to check a data warehouse connection out of the pool",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+dw_pool_checkout_failures_total = Counter(
+    "ai_dw_pool_checkout_failures_total",
+    "Data warehouse connection checkouts that failed or timed out"
+)
+
+dw_pool_connections = Gauge(
+    "ai_dw_pool_connections",
+    "Data warehouse connections held by the pool",
+    ["state"]
+)
+
+dw_pool_connects_total = Counter(
+    "ai_dw_pool_connects_total",
+    "New physical connections opened to the data warehouse"
+)
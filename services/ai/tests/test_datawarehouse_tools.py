@@ -0,0 +1,121 @@
+"""Unit tests for the shared data warehouse engine."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from services.ai.tools import datawarehouse_tools
+from services.ai.tools.datawarehouse_tools import (
+    dispose_db_engine,
+    dw_connection,
+    get_db_engine,
+)
+
+
+def sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0
+
+
+@pytest.fixture(autouse=True)
+def reset_engine():
+    """Every test starts and ends without a shared engine."""
+    dispose_db_engine()
+    yield
+    dispose_db_engine()
+
+
+@pytest.fixture
+def sqlite_url(tmp_path, monkeypatch):
+    """Point the DW engine at a file-backed SQLite database."""
+    url = f"sqlite:///{tmp_path / 'dw.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    return url
+
+
+@pytest.fixture
+def created_engines(monkeypatch):
+    """Capture create_engine calls instead of connecting to PostgreSQL."""
+    calls = []
+
+    def fake_create_engine(url, **kwargs):
+        calls.append((url, kwargs))
+        return MagicMock()
+
+    monkeypatch.setattr(datawarehouse_tools, "create_engine", fake_create_engine)
+    monkeypatch.setattr(datawarehouse_tools, "_instrument_pool", lambda engine: None)
+    return calls
+
+
+class TestEngine:
+    """One pooled engine is shared by every DW tool."""
+
+    def test_engine_is_shared(self, sqlite_url):
+        assert get_db_engine() is get_db_engine()
+
+    def test_postgres_pool_and_session_options(self, created_engines, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://user:secret@dw:5432/cortex")
+        monkeypatch.setenv("DW_POOL_SIZE", "7")
+        monkeypatch.setenv("DW_POOL_MAX_OVERFLOW", "3")
+        monkeypatch.setenv("DW_STATEMENT_TIMEOUT_MS", "5000")
+
+        get_db_engine()
+        get_db_engine()
+
+        assert len(created_engines) == 1
+        url, kwargs = created_engines[0]
+        assert url.drivername == "postgresql+psycopg2"
+        assert kwargs["pool_pre_ping"] is True
+        assert kwargs["pool_size"] == 7
+        assert kwargs["max_overflow"] == 3
+        options = kwargs["connect_args"]["options"]
+        assert "-c statement_timeout=5000" in options
+        assert "-c default_transaction_read_only=on" in options
+
+    def test_non_postgres_engine_without_pool_options(self, sqlite_url, created_engines):
+        get_db_engine()
+
+        _, kwargs = created_engines[0]
+        assert kwargs == {"pool_pre_ping": True}
+
+    def test_dispose_resets_engine(self, sqlite_url):
+        engine = get_db_engine()
+
+        dispose_db_engine()
+
+        assert datawarehouse_tools._engine is None
+        assert get_db_engine() is not engine
+
+
+class TestConnectionMetrics:
+    """Checkouts from the shared pool are measured."""
+
+    def test_checkout_recorded(self, sqlite_url):
+        checkouts = sample("ai_dw_pool_checkout_duration_seconds_count")
+        connects = sample("ai_dw_pool_connects_total")
+
+        with dw_connection() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+            assert datawarehouse_tools._pool_connections("in_use") == 1
+        with dw_connection() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert sample("ai_dw_pool_checkout_duration_seconds_count") == checkouts + 2
+        # The second checkout reuses the pooled connection
+        assert sample("ai_dw_pool_connects_total") == connects + 1
+        assert datawarehouse_tools._pool_connections("in_use") == 0
+
+    def test_checkout_failure_recorded(self, monkeypatch):
+        engine = MagicMock()
+        engine.connect.side_effect = TimeoutError("pool exhausted")
+        monkeypatch.setattr(datawarehouse_tools, "get_db_engine", lambda: engine)
+        checkouts = sample("ai_dw_pool_checkout_duration_seconds_count")
+        failures = sample("ai_dw_pool_checkout_failures_total")
+
+        with pytest.raises(TimeoutError):
+            with dw_connection():
+                pass
+
+        assert sample("ai_dw_pool_checkout_failures_total") == failures + 1
+        assert sample("ai_dw_pool_checkout_duration_seconds_count") == checkouts + 1
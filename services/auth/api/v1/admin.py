@@ -15,6 +15,7 @@ from services.auth.dependencies import (
 )
 from services.auth.core.logging import get_logger
 from services.auth.repositories.invite_repository import InviteCodeRepository
+from services.auth.repositories.pagination import split_page
 from services.auth.repositories.user_repository import UserRepository
 
 router = APIRouter()
@@ -49,6 +50,7 @@ class InviteCodeListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class UserListResponse(BaseModel):
@@ -70,6 +72,7 @@ class UsersListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class UpdateUserRoleRequest(BaseModel):
@@ -161,30 +164,35 @@ async def list_invite_codes(
         description="Filter by status: pending, used, expired, revoked"
     ),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor")
 ) -> InviteCodeListResponse:
     """
-    List all invite codes.
+    List all invite codes, newest first.
 
     Requires admin or manager role.
     - **status_filter**: Filter by status (optional)
     - **limit**: Maximum number of results (1-100)
-    - **offset**: Offset for pagination
+    - **offset**: Offset for pagination (ignored with a cursor)
+    - **cursor**: Keyset cursor for the next page (preferred over offset)
     """
 
     invite_repo = InviteCodeRepository(db)
 
     try:
-        # Get invites
-        invites = await invite_repo.list_all(
-            status_filter=status_filter,
-            limit=limit,
-            offset=offset
+        # One extra row tells whether there is a next page
+        invites, next_cursor = split_page(
+            await invite_repo.list_all(
+                status_filter=status_filter,
+                limit=limit + 1,
+                offset=offset,
+                cursor=cursor
+            ),
+            limit
         )
 
         # Get total count for the same filter
-        all_invites = await invite_repo.list_all(status_filter=status_filter)
-        total = len(all_invites)
+        total = await invite_repo.count(status_filter=status_filter)
 
         # Convert to response format
         invite_responses = []
@@ -213,9 +221,15 @@ async def list_invite_codes(
             invites=invite_responses,
             total=total,
             limit=limit,
-            offset=offset
+            offset=offset if cursor is None else 0,
+            next_cursor=next_cursor
         )
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"invite_listing_failed - error={str(e)}")
         raise HTTPException(
@@ -285,37 +299,37 @@ async def list_users(
     role: Optional[str] = Query(None, description="Filter by role"),
     search: Optional[str] = Query(None, description="Search by email or name"),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor")
 ) -> UsersListResponse:
     """
-    List all users.
+    List all users, newest first.
 
     Requires admin or manager role.
     - **role**: Filter by role (optional)
     - **search**: Search by email or name (optional)
     - **limit**: Maximum number of results (1-100)
-    - **offset**: Offset for pagination
+    - **offset**: Offset for pagination (ignored with a cursor)
+    - **cursor**: Keyset cursor for the next page (preferred over offset)
     """
 
     user_repo = UserRepository(db)
 
     try:
-        # Get users (TODO: implement filtering in repository)
-        users = await user_repo.list_all(limit=limit, offset=offset)
-
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            users = [
-                u for u in users
-                if search_lower in u.email.lower() or search_lower in u.name.lower()
-            ]
-
-        # Apply role filter if provided
-        if role:
-            users = [u for u in users if u.role == role]
+        # One extra row tells whether there is a next page
+        users, next_cursor = split_page(
+            await user_repo.list_all(
+                limit=limit + 1,
+                offset=offset,
+                role=role,
+                search=search,
+                cursor=cursor
+            ),
+            limit
+        )
 
-        total = len(users)
+        # Total for the same filters, not just this page
+        total = await user_repo.count(role=role, search=search)
 
         # Convert to response format
         user_responses = [
@@ -335,9 +349,15 @@ async def list_users(
             users=user_responses,
             total=total,
             limit=limit,
-            offset=offset
+            offset=offset if cursor is None else 0,
+            next_cursor=next_cursor
         )
 
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"user_listing_failed - error={str(e)}")
         raise HTTPException(
@@ -22,10 +22,15 @@ from services.auth.schemas.auth import (
     DeleteUserRequest,
     DeleteUserResponse,
 )
-from services.auth.dependencies import DatabaseDependency
+from services.auth.schemas.token import (
+    TokenIntrospectionBatchRequest,
+    TokenIntrospectionBatchResponse,
+)
+from services.auth.dependencies import DatabaseDependency, IntrospectionClientDependency
 from services.auth.core.logging import get_logger
 from services.auth.core.exceptions import (
     AuthenticationError,
+    PasswordHasherBusyError,
     UserExistsError,
     UserNotFoundError,
     InvalidTokenError,
@@ -35,6 +40,7 @@ from services.auth.core.exceptions import (
 )
 from services.auth.services.auth_service import AuthService
 from services.auth.services.jwt_service import JWTService
+from services.auth.services.token_introspection import TokenIntrospectionService
 from services.auth.services.password_reset import PasswordResetService, ResetPasswordError
 from services.auth.config import settings
 
@@ -90,6 +96,13 @@ async def register(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except PasswordHasherBusyError:
+        logger.warning(f"registration_throttled - email={request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service busy. Please try again shortly.",
+            headers={"Retry-After": "1"}
+        )
     except AuthenticationError as e:
         logger.error(f"registration_failed - email={request.email}, error={str(e)}")
         raise HTTPException(
@@ -110,6 +123,7 @@ async def register(
     responses={
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
         403: {"model": ErrorResponse, "description": "Account not verified"},
+        503: {"model": ErrorResponse, "description": "Password hashing capacity exceeded"},
     },
     summary="User login",
     description="Authenticate user and receive JWT tokens"
@@ -132,18 +146,13 @@ async def login(
         # Authenticate user
         auth_result = await auth_service.login(request)
 
-        # Generate new JWT access token (our service tokens)
-        access_token, _ = await jwt_service.create_access_token(
+        # Generate new JWT access and refresh tokens (our service tokens)
+        access_token, refresh_token = await jwt_service.create_token_pair(
             user_id=UUID(auth_result["user"]["id"]),
             email=auth_result["user"]["email"],
             role=auth_result["user"]["role"],
             company_id=None,
-            permissions=[]
-        )
-
-        # Generate refresh token
-        refresh_token = await jwt_service.create_refresh_token(
-            user_id=UUID(auth_result["user"]["id"]),
+            permissions=[],
             device_id=_get_device_id(req)
         )
 
@@ -174,6 +183,13 @@ async def login(
             user=auth_result["user"]
         )
 
+    except PasswordHasherBusyError:
+        logger.warning(f"login_throttled - email={request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service busy. Please try again shortly.",
+            headers={"Retry-After": "1"}
+        )
     except AuthenticationError as e:
         logger.warning(f"failed_login - email={request.email}")
 
@@ -317,6 +333,38 @@ async def logout(
         response.delete_cookie("refresh_token", path="/api/v1/auth")
 
 
+@router.post(
+    "/introspect/batch",
+    response_model=TokenIntrospectionBatchResponse,
+    response_model_exclude_none=True,
+    responses={
+        401: {"model": ErrorResponse, "description": "Missing or invalid client credentials"},
+    },
+    summary="Introspect tokens in batch",
+    description="RFC 7662 token introspection for many tokens in one call (registered clients only)"
+)
+async def introspect_tokens(
+    request: TokenIntrospectionBatchRequest,
+    db: DatabaseDependency,
+    client_id: IntrospectionClientDependency
+) -> TokenIntrospectionBatchResponse:
+    """
+    Batch token introspection.
+
+    Returns one RFC 7662 response per token, in request order. Inactive
+    tokens are reported as ``{"active": false}`` without further detail.
+    The caller must authenticate as a registered client with HTTP Basic
+    credentials (RFC 7662 section 2.1), so the endpoint cannot be used to
+    scan arbitrary tokens for claims.
+    """
+    introspection_service = TokenIntrospectionService(JWTService(db))
+    results = await introspection_service.introspect_batch(
+        request.tokens,
+        request.token_type_hint
+    )
+    return TokenIntrospectionBatchResponse(results=results)
+
+
 @router.post(
     "/verify-email",
     response_model=MessageResponse,
@@ -51,6 +51,14 @@ class Settings(BaseSettings):
     JWT_PUBLIC_KEY_PATH: str = "keys/public.pem"    # Alias for compatibility
     JWT_KEY_PASSWORD: str | None = None  # Optional password for encrypted keys
     JWT_KEY_ROTATION_DAYS: int = 90
+    JWT_KEY_OVERLAP_DAYS: int = 7  # Retired public keys keep verifying tokens this long
+    JWT_KEY_RELOAD_INTERVAL: int = 30  # Seconds between checks of the key files for rotation
+    TOKEN_REVOCATION_CHANNEL: str = "auth:token_revocations"  # Pub/sub channel for revoked JTIs
+    REVOCATION_MIRROR_ENABLED: bool = True  # Answer revocation checks from an in-process mirror
+    REVOCATION_MIRROR_RESYNC_INTERVAL: int = 300  # Seconds between full resyncs of the mirror
+    # Clients allowed to call token introspection, as {"client_id": "client_secret"} JSON;
+    # empty rejects every caller
+    INTROSPECTION_CLIENTS: dict[str, str] = Field(default_factory=dict)
 
     # Token Lifetimes (role-based)
     TOKEN_ACCESS_LIFETIME_ADMIN: int = 1800  # 30 minutes for admin/manager
@@ -71,6 +79,18 @@ class Settings(BaseSettings):
         secrets = get_secrets_manager(self.ENVIRONMENT)
         return secrets.get_public_key()
 
+    # Password Hashing (bcrypt runs on a dedicated worker pool)
+    PASSWORD_HASH_WORKERS: int = 4  # Threads running bcrypt concurrently
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Requests admitted (queued + running) before rejecting
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = 2.0  # Seconds to wait for admission before rejecting
+
+    # Audit Log (events are buffered in memory and written in batches)
+    AUDIT_BATCH_SIZE: int = 500  # Events per multi-row INSERT; a full batch is flushed at once
+    AUDIT_FLUSH_INTERVAL: float = 1.0  # Seconds between flushes of a partial batch
+    AUDIT_MAX_QUEUE_SIZE: int = 10000  # Buffered events before new ones spill to Redis
+    AUDIT_OVERFLOW_KEY: str = "auth:audit_overflow"  # Redis list holding spilled events
+    AUDIT_DEAD_LETTER_KEY: str = "auth:audit_dead_letter"  # Redis list of events the database rejected
+
     # Company Service - REQUIRED: Must be set in .env
     COMPANY_SERVICE_URL: HttpUrl
     COMPANY_SERVICE_TIMEOUT: int = 5
@@ -0,0 +1,321 @@
+"""Buffered audit log writer.
+
+Audit events used to be inserted and committed on the request's session,
+putting a round trip (and the row locks of the transaction) on the critical
+path of login and admin calls. Events are now handed to ``audit_sink``:
+
+- ``emit`` only appends the event to an in-memory queue
+- A background task writes the queue in multi-row INSERTs, as soon as
+  ``AUDIT_BATCH_SIZE`` events are waiting or every ``AUDIT_FLUSH_INTERVAL``
+  seconds otherwise
+- Events that do not fit in the queue (``AUDIT_MAX_QUEUE_SIZE``) or whose
+  batch failed to write are spilled to a Redis list and replayed into the
+  database once writes succeed again (replayed events stay in a Redis
+  processing list until written, and are requeued on ``start`` if the
+  process died mid-replay); if Redis is unavailable as well, the
+  event is written to the service log as a last resort
+- A batch the database rejects for one of its rows (an integrity error,
+  e.g. a ``user_id`` deleted before the flush) is split in halves until
+  the offending event is isolated; that event is moved to a Redis
+  dead-letter list and the rest of the batch is written
+- ``stop`` drains the queue, so shutdown does not lose buffered events
+
+Until ``start`` is called (scripts, tests) events are written immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from services.auth.config import settings
+from services.auth.core.cache import RedisClient, redis_client
+from services.auth.core.metrics import (
+    audit_events_total,
+    audit_flush_duration_seconds,
+    audit_queue_depth,
+)
+from services.auth.database import async_session
+from services.auth.models.audit_log import AuditLog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class AuditEvent:
+    """One audit log entry, timestamped when it happened rather than when written."""
+
+    action: str
+    user_id: Optional[UUID] = None
+    resource: Optional[str] = None
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+    id: UUID = field(default_factory=uuid4)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_row(self) -> dict[str, Any]:
+        """Column values of the ``audit_logs`` row."""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "action": self.action,
+            "resource": self.resource,
+            "user_id": self.user_id,
+            "ip_address": self.ip_address,
+            "user_agent": self.user_agent,
+            "metadata_json": self.metadata,
+        }
+
+    def to_json(self) -> str:
+        """Serialize the event for the Redis overflow list."""
+        return json.dumps({
+            **self.to_row(),
+            "id": str(self.id),
+            "timestamp": self.timestamp.isoformat(),
+            "user_id": str(self.user_id) if self.user_id else None,
+        })
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> AuditEvent:
+        """Deserialize an event written by ``to_json``."""
+        row = json.loads(data)
+        return cls(
+            id=UUID(row["id"]),
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            action=row["action"],
+            resource=row["resource"],
+            user_id=UUID(row["user_id"]) if row["user_id"] else None,
+            ip_address=row["ip_address"],
+            user_agent=row["user_agent"],
+            metadata=row["metadata_json"] or {},
+        )
+
+
+class AuditSink:
+    """
+    Queue of audit events written to the database in batches.
+
+    ``emit`` never waits for the database; it only touches Redis when the
+    queue is full.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_key: Optional[str] = None,
+        dead_letter_key: Optional[str] = None,
+    ):
+        """Initialize sink; call start() to write in the background."""
+        self.redis = redis
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.AUDIT_FLUSH_INTERVAL
+        self.max_queue_size = max_queue_size or settings.AUDIT_MAX_QUEUE_SIZE
+        self.overflow_key = overflow_key or settings.AUDIT_OVERFLOW_KEY
+        self.dead_letter_key = dead_letter_key or settings.AUDIT_DEAD_LETTER_KEY
+        self.processing_key = f"{self.overflow_key}:processing"
+        self._queue: deque[AuditEvent] = deque()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def emit(self, event: AuditEvent) -> None:
+        """
+        Record an audit event.
+
+        Args:
+            event: Event to record
+        """
+        if self._task is None:
+            # No background writer (scripts, tests): write through
+            await self._write_or_spill([event])
+            return
+
+        if len(self._queue) >= self.max_queue_size:
+            await self._spill([event])
+            return
+
+        self._queue.append(event)
+        audit_queue_depth.set(len(self._queue))
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start writing buffered events in the background."""
+        if self._task is None:
+            try:
+                await self._requeue_claimed()
+            except Exception as e:
+                logger.error(f"audit_requeue_failed - error={str(e)}")
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write every buffered event and stop the background writer."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def flush(self) -> None:
+        """Write every buffered event now, one batch at a time."""
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            audit_queue_depth.set(len(self._queue))
+            await self._write_or_spill(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+                await self._replay_overflow()
+            except Exception as e:
+                logger.error(f"audit_writer_failed - {str(e)}")
+
+        # Drain on shutdown
+        await self.flush()
+        logger.info("audit_writer_stopped")
+
+    async def _write(self, batch: list[AuditEvent]) -> None:
+        start = time.perf_counter()
+        async with self.session_factory() as session:
+            # Executed as multi-row INSERTs
+            await session.execute(insert(AuditLog), [event.to_row() for event in batch])
+            await session.commit()
+        audit_flush_duration_seconds.observe(time.perf_counter() - start)
+        audit_events_total.labels(result="written").inc(len(batch))
+
+    async def _write_isolating(self, batch: list[AuditEvent]) -> list[AuditEvent]:
+        """
+        Write a batch, isolating rows the database rejects.
+
+        On an integrity error the batch is split in halves and each half
+        retried, down to the single offending event, which is dead-lettered.
+
+        Returns:
+            Events left unwritten because the write itself failed
+            (database unavailable), in order
+        """
+        try:
+            await self._write(batch)
+            return []
+        except IntegrityError as e:
+            if len(batch) == 1:
+                await self._dead_letter(batch[0], e)
+                return []
+            middle = len(batch) // 2
+            unwritten = await self._write_isolating(batch[:middle])
+            if unwritten:
+                return unwritten + batch[middle:]
+            return await self._write_isolating(batch[middle:])
+        except Exception as e:
+            logger.error(f"audit_flush_failed - events={len(batch)}, error={str(e)}")
+            return batch
+
+    async def _write_or_spill(self, batch: list[AuditEvent]) -> None:
+        unwritten = await self._write_isolating(batch)
+        if unwritten:
+            await self._spill(unwritten)
+
+    async def _dead_letter(self, event: AuditEvent, error: Exception) -> None:
+        """Set aside an event the database will never accept, so the rest keeps flowing."""
+        logger.error(f"audit_event_rejected - event={event.to_json()}, error={str(error)}")
+        try:
+            if not self.redis.redis:
+                raise RuntimeError("Redis not connected")
+            await self.redis.redis.rpush(self.dead_letter_key, event.to_json())
+            audit_events_total.labels(result="dead_lettered").inc()
+        except Exception as e:
+            # Already in the service log above
+            logger.error(f"audit_dead_letter_failed - error={str(e)}")
+            audit_events_total.labels(result="dropped").inc()
+
+    async def _spill(self, batch: list[AuditEvent]) -> None:
+        """Park events in the Redis overflow list until the database takes them."""
+        try:
+            if not self.redis.redis:
+                raise RuntimeError("Redis not connected")
+            await self.redis.redis.rpush(self.overflow_key, *(event.to_json() for event in batch))
+            audit_events_total.labels(result="spilled").inc(len(batch))
+        except Exception as e:
+            logger.error(f"audit_spill_failed - events={len(batch)}, error={str(e)}")
+            # Last resort: keep the events in the service log
+            for event in batch:
+                logger.error(f"audit_event_dropped - {event.to_json()}")
+            audit_events_total.labels(result="dropped").inc(len(batch))
+
+    async def _replay_overflow(self) -> None:
+        """Move spilled events back into the database, a batch at a time."""
+        if not self.redis.redis:
+            return
+
+        # Live events come first; stop once a full batch of them is waiting
+        while len(self._queue) < self.batch_size:
+            # Claimed events sit in the processing list until written, so
+            # a failure at any step leaves them in Redis
+            async with self.redis.redis.pipeline(transaction=True) as pipe:
+                for _ in range(self.batch_size):
+                    pipe.lmove(self.overflow_key, self.processing_key, "LEFT", "RIGHT")
+                raw = [item for item in await pipe.execute() if item is not None]
+            if not raw:
+                return
+
+            unwritten = await self._write_isolating([AuditEvent.from_json(item) for item in raw])
+            # Unwritten events are always the tail of the batch
+            retry = raw[len(raw) - len(unwritten):] if unwritten else []
+            async with self.redis.redis.pipeline(transaction=True) as pipe:
+                for item in raw:
+                    pipe.lrem(self.processing_key, 1, item)
+                if retry:
+                    # Back to the head of the list for the next attempt
+                    pipe.lpush(self.overflow_key, *reversed(retry))
+                await pipe.execute()
+
+            if retry:
+                logger.warning(f"audit_replay_failed - events={len(retry)}")
+                return
+            logger.info(f"audit_overflow_replayed - events={len(raw)}")
+
+    async def _requeue_claimed(self) -> None:
+        """Return events claimed by a replay that never finished (crash) to the overflow list."""
+        if not self.redis.redis:
+            return
+        requeued = 0
+        # Tail first onto the head, so the original order is kept
+        while await self.redis.redis.lmove(self.processing_key, self.overflow_key, "RIGHT", "LEFT"):
+            requeued += 1
+        if requeued:
+            logger.warning(f"audit_claimed_events_requeued - events={requeued}")
+
+
+# Shared by every request in the process
+audit_sink = AuditSink(redis_client, async_session)
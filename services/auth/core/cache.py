@@ -4,17 +4,24 @@ This module provides async Redis operations for:
 - Token deny-list (revocation)
 - Token family tracking
 - Token metadata caching
+- Revocation notifications (pub/sub)
+- Pipelined and scripted batch operations (one round trip each)
 - General application caching
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Sequence
 import json
+import time
 from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio.client import Pipeline
+from redis.commands.core import AsyncScript
 import structlog
 
 from services.auth.config import settings
+from services.auth.core.metrics import redis_operation_duration_seconds
 
 logger = structlog.get_logger(__name__)
 
@@ -26,6 +33,7 @@ class RedisClient:
         """Initialize Redis connection pool."""
         self.pool: Optional[ConnectionPool] = None
         self.redis: Optional[Redis] = None
+        self._scripts: dict[str, AsyncScript] = {}
 
     async def connect(self) -> None:
         """Connect to Redis with connection pooling."""
@@ -36,6 +44,7 @@ class RedisClient:
                 decode_responses=settings.REDIS_DECODE_RESPONSES,
             )
             self.redis = Redis(connection_pool=self.pool)
+            self._scripts.clear()
             # Test connection
             await self.redis.ping()
         except Exception as e:
@@ -77,6 +86,18 @@ class RedisClient:
             raise RuntimeError("Redis not connected")
         return await self.redis.delete(*keys)
 
+    async def mget(self, operation: str, *keys: str) -> list[Optional[str]]:
+        """Get many values in one round trip, recorded under ``operation``."""
+        if not self.redis:
+            raise RuntimeError("Redis not connected")
+        start = time.perf_counter()
+        try:
+            return await self.redis.mget(keys)
+        finally:
+            redis_operation_duration_seconds.labels(operation=operation).observe(
+                time.perf_counter() - start
+            )
+
     async def exists(self, *keys: str) -> int:
         """Check if keys exist."""
         if not self.redis:
@@ -114,6 +135,63 @@ class RedisClient:
             raise RuntimeError("Redis not connected")
         return await self.redis.srem(key, *values)
 
+    # Pub/sub
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a channel."""
+        if not self.redis:
+            raise RuntimeError("Redis not connected")
+        return await self.redis.publish(channel, message)
+
+    # Batch operations
+    @asynccontextmanager
+    async def pipeline(self, operation: str, transaction: bool = True) -> AsyncIterator[Pipeline]:
+        """
+        Buffer commands and send them in a single round trip.
+
+        Commands queued on the yielded pipeline are executed together when the
+        block exits (inside MULTI/EXEC when ``transaction`` is True), and the
+        round trip is recorded under ``operation``. Nothing is sent if the
+        block raises.
+        """
+        if not self.redis:
+            raise RuntimeError("Redis not connected")
+        async with self.redis.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            start = time.perf_counter()
+            try:
+                await pipe.execute()
+            finally:
+                redis_operation_duration_seconds.labels(operation=operation).observe(
+                    time.perf_counter() - start
+                )
+
+    async def run_script(
+        self,
+        operation: str,
+        script: str,
+        keys: Sequence[str] = (),
+        args: Sequence[Any] = (),
+    ) -> Any:
+        """
+        Run a Lua script atomically in a single round trip.
+
+        Scripts are registered once and invoked by SHA (EVALSHA, falling back
+        to EVAL if the server does not have it cached yet).
+        """
+        if not self.redis:
+            raise RuntimeError("Redis not connected")
+        registered = self._scripts.get(script)
+        if registered is None:
+            registered = self._scripts[script] = self.redis.register_script(script)
+
+        start = time.perf_counter()
+        try:
+            return await registered(keys=list(keys), args=list(args))
+        finally:
+            redis_operation_duration_seconds.labels(operation=operation).observe(
+                time.perf_counter() - start
+            )
+
     # JSON helpers
     async def get_json(self, key: str) -> Optional[dict[str, Any]]:
         """Get JSON value by key."""
@@ -75,6 +75,12 @@ class UserNotFoundError(AuthServiceException):
     pass
 
 
+class PasswordHasherBusyError(AuthServiceException):
+    """Raised when the password hashing pool is saturated (back-pressure)."""
+
+    pass
+
+
 # HTTP Exceptions
 class BadRequestError(HTTPException):
     """400 Bad Request error."""
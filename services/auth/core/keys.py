@@ -0,0 +1,244 @@
+"""Process-wide JWT key material.
+
+Parsing the PEM files (and decrypting them with ``JWT_KEY_PASSWORD``) is too
+expensive to repeat for every request, so the keys are loaded once into a
+``KeySet`` that every ``JWTService`` shares:
+
+- The key files are watched (path, mtime, size and inode), checked at most
+  once per ``JWT_KEY_RELOAD_INTERVAL`` seconds and immediately when a token
+  names an unknown ``kid``; a rotation swaps in a new ``KeySet`` atomically
+- Tokens are tagged with the ``kid`` of their signing key, the RFC 7638 JWK
+  thumbprint also used by ``cortex_auth.key_id``
+- Retired public keys keep verifying tokens for ``JWT_KEY_OVERLAP_DAYS``,
+  including those found in the rotation backups after a restart
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import structlog
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from jwt.algorithms import RSAAlgorithm
+
+from services.auth.config import settings
+
+logger = structlog.get_logger(__name__)
+
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def key_id(public_key: RSAPublicKey) -> str:
+    """Compute the ``kid`` of a public key (RFC 7638 thumbprint, SHA-256, base64url)."""
+    jwk_dict = json.loads(RSAAlgorithm.to_jwk(public_key))
+    members = json.dumps(
+        {"e": jwk_dict["e"], "kty": jwk_dict["kty"], "n": jwk_dict["n"]},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(members.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def get_key_backup_dir() -> Path:
+    """Directory the key rotation moves retired key pairs to."""
+    return Path(settings.JWT_PRIVATE_KEY_PATH).parent / "backups"
+
+
+@dataclass(frozen=True)
+class KeySet:
+    """Immutable snapshot of the signing key and the trusted verification keys."""
+
+    kid: str
+    private_key: RSAPrivateKey
+    public_key: RSAPublicKey
+    # kid -> public key, the current key included
+    verification_keys: dict[str, RSAPublicKey] = field(default_factory=dict)
+    # kid -> when a retired key stops being trusted
+    retired_until: dict[str, datetime] = field(default_factory=dict)
+
+
+class SigningKeyStore:
+    """Loads the JWT key pair once and hot-swaps it when the key files change."""
+
+    def __init__(self, reload_interval: Optional[float] = None):
+        self.reload_interval = reload_interval
+        self._key_set: Optional[KeySet] = None
+        self._sources: Optional[tuple] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> KeySet:
+        """
+        Get the current key set.
+
+        Returns:
+            The loaded ``KeySet``, reloaded first if the key files changed
+
+        Raises:
+            Exception: If the keys could not be loaded and none were loaded before
+        """
+        if self._key_set is None or self._config() != self._sources[0]:
+            self._refresh(force=True)
+        elif time.monotonic() >= self._next_check:
+            self._refresh()
+        return self._key_set
+
+    def get_verification_key(self, kid: Optional[str]) -> RSAPublicKey:
+        """
+        Get the public key to verify a token with.
+
+        Args:
+            kid: ``kid`` header of the token, None for tokens issued before kids
+
+        Returns:
+            The key named by ``kid``, or the current public key if there is no
+            ``kid`` or it is unknown (verification then fails on the signature)
+        """
+        key_set = self.current()
+        if kid is None:
+            return key_set.public_key
+
+        key = key_set.verification_keys.get(kid)
+        if key is None:
+            # An unknown kid usually means another process rotated the keys
+            self.reload()
+            key_set = self._key_set
+            key = key_set.verification_keys.get(kid, key_set.public_key)
+        return key
+
+    def reload(self) -> None:
+        """Re-check the key files now instead of waiting for the next interval."""
+        self._refresh(force=True)
+
+    def _config(self) -> tuple:
+        return (
+            settings.JWT_PRIVATE_KEY_PATH,
+            settings.JWT_PUBLIC_KEY_PATH,
+            settings.JWT_KEY_PASSWORD,
+        )
+
+    def _snapshot_sources(self) -> tuple:
+        snapshot = [self._config()]
+        for path in (settings.JWT_PRIVATE_KEY_PATH, settings.JWT_PUBLIC_KEY_PATH):
+            try:
+                stat = os.stat(path)
+                snapshot.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except OSError:
+                snapshot.append(None)
+        return tuple(snapshot)
+
+    def _refresh(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now < self._next_check:
+                # Another thread checked in the meantime
+                return
+            reload_interval = (
+                self.reload_interval
+                if self.reload_interval is not None
+                else settings.JWT_KEY_RELOAD_INTERVAL
+            )
+            self._next_check = now + reload_interval
+
+            sources = self._snapshot_sources()
+            if self._key_set is not None and sources == self._sources:
+                return
+
+            try:
+                key_set = self._load_key_set(self._key_set)
+            except Exception as e:
+                if self._key_set is None:
+                    logger.error(f"jwt_keys_load_failed - {str(e)}")
+                    raise
+                # Keep signing with the previous keys, e.g. while a rotation
+                # is still writing the new files
+                logger.warning(f"jwt_keys_reload_failed - keeping previous keys: {str(e)}")
+                self._next_check = now + min(reload_interval, 1.0)
+                return
+
+            self._key_set = key_set
+            self._sources = sources
+            logger.info(
+                f"jwt_keys_loaded - kid={key_set.kid}, "
+                f"verification_kids={list(key_set.verification_keys)}"
+            )
+
+    def _load_key_set(self, previous: Optional[KeySet]) -> KeySet:
+        with open(settings.JWT_PRIVATE_KEY_PATH, "rb") as f:
+            private_key = serialization.load_pem_private_key(
+                f.read(),
+                password=settings.JWT_KEY_PASSWORD.encode() if settings.JWT_KEY_PASSWORD else None,
+                backend=default_backend()
+            )
+        with open(settings.JWT_PUBLIC_KEY_PATH, "rb") as f:
+            public_key = serialization.load_pem_public_key(f.read(), backend=default_backend())
+
+        kid = key_id(public_key)
+        if kid != key_id(private_key.public_key()):
+            raise ValueError("Private and public key files do not belong to the same key pair")
+
+        now = datetime.now(timezone.utc)
+        overlap = timedelta(days=settings.JWT_KEY_OVERLAP_DAYS)
+        verification_keys = {kid: public_key}
+        retired_until: dict[str, datetime] = {}
+
+        # Keys retired by earlier rotations, e.g. before this process started
+        for retired_at, retired_key in self._load_backup_keys():
+            retired_kid = key_id(retired_key)
+            if retired_kid != kid and retired_at + overlap > now:
+                verification_keys.setdefault(retired_kid, retired_key)
+                retired_until[retired_kid] = retired_at + overlap
+
+        # Keys this process was using until now
+        if previous is not None:
+            for previous_kid, previous_key in previous.verification_keys.items():
+                if previous_kid == kid:
+                    continue
+                until = previous.retired_until.get(previous_kid, now + overlap)
+                if until > now:
+                    verification_keys.setdefault(previous_kid, previous_key)
+                    retired_until[previous_kid] = until
+
+        return KeySet(
+            kid=kid,
+            private_key=private_key,
+            public_key=public_key,
+            verification_keys=verification_keys,
+            retired_until=retired_until,
+        )
+
+    def _load_backup_keys(self) -> list[tuple[datetime, RSAPublicKey]]:
+        backup_dir = get_key_backup_dir()
+        if not backup_dir.is_dir():
+            return []
+
+        backups = []
+        for path in backup_dir.glob("*/public_key.pem"):
+            try:
+                retired_at = datetime.strptime(
+                    path.parent.name, BACKUP_TIMESTAMP_FORMAT
+                ).replace(tzinfo=timezone.utc)
+                public_key = serialization.load_pem_public_key(
+                    path.read_bytes(), backend=default_backend()
+                )
+            except Exception as e:
+                logger.warning(f"jwt_backup_key_skipped - {path}: {str(e)}")
+                continue
+            backups.append((retired_at, public_key))
+        return backups
+
+
+# Shared by every JWTService in the process
+signing_key_store = SigningKeyStore()
@@ -0,0 +1,78 @@
+"""Prometheus metrics for the auth service."""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Redis round trips are usually sub-millisecond, below the default buckets
+REDIS_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+redis_operation_duration_seconds = Histogram(
+    "auth_redis_operation_duration_seconds",
+    "Time spent on each batched Redis operation (one round trip each)",
+    ["operation"],
+    buckets=REDIS_LATENCY_BUCKETS,
+)
+
+password_hash_queue_depth = Gauge(
+    "auth_password_hash_queue_depth",
+    "Password hashing jobs waiting for a free worker"
+)
+
+password_hash_in_progress = Gauge(
+    "auth_password_hash_in_progress",
+    "Password hashing jobs currently running on a worker"
+)
+
+password_hash_duration_seconds = Histogram(
+    "auth_password_hash_duration_seconds",
+    "Time spent on password hashing jobs, including time queued",
+    ["operation"]
+)
+
+password_hash_rejected_total = Counter(
+    "auth_password_hash_rejected_total",
+    "Password hashing requests rejected because the worker pool was saturated",
+    ["operation"]
+)
+
+revocation_mirror_entries = Gauge(
+    "auth_revocation_mirror_entries",
+    "Revoked JTIs held in the in-process revocation mirror"
+)
+
+revocation_mirror_synced = Gauge(
+    "auth_revocation_mirror_synced",
+    "1 while the revocation mirror is subscribed and resynced, 0 otherwise"
+)
+
+revocation_mirror_staleness_seconds = Gauge(
+    "auth_revocation_mirror_staleness_seconds",
+    "Seconds since the revocation mirror was last known to be in sync with Redis"
+)
+
+revocation_mirror_resyncs_total = Counter(
+    "auth_revocation_mirror_resyncs_total",
+    "Full resyncs of the revocation mirror from Redis",
+    ["reason"]
+)
+
+revocation_mirror_lookups_total = Counter(
+    "auth_revocation_mirror_lookups_total",
+    "Revocation checks by where they were answered",
+    ["source"]
+)
+
+audit_queue_depth = Gauge(
+    "auth_audit_queue_depth",
+    "Audit events buffered in memory, waiting to be written"
+)
+
+audit_flush_duration_seconds = Histogram(
+    "auth_audit_flush_duration_seconds",
+    "Time spent writing one batch of audit events"
+)
+
+audit_events_total = Counter(
+    "auth_audit_events_total",
+    "Audit events by what happened to them",
+    ["result"]
+)
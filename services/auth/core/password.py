@@ -1,7 +1,29 @@
-"""Password hashing and verification using bcrypt."""
+"""Password hashing and verification using bcrypt.
+
+The synchronous functions block for the full bcrypt cost (~250ms at cost
+12). Async code should use ``password_hasher``, which runs them on a
+dedicated, size-capped worker pool.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
 
 import bcrypt
 
+from services.auth.config import settings
+from services.auth.core.exceptions import PasswordHasherBusyError
+from services.auth.core.metrics import (
+    password_hash_duration_seconds,
+    password_hash_in_progress,
+    password_hash_queue_depth,
+    password_hash_rejected_total,
+)
+
+# bcrypt cost factor for new hashes; older hashes are upgraded on login
+BCRYPT_ROUNDS = 12
+
 
 def hash_password(password: str) -> str:
     """
@@ -21,7 +43,7 @@ def hash_password(password: str) -> str:
     password_bytes = password.encode('utf-8')
 
     # Generate salt and hash with cost factor 12
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     # Return as string for database storage
@@ -70,7 +92,131 @@ def needs_rehash(hashed_password: str) -> bool:
         parts = hashed_password.split('$')
         if len(parts) >= 3:
             current_cost = int(parts[2])
-            return current_cost < 12
+            return current_cost < BCRYPT_ROUNDS
         return False
     except Exception:
         return False
+
+
+def verify_and_rehash_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash is outdated, compute a replacement.
+
+    Args:
+        plain_password: Plain text password from user input
+        hashed_password: Hashed password from database
+
+    Returns:
+        Tuple of (is_valid, new_hash). ``new_hash`` is set only when the
+        password is valid and ``needs_rehash`` reports the stored hash as weak.
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
+
+
+class PasswordHasher:
+    """
+    Async password hashing facade backed by a dedicated thread pool.
+
+    bcrypt releases the GIL while hashing, so running it on worker threads
+    keeps the event loop responsive (e.g. for token refresh) during login
+    bursts. At most ``max_pending`` jobs are admitted (queued or running);
+    further callers wait up to ``queue_timeout`` seconds for a slot and are
+    then rejected with PasswordHasherBusyError.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float):
+        """Initialize hasher; the worker pool is created on first use."""
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the worker pool."""
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the worker pool."""
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def verify_and_rehash(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and compute an upgraded hash if needed, as one pool job."""
+        return await self._run(
+            "verify", verify_and_rehash_password, plain_password, hashed_password
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool. A new pool is created if the hasher is used again."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # asyncio primitives are bound to the loop they are first used on
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _run(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        slots = self._get_slots()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            password_hash_rejected_total.labels(operation=operation).inc()
+            raise PasswordHasherBusyError("Password hashing capacity exceeded, retry later")
+
+        try:
+            password_hash_queue_depth.inc()
+            job = self._get_executor().submit(self._work, fn, *args)
+            try:
+                return await asyncio.wrap_future(job)
+            finally:
+                if job.cancel():
+                    # Cancelled before a worker picked it up
+                    password_hash_queue_depth.dec()
+        finally:
+            slots.release()
+            password_hash_duration_seconds.labels(operation=operation).observe(
+                time.perf_counter() - start
+            )
+
+    @staticmethod
+    def _work(fn: Callable[..., Any], *args: Any) -> Any:
+        password_hash_queue_depth.dec()
+        password_hash_in_progress.inc()
+        try:
+            return fn(*args)
+        finally:
+            password_hash_in_progress.dec()
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+)
@@ -0,0 +1,175 @@
+"""In-process mirror of the Redis token deny-list.
+
+Access-token verification checks whether the token's JTI is revoked. This
+module keeps a local copy of the deny-list (``revoked:{jti}`` keys) so the
+check is a memory lookup instead of an ``EXISTS`` round trip:
+
+- Revocations are received through the Redis pub/sub channel on which
+  ``JWTService`` publishes every revoked JTI
+- On every (re)connect, and periodically, the mirror is rebuilt from a full
+  ``SCAN`` of the deny-list, so messages missed while disconnected are
+  recovered
+- While the mirror is not in sync, callers fall back to Redis
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+import structlog
+
+from services.auth.core.cache import RedisClient
+from services.auth.core.metrics import (
+    revocation_mirror_entries,
+    revocation_mirror_lookups_total,
+    revocation_mirror_resyncs_total,
+    revocation_mirror_staleness_seconds,
+    revocation_mirror_synced,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class RevocationMirror:
+    """
+    Local set of revoked JTIs, kept in sync with Redis.
+
+    Entries expire together with their deny-list key. ``synced`` is True only
+    while the pub/sub subscription is live and a full resync has completed;
+    until then ``is_revoked`` must not be trusted and callers check Redis.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClient,
+        channel: str,
+        key_prefix: str,
+        entry_ttl: int,
+        resync_interval: float = 300.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """Initialize mirror; call start() to begin syncing."""
+        self.redis = redis
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self.entry_ttl = entry_ttl
+        self.resync_interval = resync_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.synced = False
+        self._expiry_by_jti: dict[str, float] = {}
+        self._last_in_sync = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._expiry_by_jti)
+
+    def staleness(self) -> float:
+        """Seconds since the mirror was last known to be in sync with Redis."""
+        return max(0.0, time.monotonic() - self._last_in_sync)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Check the local deny-list. Only meaningful while ``synced``."""
+        expires_at = self._expiry_by_jti.get(jti)
+        if expires_at is None:
+            revocation_mirror_lookups_total.labels(source="mirror_miss").inc()
+            return False
+        if expires_at <= time.time():
+            # Deny-list key has expired in Redis as well
+            self._expiry_by_jti.pop(jti, None)
+            revocation_mirror_entries.set(len(self._expiry_by_jti))
+            revocation_mirror_lookups_total.labels(source="mirror_miss").inc()
+            return False
+        revocation_mirror_lookups_total.labels(source="mirror_hit").inc()
+        return True
+
+    def add(self, jti: str, ttl: Optional[float] = None) -> None:
+        """Record a revoked JTI (from a notification or a local revocation)."""
+        self._expiry_by_jti[jti] = time.time() + (ttl if ttl is not None else self.entry_ttl)
+        revocation_mirror_entries.set(len(self._expiry_by_jti))
+
+    async def start(self) -> None:
+        """Start syncing in the background."""
+        if self._task is None:
+            revocation_mirror_staleness_seconds.set_function(self.staleness)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop syncing and wait for the background task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._set_synced(False)
+
+    async def resync(self, reason: str) -> None:
+        """Rebuild the mirror from a full scan of the deny-list keys."""
+        if not self.redis.redis:
+            raise RuntimeError("Redis not connected")
+
+        keys = [key async for key in self.redis.redis.scan_iter(match=f"{self.key_prefix}*", count=1000)]
+        ttls: list[int] = []
+        if keys:
+            async with self.redis.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+
+        now = time.time()
+        expiry_by_jti = {}
+        for key, ttl in zip(keys, ttls):
+            if ttl == -2:
+                continue  # Expired between SCAN and TTL
+            key = key.decode() if isinstance(key, bytes) else key
+            expiry_by_jti[key[len(self.key_prefix):]] = now + (ttl if ttl > 0 else self.entry_ttl)
+
+        self._expiry_by_jti = expiry_by_jti
+        self._last_in_sync = time.monotonic()
+        revocation_mirror_entries.set(len(expiry_by_jti))
+        revocation_mirror_resyncs_total.labels(reason=reason).inc()
+        logger.info(f"revocation_mirror_resynced - reason={reason}, entries={len(expiry_by_jti)}")
+
+    def _set_synced(self, synced: bool) -> None:
+        self.synced = synced
+        revocation_mirror_synced.set(1 if synced else 0)
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        reason = "startup"
+        while True:
+            try:
+                if not self.redis.redis:
+                    raise RuntimeError("Redis not connected")
+                async with self.redis.redis.pubsub() as pubsub:
+                    # Subscribe before scanning so no revocation falls in between
+                    await pubsub.subscribe(self.channel)
+                    await self.resync(reason)
+                    self._set_synced(True)
+                    delay = self.reconnect_delay
+                    next_resync = time.monotonic() + self.resync_interval
+
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is not None and message.get("type") == "message":
+                            data = message["data"]
+                            self.add(data.decode() if isinstance(data, bytes) else str(data))
+                        self._last_in_sync = time.monotonic()
+
+                        if time.monotonic() >= next_resync:
+                            await self.resync("periodic")
+                            next_resync = time.monotonic() + self.resync_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._set_synced(False)
+                reason = "reconnect"
+                logger.warning(f"revocation_mirror_disconnected - {str(e)}, retry_in={delay}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
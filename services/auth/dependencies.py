@@ -1,5 +1,8 @@
 """Common dependencies for FastAPI routes."""
 
+import binascii
+import hmac
+from base64 import b64decode
 from typing import Annotated
 from uuid import UUID
 from fastapi import Depends, Header
@@ -139,6 +142,48 @@ async def require_admin_or_manager(current_user=Depends(get_current_user)):
     return current_user
 
 
+async def require_introspection_client(
+    authorization: Annotated[str | None, Header()] = None
+) -> str:
+    """
+    Authenticate a token introspection caller as a client (RFC 7662 section 2.1).
+
+    Services such as the gateway and background workers present HTTP Basic
+    credentials registered in ``INTROSPECTION_CLIENTS``.
+
+    Args:
+        authorization: ``Basic base64(client_id:client_secret)`` header
+
+    Returns:
+        Client ID of the caller
+
+    Raises:
+        UnauthorizedError: If the credentials are missing or invalid
+    """
+    challenge = {"WWW-Authenticate": "Basic"}
+    if not authorization:
+        raise UnauthorizedError("Missing client credentials", headers=challenge)
+
+    scheme, _, encoded = authorization.partition(" ")
+    try:
+        if scheme.lower() != "basic":
+            raise ValueError
+        client_id, _, client_secret = b64decode(encoded, validate=True).decode().partition(":")
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise UnauthorizedError("Invalid client credentials", headers=challenge)
+
+    expected = settings.INTROSPECTION_CLIENTS.get(client_id)
+    # Compared even for unknown clients, so timing does not reveal client IDs
+    valid = hmac.compare_digest(client_secret.encode(), (expected or "").encode())
+    if expected is None or not valid:
+        raise UnauthorizedError("Invalid client credentials", headers=challenge)
+
+    return client_id
+
+
+IntrospectionClientDependency = Annotated[str, Depends(require_introspection_client)]
+
+
 AdminDependency = Annotated[object, Depends(require_admin)]
 AdminOrManagerDependency = Annotated[object, Depends(require_admin_or_manager)]
 
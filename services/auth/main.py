@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
 from redis.asyncio import Redis
 from sqlalchemy import text
 import httpx
@@ -15,7 +16,10 @@ from services.auth.database import engine
 from services.auth.schemas.auth import HealthResponse, ReadinessResponse
 from services.auth.core.logging import configure_logging, get_logger
 from services.auth.api.v1 import auth, users, admin
+from services.auth.core.audit import audit_sink
 from services.auth.core.cache import redis_client
+from services.auth.core.password import password_hasher
+from services.auth.services.jwt_service import revocation_mirror
 
 # Configure logging
 configure_logging()
@@ -35,17 +39,35 @@ async def lifespan(app: FastAPI):
         logger.error(f"redis_connection_failed - {str(e)}")
         raise
 
+    # Mirror the token deny-list in-process
+    if settings.REVOCATION_MIRROR_ENABLED:
+        await revocation_mirror.start()
+
+    # Write audit events in batches in the background
+    await audit_sink.start()
+
     yield
 
     # Shutdown
     logger.info("auth_service_stopping")
 
+    await revocation_mirror.stop()
+
+    # Drain buffered audit events (may spill to Redis, so before disconnecting)
+    try:
+        await audit_sink.stop()
+    except Exception as e:
+        logger.error(f"audit_drain_failed - {str(e)}")
+
     # Disconnect Redis
     try:
         await redis_client.disconnect()
     except Exception as e:
         logger.error(f"redis_disconnect_failed - {str(e)}")
 
+    # Stop password hashing workers
+    password_hasher.shutdown()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -166,6 +188,9 @@ app.include_router(
     tags=["admin"]
 )
 
+# Mount Prometheus metrics endpoint
+app.mount("/metrics", make_asgi_app())
+
 
 @app.get("/")
 async def root():
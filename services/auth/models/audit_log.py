@@ -11,6 +11,8 @@ class AuditLog(Base):
     """Audit log model for tracking authentication and authorization events."""
 
     __tablename__ = "audit_logs"
+    # Range-partitioned by month on timestamp in PostgreSQL (primary key
+    # (id, timestamp)); filter on timestamp so queries prune partitions
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
 
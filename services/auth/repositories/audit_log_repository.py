@@ -3,8 +3,9 @@
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, func
 from services.auth.models.audit_log import AuditLog
+from services.auth.repositories.pagination import apply_keyset
 from typing import Any
 
 
@@ -75,20 +76,25 @@ class AuditLogRepository:
         limit: int = 100,
         action: str | None = None,
         start_date: datetime | None = None,
-        end_date: datetime | None = None
+        end_date: datetime | None = None,
+        cursor: str | None = None
     ) -> list[AuditLog]:
-        """Get audit logs for a specific user.
+        """Get audit logs for a specific user, newest first.
 
         Args:
             user_id: User UUID
-            skip: Number of records to skip
+            skip: Number of records to skip, ignored with a cursor (prefer ``cursor`` for deep pages)
             limit: Maximum number of records to return
             action: Optional action filter
             start_date: Optional start date filter
             end_date: Optional end date filter
+            cursor: Keyset cursor of the last log of the previous page
 
         Returns:
             List of audit logs
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         query = select(AuditLog).where(AuditLog.user_id == user_id)
 
@@ -101,7 +107,8 @@ class AuditLogRepository:
         if end_date is not None:
             query = query.where(AuditLog.timestamp <= end_date)
 
-        query = query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit)
+        query = apply_keyset(query, AuditLog.timestamp, AuditLog.id, cursor, skip)
+        query = query.limit(limit)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -141,19 +148,24 @@ class AuditLogRepository:
         skip: int = 0,
         limit: int = 100,
         start_date: datetime | None = None,
-        end_date: datetime | None = None
+        end_date: datetime | None = None,
+        cursor: str | None = None
     ) -> list[AuditLog]:
-        """Get audit logs filtered by action type.
+        """Get audit logs filtered by action type, newest first.
 
         Args:
             action: Action to filter by (e.g., 'login', 'failed_login')
-            skip: Number of records to skip
+            skip: Number of records to skip, ignored with a cursor (prefer ``cursor`` for deep pages)
             limit: Maximum number of records to return
             start_date: Optional start date filter
             end_date: Optional end date filter
+            cursor: Keyset cursor of the last log of the previous page
 
         Returns:
             List of audit logs
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         query = select(AuditLog).where(AuditLog.action == action)
 
@@ -163,7 +175,8 @@ class AuditLogRepository:
         if end_date is not None:
             query = query.where(AuditLog.timestamp <= end_date)
 
-        query = query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit)
+        query = apply_keyset(query, AuditLog.timestamp, AuditLog.id, cursor, skip)
+        query = query.limit(limit)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -276,11 +289,14 @@ class AuditLogRepository:
         Returns:
             Count of failed login attempts
         """
-        since = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        now = datetime.now(timezone.utc)
+        since = now - timedelta(minutes=minutes)
 
+        # Bounded on both sides so only the current month's partition is scanned
         query = select(func.count(AuditLog.id)).where(
             AuditLog.action == 'failed_login',
-            AuditLog.timestamp >= since
+            AuditLog.timestamp >= since,
+            AuditLog.timestamp <= now
         )
 
         if user_id is not None:
@@ -292,26 +308,6 @@ class AuditLogRepository:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
-    async def cleanup_old_logs(self, older_than_days: int = 90) -> int:
-        """Delete audit logs older than specified days.
-
-        This should be run periodically as a maintenance task.
-
-        Args:
-            older_than_days: Delete logs older than this many days (default: 90)
-
-        Returns:
-            Number of logs deleted
-        """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
-
-        result = await self.session.execute(
-            delete(AuditLog).where(AuditLog.timestamp < cutoff_date)
-        )
-        await self.session.flush()
-
-        return result.rowcount
-
     async def get_action_statistics(
         self,
         start_date: datetime | None = None,
@@ -319,6 +315,9 @@ class AuditLogRepository:
     ) -> dict[str, int]:
         """Get statistics on audit log actions.
 
+        Pass a date range where possible: only the monthly partitions it
+        overlaps are scanned.
+
         Args:
             start_date: Optional start date filter
             end_date: Optional end date filter
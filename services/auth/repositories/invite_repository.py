@@ -8,6 +8,7 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.models.invite import InviteCode
+from services.auth.repositories.pagination import apply_keyset
 from services.auth.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -181,45 +182,66 @@ class InviteCodeRepository:
         self,
         status_filter: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> list[InviteCode]:
-        """List all invite codes with optional filtering.
+        """List all invite codes, newest first, with optional filtering.
 
         Args:
             status_filter: Filter by status ("pending", "used", "expired", "revoked")
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination, ignored with a cursor (prefer ``cursor`` for deep pages)
+            cursor: Keyset cursor of the last invite of the previous page
 
         Returns:
             list[InviteCode]: List of invite codes
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        stmt = (
-            select(InviteCode)
-            .order_by(InviteCode.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+        stmt = select(InviteCode).where(*self._status_conditions(status_filter))
+        stmt = apply_keyset(stmt, InviteCode.created_at, InviteCode.id, cursor, offset)
+        stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count(self, status_filter: Optional[str] = None) -> int:
+        """Count invite codes with optional filtering.
+
+        Args:
+            status_filter: Filter by status ("pending", "used", "expired", "revoked")
+
+        Returns:
+            int: Count of invite codes matching the filter
+        """
+        stmt = select(func.count()).select_from(InviteCode).where(
+            *self._status_conditions(status_filter)
         )
+        result = await self.session.execute(stmt)
+        return result.scalar() or 0
 
+    @staticmethod
+    def _status_conditions(status_filter: Optional[str]) -> list:
+        """Build the WHERE conditions of a status filter."""
         now = datetime.now(timezone.utc)
 
         if status_filter == "pending":
-            stmt = stmt.where(
+            return [
                 InviteCode.used_at.is_(None),
                 InviteCode.revoked_at.is_(None),
                 InviteCode.expires_at > now
-            )
-        elif status_filter == "used":
-            stmt = stmt.where(InviteCode.used_at.isnot(None))
-        elif status_filter == "expired":
-            stmt = stmt.where(
+            ]
+        if status_filter == "used":
+            return [InviteCode.used_at.isnot(None)]
+        if status_filter == "expired":
+            return [
                 InviteCode.used_at.is_(None),
                 InviteCode.expires_at <= now
-            )
-        elif status_filter == "revoked":
-            stmt = stmt.where(InviteCode.revoked_at.isnot(None))
-
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+            ]
+        if status_filter == "revoked":
+            return [InviteCode.revoked_at.isnot(None)]
+        return []
 
     async def count_by_creator(self, creator_id: UUID) -> int:
         """Count invite codes created by a specific user.
@@ -0,0 +1,110 @@
+"""Keyset (cursor) pagination helpers for repositories.
+
+Listings are ordered newest first on ``(sort column, id)``. Instead of an
+OFFSET, which makes the database walk every skipped row, the next page
+starts strictly after the last row of the previous one. The position is
+handed to clients as an opaque cursor.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode the position of a row as an opaque cursor.
+
+    Args:
+        sort_value: Value of the row's sort column
+        row_id: Primary key of the row
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor created by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (sort value, row id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def apply_keyset(
+    stmt: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str] = None,
+    offset: int = 0
+) -> Select:
+    """Order a query newest first and start it after the cursor position.
+
+    Args:
+        stmt: Select statement to paginate
+        sort_column: Column the listing is ordered by (e.g. ``created_at``)
+        id_column: Primary key column, breaks ties between equal sort values
+        cursor: Cursor of the last row of the previous page, None for the first page
+        offset: Rows to skip; ignored with a cursor, which already marks the position
+
+    Returns:
+        Ordered (and filtered) select statement
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor)
+        # Row comparison, served by an index on (sort_column, id)
+        stmt = stmt.where(
+            tuple_(sort_column, id_column)
+            < tuple_(sort_value, row_id, types=[sort_column.type, id_column.type])
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    return stmt.order_by(sort_column.desc(), id_column.desc())
+
+
+def split_page(
+    rows: Sequence[T],
+    limit: int,
+    sort_attribute: str = "created_at"
+) -> tuple[list[T], Optional[str]]:
+    """Trim rows fetched with ``limit + 1`` to a page and build the next cursor.
+
+    Args:
+        rows: Rows returned by a query limited to ``limit + 1``
+        limit: Page size
+        sort_attribute: Name of the sort attribute on the rows
+
+    Returns:
+        Tuple of (page rows, cursor of the next page or None on the last page)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+
+    last: Any = page[-1]
+    return page, encode_cursor(getattr(last, sort_attribute), last.id)
@@ -311,7 +311,7 @@ class RefreshTokenRepository:
         """
         result = await self.session.execute(
             select(func.count(RefreshToken.id)).where(
-                RefreshToken.id == jti,
+                RefreshToken.id == UUID(jti),
                 RefreshToken.revoked == True
             )
         )
@@ -329,7 +329,7 @@ class RefreshTokenRepository:
         """
         result = await self.session.execute(
             update(RefreshToken)
-            .where(RefreshToken.id == jti)
+            .where(RefreshToken.id == UUID(jti))
             .values(revoked=True)
         )
         await self.session.flush()
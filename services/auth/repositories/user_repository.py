@@ -3,12 +3,34 @@
 from datetime import datetime, timezone
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, or_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.elements import ColumnElement
 from services.auth.models.user import User
+from services.auth.repositories.pagination import apply_keyset
 from services.auth.schemas.user import UserCreate, UserUpdate
 
 
+def search_condition(search: str) -> ColumnElement[bool]:
+    """Build a case-insensitive substring match on email or name.
+
+    Served on PostgreSQL by the pg_trgm GIN indexes on ``users.email`` and
+    ``users.name``.
+
+    Args:
+        search: Search term; LIKE wildcards in it are matched literally
+
+    Returns:
+        SQL condition
+    """
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return or_(
+        User.email.ilike(pattern, escape="\\"),
+        User.name.ilike(pattern, escape="\\")
+    )
+
+
 class UserRepository:
     """Repository for user data access operations."""
 
@@ -122,13 +144,15 @@ class UserRepository:
     async def count(
         self,
         role: str | None = None,
-        email_verified: bool | None = None
+        email_verified: bool | None = None,
+        search: str | None = None
     ) -> int:
         """Count users with optional filters.
 
         Args:
             role: Optional role filter
             email_verified: Optional email verification status filter
+            search: Optional substring of email or name
 
         Returns:
             Count of users matching filters
@@ -138,6 +162,9 @@ class UserRepository:
         if role is not None:
             query = query.where(User.role == role)
 
+        if search:
+            query = query.where(search_condition(search))
+
         if email_verified is not None:
             query = query.where(User.email_verified == email_verified)
 
@@ -293,23 +320,40 @@ class UserRepository:
         self,
         limit: int = 100,
         offset: int = 0,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        role: str | None = None,
+        search: str | None = None,
+        cursor: str | None = None
     ) -> list[User]:
-        """List all users with pagination.
+        """List all users, newest first, with filtering and pagination.
 
         Args:
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination, ignored with a cursor (prefer ``cursor`` for deep pages)
             include_deleted: Include soft-deleted users
+            role: Optional role filter
+            search: Optional substring of email or name
+            cursor: Keyset cursor of the last user of the previous page
 
         Returns:
             List of user instances
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        stmt = select(User).order_by(User.created_at.desc()).limit(limit).offset(offset)
+        stmt = select(User)
 
         if not include_deleted:
             stmt = stmt.where(User.deleted_at.is_(None))
 
+        if role is not None:
+            stmt = stmt.where(User.role == role)
+
+        if search:
+            stmt = stmt.where(search_condition(search))
+
+        stmt = apply_keyset(stmt, User.created_at, User.id, cursor, offset).limit(limit)
+
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
@@ -2,8 +2,11 @@
 
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Literal, Optional
+
+# Upper bound on tokens per batch introspection request
+MAX_INTROSPECTION_BATCH_SIZE = 100
 
 
 class RefreshTokenData(BaseModel):
@@ -33,4 +36,25 @@ class JWKSKey(BaseModel):
 class JWKSResponse(BaseModel):
     """JWKS endpoint response schema."""
 
-    keys: list[JWKSKey]
\ No newline at end of file
+    keys: list[JWKSKey]
+
+
+class TokenIntrospectionBatchRequest(BaseModel):
+    """Batch token introspection request schema."""
+
+    tokens: list[str] = Field(min_length=1, max_length=MAX_INTROSPECTION_BATCH_SIZE)
+    token_type_hint: Optional[Literal["access", "refresh"]] = None
+
+
+class TokenIntrospectionResult(BaseModel):
+    """RFC 7662 introspection response for a single token."""
+
+    model_config = ConfigDict(extra="allow")
+
+    active: bool
+
+
+class TokenIntrospectionBatchResponse(BaseModel):
+    """Batch token introspection response schema, in request order."""
+
+    results: list[TokenIntrospectionResult]
@@ -6,7 +6,7 @@ from uuid import UUID
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.auth.models.audit_log import AuditLog
+from services.auth.core.audit import AuditEvent, audit_sink
 from services.auth.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,9 +30,11 @@ class AuditService:
         result: str,
         request: Optional[Request] = None,
         event_details: Optional[dict] = None
-    ) -> AuditLog:
+    ) -> AuditEvent:
         """Log an admin action to the audit log.
 
+        The entry is buffered and written in the background (see ``core.audit``).
+
         Args:
             event_type: Type of event (e.g., "invite_created", "role_updated")
             user_id: UUID of the user performing the action
@@ -41,7 +43,7 @@ class AuditService:
             event_details: Additional event-specific details
 
         Returns:
-            AuditLog: Created audit log entry
+            AuditEvent: Recorded audit event
         """
         # Extract request metadata
         ip_address = None
@@ -52,26 +54,25 @@ class AuditService:
             user_agent = request.headers.get("user-agent")
 
         # Create audit log entry
-        audit_log = AuditLog(
+        audit_event = AuditEvent(
             timestamp=datetime.now(timezone.utc),
-            event_type=event_type,
-            result=result,
+            action=event_type,
             user_id=user_id,
             ip_address=ip_address,
             user_agent=user_agent,
-            service_name="auth-service",
-            event_details=event_details or {}
+            metadata={
+                "result": result,
+                "service_name": "auth-service",
+                **(event_details or {})
+            }
         )
-
-        self.session.add(audit_log)
-        await self.session.commit()
-        await self.session.refresh(audit_log)
+        await audit_sink.emit(audit_event)
 
         logger.info(
             f"audit_logged - event_type={event_type}, user_id={user_id}, result={result}"
         )
 
-        return audit_log
+        return audit_event
 
     async def log_invite_created(
         self,
@@ -79,7 +80,7 @@ class AuditService:
         invite_code: str,
         expires_in_days: int,
         request: Optional[Request] = None
-    ) -> AuditLog:
+    ) -> AuditEvent:
         """Log invite code creation.
 
         Args:
@@ -89,7 +90,7 @@ class AuditService:
             request: FastAPI request object
 
         Returns:
-            AuditLog: Created audit log entry
+            AuditEvent: Recorded audit event
         """
         return await self.log_admin_action(
             event_type="invite_created",
@@ -107,7 +108,7 @@ class AuditService:
         admin_id: UUID,
         invite_code: str,
         request: Optional[Request] = None
-    ) -> AuditLog:
+    ) -> AuditEvent:
         """Log invite code revocation.
 
         Args:
@@ -116,7 +117,7 @@ class AuditService:
             request: FastAPI request object
 
         Returns:
-            AuditLog: Created audit log entry
+            AuditEvent: Recorded audit event
         """
         return await self.log_admin_action(
             event_type="invite_revoked",
@@ -135,7 +136,7 @@ class AuditService:
         old_role: str,
         new_role: str,
         request: Optional[Request] = None
-    ) -> AuditLog:
+    ) -> AuditEvent:
         """Log user role update.
 
         Args:
@@ -146,7 +147,7 @@ class AuditService:
             request: FastAPI request object
 
         Returns:
-            AuditLog: Created audit log entry
+            AuditEvent: Recorded audit event
         """
         return await self.log_admin_action(
             event_type="role_updated",
@@ -167,7 +168,7 @@ class AuditService:
         required_role: str,
         current_role: str,
         request: Optional[Request] = None
-    ) -> AuditLog:
+    ) -> AuditEvent:
         """Log permission denied event.
 
         Args:
@@ -178,7 +179,7 @@ class AuditService:
             request: FastAPI request object
 
         Returns:
-            AuditLog: Created audit log entry
+            AuditEvent: Recorded audit event
         """
         return await self.log_admin_action(
             event_type="permission_denied",
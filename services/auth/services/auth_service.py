@@ -9,8 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from services.auth.repositories.user_repository import UserRepository
 from services.auth.repositories.invite_repository import InviteCodeRepository
 from services.auth.schemas.auth import UserRegisterRequest, UserLoginRequest
-from services.auth.core.exceptions import AuthenticationError, ConflictError, UserNotFoundError
-from services.auth.core.password import hash_password, verify_password
+from services.auth.core.exceptions import (
+    AuthenticationError,
+    ConflictError,
+    PasswordHasherBusyError,
+    UserNotFoundError,
+)
+from services.auth.core.password import password_hasher
+from services.auth.core.audit import AuditEvent, audit_sink
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +81,8 @@ class AuthService:
 
         local_user = None
         try:
-            # Step 3: Hash password with bcrypt (cost factor 12)
-            password_hash = hash_password(user_data.password)
+            # Step 3: Hash password with bcrypt (cost factor 12) off the event loop
+            password_hash = await password_hasher.hash(user_data.password)
 
             # Step 4: Create user in local database
             from services.auth.schemas.user import UserCreate
@@ -119,7 +125,7 @@ class AuthService:
                 "message": "Registration successful. You can now log in."
             }
 
-        except (UserExistsError, ValueError):
+        except (UserExistsError, ValueError, PasswordHasherBusyError):
             await self.session.rollback()
             raise
         except Exception as e:
@@ -155,8 +161,12 @@ class AuthService:
                 logger.warning(f"login_attempt_no_local_password - email={credentials.email}")
                 raise AuthenticationError("This account uses external authentication")
 
-            # Verify password with bcrypt
-            if not verify_password(credentials.password, user.password_hash):
+            # Verify password with bcrypt off the event loop, upgrading weak hashes
+            is_valid, new_password_hash = await password_hasher.verify_and_rehash(
+                credentials.password,
+                user.password_hash
+            )
+            if not is_valid:
                 logger.warning(f"login_attempt_invalid_password - email={credentials.email}")
                 raise AuthenticationError("Invalid email or password")
 
@@ -165,11 +175,12 @@ class AuthService:
                 logger.warning(f"login_attempt_deleted_account - email={credentials.email}")
                 raise AuthenticationError("Account is disabled")
 
-            # Update last_login timestamp
-            await self.user_repo.update_fields(
-                user.id,
-                last_login=datetime.now(timezone.utc)
-            )
+            # Update last_login timestamp (and the rehashed password, if any)
+            login_fields = {"last_login": datetime.now(timezone.utc)}
+            if new_password_hash:
+                login_fields["password_hash"] = new_password_hash
+                logger.info(f"password_rehashed - user_id={user.id}")
+            await self.user_repo.update_fields(user.id, **login_fields)
             await self.session.commit()
 
             logger.info(f"user_authenticated - email={credentials.email}, user_id={user.id}")
@@ -184,7 +195,7 @@ class AuthService:
                 }
             }
 
-        except AuthenticationError:
+        except (AuthenticationError, PasswordHasherBusyError):
             raise
         except Exception as e:
             logger.error(f"login_failed - email={credentials.email}, error={str(e)}")
@@ -209,23 +220,20 @@ class AuthService:
     ) -> None:
         """Log login event for audit.
 
+        The event is buffered and written in the background.
+
         Args:
             user_id: User ID
             ip_address: Request IP address
             user_agent: User agent string
         """
         try:
-            from services.auth.repositories.audit_log_repository import AuditLogRepository
-            audit_repo = AuditLogRepository(self.session)
-
-            await audit_repo.create({
-                "user_id": user_id,
-                "event_type": "login",
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-                "timestamp": datetime.now(timezone.utc)
-            })
-            await self.session.commit()
+            await audit_sink.emit(AuditEvent(
+                action="login",
+                user_id=user_id,
+                ip_address=ip_address,
+                user_agent=user_agent
+            ))
 
         except Exception as e:
             logger.error(f"audit_log_failed - {str(e)}")
@@ -247,17 +255,13 @@ class AuthService:
             user = await self.user_repo.get_by_email(email)
             user_id = user.id if user else None
 
-            from services.auth.repositories.audit_log_repository import AuditLogRepository
-            audit_repo = AuditLogRepository(self.session)
-
-            await audit_repo.create(
-                user_id=user_id,
+            await audit_sink.emit(AuditEvent(
                 action="failed_login",
+                user_id=user_id,
                 ip_address=ip_address,
                 user_agent="",
                 metadata={"email": email}
-            )
-            await self.session.commit()
+            ))
 
         except Exception as e:
             logger.error(f"audit_log_failed - {str(e)}")
@@ -5,6 +5,7 @@ This service implements:
 - Token family tracking for refresh token rotation security
 - Proper token revocation and reuse detection
 - Redis caching for performance optimization
+- Keys loaded once per process (see ``core.keys``) and tokens tagged with ``kid``
 
 Expert recommendations implemented:
 - Separate family ID (fid) claim for proper family chain propagation
@@ -19,8 +20,8 @@ from uuid import UUID, uuid4
 import hashlib
 import json
 import jwt
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
+from redis.asyncio.client import Pipeline
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
@@ -33,9 +34,64 @@ from services.auth.core.exceptions import (
 )
 from services.auth.repositories.refresh_token_repository import RefreshTokenRepository
 from services.auth.core.cache import redis_client
+from services.auth.core.keys import signing_key_store
+from services.auth.core.metrics import revocation_mirror_lookups_total
+from services.auth.core.revocation import RevocationMirror
 
 logger = structlog.get_logger(__name__)
 
+# Revokes tokens atomically in one round trip: flags each token's cached
+# metadata as invalid (keeping its TTL), adds it to the deny-list and
+# notifies verifiers. When a family set key is given, every member of that
+# token family is revoked and the set is deleted. Returns the revoked JTIs.
+#
+# KEYS: [family set key], then the metadata and deny-list key of each JTI
+#       in ARGV, in pairs
+# ARGV: metadata key prefix, deny-list key prefix, deny-list TTL,
+#       notification channel, JTIs to revoke...
+#
+# Family members are only known once the set is read, so their keys are
+# built from the prefixes inside the script. This needs a single Redis node
+# (RedisClient is not cluster-aware), where all keys live together.
+REVOKE_TOKENS_SCRIPT = """
+local jtis = {}
+local function revoke(jti, cache_key, revoked_key)
+    local cached = redis.call('GET', cache_key)
+    if cached then
+        local metadata = cjson.decode(cached)
+        metadata['valid'] = false
+        redis.call('SET', cache_key, cjson.encode(metadata), 'KEEPTTL')
+    end
+    redis.call('SETEX', revoked_key, ARGV[3], '1')
+    redis.call('PUBLISH', ARGV[4], jti)
+    jtis[#jtis + 1] = jti
+end
+local offset = #KEYS % 2
+for i = 5, #ARGV do
+    local pair = offset + 2 * (i - 4)
+    revoke(ARGV[i], KEYS[pair - 1], KEYS[pair])
+end
+if offset == 1 then
+    for _, jti in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+        revoke(jti, ARGV[1] .. jti, ARGV[2] .. jti)
+    end
+    redis.call('DEL', KEYS[1])
+end
+return jtis
+"""
+
+# How long revoked JTIs stay on the deny-list
+REVOKED_TOKEN_TTL_SECONDS = 86400 * 7
+
+# Local copy of the deny-list; started in the app lifespan
+revocation_mirror = RevocationMirror(
+    redis_client,
+    channel=settings.TOKEN_REVOCATION_CHANNEL,
+    key_prefix="revoked:",
+    entry_ttl=REVOKED_TOKEN_TTL_SECONDS,
+    resync_interval=settings.REVOCATION_MIRROR_RESYNC_INTERVAL,
+)
+
 
 class JWTService:
     """JWT token generation, validation, and rotation service with RS256 signing."""
@@ -47,28 +103,30 @@ class JWTService:
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
         self.refresh_token_expire = timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
-        self._load_keys()
+        # Loads the keys on first use in the process, reused afterwards
+        signing_key_store.current()
+
+    @property
+    def private_key(self) -> RSAPrivateKey:
+        """Current signing key."""
+        return signing_key_store.current().private_key
+
+    @property
+    def public_key(self) -> RSAPublicKey:
+        """Public key of the current signing key."""
+        return signing_key_store.current().public_key
+
+    def get_verification_key(self, token: str) -> RSAPublicKey:
+        """
+        Get the public key a token was signed with, selected by its ``kid``.
 
-    def _load_keys(self) -> None:
-        """Load RSA keys for signing and verification."""
+        Tokens without a ``kid`` (issued before key IDs) use the current key.
+        """
         try:
-            # Load private key for signing
-            with open(settings.JWT_PRIVATE_KEY_PATH, 'rb') as f:
-                self.private_key = serialization.load_pem_private_key(
-                    f.read(),
-                    password=settings.JWT_KEY_PASSWORD.encode() if settings.JWT_KEY_PASSWORD else None,
-                    backend=default_backend()
-                )
-
-            # Load public key for verification
-            with open(settings.JWT_PUBLIC_KEY_PATH, 'rb') as f:
-                self.public_key = serialization.load_pem_public_key(
-                    f.read(),
-                    backend=default_backend()
-                )
-        except Exception as e:
-            logger.error(f"jwt_keys_load_failed - {str(e)}")
-            raise
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.PyJWTError:
+            kid = None
+        return signing_key_store.get_verification_key(kid)
 
     async def _generate_token(
         self,
@@ -114,11 +172,13 @@ class JWTService:
         # Merge extra claims (email, role, permissions, etc.)
         claims.update(extra_claims)
 
-        # Sign token with RS256
+        # Sign token with RS256, tagged with the signing key's kid
+        key_set = signing_key_store.current()
         encoded_token = jwt.encode(
             claims,
-            self.private_key,
-            algorithm=self.algorithm
+            key_set.private_key,
+            algorithm=self.algorithm,
+            headers={"kid": key_set.kid}
         )
 
         return encoded_token, jti
@@ -148,6 +208,71 @@ class JWTService:
         Returns:
             Tuple of (access_token, jti)
         """
+        token, jti, lifetime = await self._build_access_token(
+            user_id, email, role, company_id, permissions
+        )
+
+        async with redis_client.pipeline("create_access_token") as pipe:
+            self._queue_access_token_metadata(pipe, jti, user_id, lifetime)
+
+        return token, jti
+
+    async def create_token_pair(
+        self,
+        user_id: UUID,
+        email: str,
+        role: str,
+        company_id: Optional[UUID] = None,
+        permissions: Optional[list[str]] = None,
+        device_id: Optional[str] = None,
+        token_family_id: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Generate an access token and a refresh token together.
+
+        Used by login and refresh rotation. The Redis writes for both tokens
+        (access token metadata and refresh token family membership) are sent
+        in a single transactional round trip.
+
+        Args:
+            user_id: User UUID
+            email: User email
+            role: User role (user, admin, super_admin, manager)
+            company_id: Optional company UUID
+            permissions: Optional list of permissions
+            device_id: Optional device identifier
+            token_family_id: Optional existing family ID (for rotation)
+
+        Returns:
+            Tuple of (access_token, refresh_token)
+        """
+        access_token, access_jti, lifetime = await self._build_access_token(
+            user_id, email, role, company_id, permissions
+        )
+        refresh_token, refresh_jti, token_family_id = await self._build_refresh_token(
+            user_id, token_family_id, device_id
+        )
+
+        async with redis_client.pipeline("create_token_pair") as pipe:
+            self._queue_access_token_metadata(pipe, access_jti, user_id, lifetime)
+            self._queue_family_member(pipe, token_family_id, refresh_jti)
+
+        return access_token, refresh_token
+
+    async def _build_access_token(
+        self,
+        user_id: UUID,
+        email: str,
+        role: str,
+        company_id: Optional[UUID],
+        permissions: Optional[list[str]]
+    ) -> Tuple[str, str, timedelta]:
+        """
+        Sign an access token without touching Redis.
+
+        Returns:
+            Tuple of (access_token, jti, lifetime)
+        """
         jti = str(uuid4())
 
         # Role-based token lifetime (Task 2.0 requirement)
@@ -167,18 +292,6 @@ class JWTService:
         if company_id:
             extra_claims["company_id"] = str(company_id)
 
-        # Cache token metadata for fast validation/revocation
-        cache_key = f"token:{jti}"
-        await redis_client.setex(
-            cache_key,
-            int(expires_delta.total_seconds()),
-            json.dumps({
-                "user_id": str(user_id),
-                "valid": True,
-                "type": "access"
-            })
-        )
-
         token, jti = await self._generate_token(
             user_id=user_id,
             token_type="access",
@@ -187,7 +300,25 @@ class JWTService:
             **extra_claims
         )
 
-        return token, jti
+        return token, jti, expires_delta
+
+    def _queue_access_token_metadata(
+        self,
+        pipe: Pipeline,
+        jti: str,
+        user_id: UUID,
+        lifetime: timedelta
+    ) -> None:
+        """Queue caching of access token metadata for fast validation/revocation."""
+        pipe.setex(
+            f"token:{jti}",
+            int(lifetime.total_seconds()),
+            json.dumps({
+                "user_id": str(user_id),
+                "valid": True,
+                "type": "access"
+            })
+        )
 
     async def create_refresh_token(
         self,
@@ -210,6 +341,27 @@ class JWTService:
         Returns:
             Encoded refresh token
         """
+        token, jti, token_family_id = await self._build_refresh_token(
+            user_id, token_family_id, device_id
+        )
+
+        # Add token to family in Redis for fast lookup
+        await self._add_token_to_family(token_family_id, jti)
+
+        return token
+
+    async def _build_refresh_token(
+        self,
+        user_id: UUID,
+        token_family_id: Optional[str],
+        device_id: Optional[str]
+    ) -> Tuple[str, str, str]:
+        """
+        Sign a refresh token and store its hash in the database.
+
+        Returns:
+            Tuple of (refresh_token, jti, token_family_id)
+        """
         jti = str(uuid4())
 
         # CRITICAL: Create new family only on initial login
@@ -237,10 +389,7 @@ class JWTService:
             device_id=device_id
         )
 
-        # Add token to family in Redis for fast lookup
-        await self._add_token_to_family(token_family_id, jti)
-
-        return token
+        return token, jti, token_family_id
 
     async def verify_token(
         self,
@@ -264,31 +413,49 @@ class JWTService:
             InvalidTokenError: Token is invalid or malformed
             TokenRevokedError: Token has been revoked
         """
+        payload = self.decode_token(token, token_type)
+
+        # Check revocation status for access tokens
+        if token_type == "access":
+            try:
+                revoked = await self._is_token_revoked(payload.get("jti"))
+            except Exception as e:
+                logger.error(f"token_verification_failed - {str(e)}")
+                raise InvalidTokenError(f"Token verification failed: {str(e)}")
+            if revoked:
+                raise TokenRevokedError("Token has been revoked")
+
+        return payload
+
+    def decode_token(
+        self,
+        token: str,
+        token_type: Optional[str] = None
+    ) -> dict[str, Any]:
+        """
+        Verify a token's signature and claims without checking revocation.
+
+        Args:
+            token: JWT token string
+            token_type: Expected token type, or None to accept any type
+
+        Returns:
+            Decoded token payload
+
+        Raises:
+            TokenExpiredError: Token has expired
+            InvalidTokenError: Token is invalid, malformed or of another type
+        """
         try:
             # Decode with public key (expert recommendation)
             payload = jwt.decode(
                 token,
-                self.public_key,
+                self.get_verification_key(token),
                 algorithms=[self.algorithm],
                 audience=settings.JWT_AUDIENCE,
                 issuer=settings.JWT_ISSUER,
                 options={"verify_exp": True}
             )
-
-            # Verify token type matches expected
-            if payload.get("token_type") != token_type:
-                raise InvalidTokenError(
-                    f"Invalid token type. Expected {token_type}, got {payload.get('token_type')}"
-                )
-
-            # Check revocation status for access tokens
-            if token_type == "access":
-                jti = payload.get("jti")
-                if await self._is_token_revoked(jti):
-                    raise TokenRevokedError("Token has been revoked")
-
-            return payload
-
         except jwt.ExpiredSignatureError:
             raise TokenExpiredError("Token has expired")
         except jwt.InvalidTokenError as e:
@@ -297,6 +464,14 @@ class JWTService:
             logger.error(f"token_verification_failed - {str(e)}")
             raise InvalidTokenError(f"Token verification failed: {str(e)}")
 
+        # Verify token type matches expected
+        if token_type is not None and payload.get("token_type") != token_type:
+            raise InvalidTokenError(
+                f"Invalid token type. Expected {token_type}, got {payload.get('token_type')}"
+            )
+
+        return payload
+
     async def rotate_refresh_token(
         self,
         old_refresh_token: str
@@ -325,7 +500,7 @@ class JWTService:
             # Decode with public key (expert recommendation)
             payload = jwt.decode(
                 old_refresh_token,
-                self.public_key,
+                self.get_verification_key(old_refresh_token),
                 algorithms=[self.algorithm],
                 audience=settings.JWT_AUDIENCE,
                 issuer=settings.JWT_ISSUER,
@@ -358,20 +533,15 @@ class JWTService:
             if not user:
                 raise InvalidTokenError("User not found")
 
-            # Generate new access token
-            new_access_token, _ = await self.create_access_token(
+            # Generate new access and refresh tokens - PROPAGATE FAMILY ID (expert fix)
+            new_access_token, new_refresh_token = await self.create_token_pair(
                 user_id=user.id,
                 email=user.email,
                 role=user.role,
                 company_id=None,  # TODO: Get from user_companies
-                permissions=[]  # TODO: Get from role
-            )
-
-            # Generate new refresh token - PROPAGATE FAMILY ID (expert fix)
-            new_refresh_token = await self.create_refresh_token(
-                user_id=user_id,
-                token_family_id=family_id,  # CRITICAL: Use original family ID
-                device_id=device_id
+                permissions=[],  # TODO: Get from role
+                device_id=device_id,
+                token_family_id=family_id  # CRITICAL: Use original family ID
             )
 
             return new_access_token, new_refresh_token
@@ -383,63 +553,113 @@ class JWTService:
         """
         Revoke a single token by JTI.
 
+        Marks the cached metadata invalid, adds the JTI to the deny-list and
+        notifies verifiers that cache validated tokens (e.g. the gateway), in
+        one atomic round trip.
+
         Args:
             jti: Token unique identifier
         """
-        # Mark as revoked in cache
-        cache_key = f"token:{jti}"
-        cached = await redis_client.get(cache_key)
-        if cached:
-            metadata = json.loads(cached)
-            metadata["valid"] = False
-            await redis_client.setex(
-                cache_key,
-                await redis_client.ttl(cache_key),
-                json.dumps(metadata)
-            )
-
-        # Add to revocation list
-        revoke_key = f"revoked:{jti}"
-        await redis_client.setex(
-            revoke_key,
-            86400 * 7,  # Keep for 7 days
-            "1"
-        )
+        await self._revoke_tokens("revoke_token", jtis=[jti])
 
     async def _revoke_token_family(self, family_id: str) -> None:
         """
         Revoke all tokens in a family (security breach response).
 
+        Every member of the family is revoked and the family set cleared in a
+        single scripted Redis round trip, whatever the family size.
+
         Args:
             family_id: Token family identifier
         """
-        # Get all tokens in family from Redis
-        family_key = f"token_family:{family_id}"
-        token_ids = await redis_client.smembers(family_key)
-
-        # Revoke each token
-        for jti in token_ids:
-            await self.revoke_token(jti)
-
-        # Clear the family
-        await redis_client.delete(family_key)
+        revoked = await self._revoke_tokens(
+            "revoke_token_family",
+            family_key=f"token_family:{family_id}"
+        )
 
         # Revoke in database
         await self.token_repo.revoke_family(family_id)
 
-        logger.warning(f"token_family_revoked - family_id={family_id}, token_count={len(token_ids)}")
+        logger.warning(f"token_family_revoked - family_id={family_id}, token_count={len(revoked)}")
+
+    async def _revoke_tokens(
+        self,
+        operation: str,
+        jtis: Optional[list[str]] = None,
+        family_key: Optional[str] = None
+    ) -> list[str]:
+        """Run the revocation script for explicit JTIs and/or a whole token family."""
+        jtis = jtis or []
+        keys = [family_key] if family_key else []
+        for jti in jtis:
+            keys += [f"token:{jti}", f"revoked:{jti}"]
+        revoked = await redis_client.run_script(
+            operation,
+            REVOKE_TOKENS_SCRIPT,
+            keys=keys,
+            args=[
+                "token:",
+                "revoked:",
+                REVOKED_TOKEN_TTL_SECONDS,
+                settings.TOKEN_REVOCATION_CHANNEL,
+                *jtis,
+            ],
+        )
+        revoked = [jti.decode() if isinstance(jti, bytes) else jti for jti in revoked or []]
+
+        # Visible to this process at once, without waiting for the notification
+        for jti in revoked:
+            revocation_mirror.add(jti)
+        return revoked
 
     async def _add_token_to_family(self, family_id: str, jti: str) -> None:
         """Add token to family set in Redis."""
+        async with redis_client.pipeline("add_token_to_family") as pipe:
+            self._queue_family_member(pipe, family_id, jti)
+
+    def _queue_family_member(self, pipe: Pipeline, family_id: str, jti: str) -> None:
+        """Queue adding a token to its family set and refreshing the set's expiry."""
         family_key = f"token_family:{family_id}"
-        await redis_client.sadd(family_key, jti)
-        await redis_client.expire(family_key, int(self.refresh_token_expire.total_seconds()))
+        pipe.sadd(family_key, jti)
+        pipe.expire(family_key, int(self.refresh_token_expire.total_seconds()))
 
     async def _is_token_revoked(self, jti: str) -> bool:
-        """Check if token is revoked in Redis."""
+        """
+        Check if token is revoked.
+
+        Answered from the in-process revocation mirror while it is in sync
+        with Redis, otherwise from the Redis deny-list.
+        """
+        if revocation_mirror.synced:
+            return revocation_mirror.is_revoked(jti)
+
+        revocation_mirror_lookups_total.labels(source="redis").inc()
         revoke_key = f"revoked:{jti}"
         return await redis_client.exists(revoke_key) > 0
 
+    async def get_revoked_jtis(self, jtis: list[str]) -> set[str]:
+        """
+        Check many tokens for revocation at once.
+
+        Answered from the in-process revocation mirror while it is in sync,
+        otherwise with a single MGET of the deny-list keys.
+
+        Args:
+            jtis: Token unique identifiers
+
+        Returns:
+            The subset of ``jtis`` that is revoked
+        """
+        if not jtis:
+            return set()
+
+        if revocation_mirror.synced:
+            return {jti for jti in jtis if revocation_mirror.is_revoked(jti)}
+
+        revocation_mirror_lookups_total.labels(source="redis").inc(len(jtis))
+        flags = await redis_client.mget("check_revocations", *(f"revoked:{jti}" for jti in jtis))
+        return {jti for jti, flag in zip(jtis, flags) if flag is not None}
+
     def _hash_token(self, token: str) -> str:
         """Hash token for secure storage using SHA-256."""
         return hashlib.sha256(token.encode()).hexdigest()
@@ -11,15 +11,19 @@ from typing import Any
 from datetime import datetime, timedelta
 import os
 import json
-from pathlib import Path
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
-import jwt
+from jwt.algorithms import RSAAlgorithm
 import structlog
 
 from services.auth.config import settings
 from services.auth.core.cache import redis_client
+from services.auth.core.keys import (
+    BACKUP_TIMESTAMP_FORMAT,
+    get_key_backup_dir,
+    signing_key_store,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -31,7 +35,7 @@ class KeyRotationService:
         """Initialize key rotation service."""
         self.key_size = 2048
         self.rotation_days = settings.JWT_KEY_ROTATION_DAYS
-        self.overlap_days = 7  # Grace period for old keys
+        self.overlap_days = settings.JWT_KEY_OVERLAP_DAYS  # Grace period for old keys
 
     def generate_key_pair(self) -> tuple[bytes, bytes]:
         """
@@ -65,6 +69,14 @@ class KeyRotationService:
 
         return private_pem, public_pem
 
+    def _write_key_file(self, path: str, content: bytes, mode: int) -> None:
+        """Write a key file atomically with the given permissions."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+
     async def rotate_keys(self) -> bool:
         """
         Rotate JWT signing keys with zero downtime.
@@ -73,8 +85,9 @@ class KeyRotationService:
         1. Generate new key pair
         2. Backup current keys with timestamp
         3. Write new keys to configured paths
-        4. Update metadata in Redis
-        5. Old keys remain valid for overlap period
+        4. Swap the new keys into this process's key store
+        5. Update metadata in Redis
+        6. Old keys remain valid for overlap period
 
         Returns:
             True if rotation successful, False otherwise
@@ -86,8 +99,8 @@ class KeyRotationService:
             private_key, public_key = self.generate_key_pair()
 
             # Create backup directory with timestamp
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            backup_dir = Path("keys/backups") / timestamp
+            timestamp = datetime.utcnow().strftime(BACKUP_TIMESTAMP_FORMAT)
+            backup_dir = get_key_backup_dir() / timestamp
             backup_dir.mkdir(parents=True, exist_ok=True)
 
             # Backup current keys if they exist
@@ -105,15 +118,13 @@ class KeyRotationService:
                 )
                 logger.info("Current public key backed up", backup_dir=str(backup_dir))
 
-            # Write new keys
-            with open(settings.JWT_PRIVATE_KEY_PATH, 'wb') as f:
-                f.write(private_key)
-            with open(settings.JWT_PUBLIC_KEY_PATH, 'wb') as f:
-                f.write(public_key)
+            # Write new keys; each file appears complete or not at all
+            self._write_key_file(settings.JWT_PRIVATE_KEY_PATH, private_key, 0o600)
+            self._write_key_file(settings.JWT_PUBLIC_KEY_PATH, public_key, 0o644)
 
-            # Set appropriate permissions (read-only for private key)
-            os.chmod(settings.JWT_PRIVATE_KEY_PATH, 0o600)
-            os.chmod(settings.JWT_PUBLIC_KEY_PATH, 0o644)
+            # Sign with the new key at once; other processes pick it up when
+            # they next check the key files
+            signing_key_store.reload()
 
             # Store key metadata in Redis
             metadata = {
@@ -158,7 +169,7 @@ class KeyRotationService:
                     {
                         "kty": "RSA",
                         "use": "sig",
-                        "kid": "current",
+                        "kid": "<RFC 7638 thumbprint>",
                         "n": "...",
                         "e": "..."
                     }
@@ -168,25 +179,15 @@ class KeyRotationService:
         keys = []
 
         try:
-            # Load current public key
-            with open(settings.JWT_PUBLIC_KEY_PATH, 'rb') as f:
-                public_key = serialization.load_pem_public_key(
-                    f.read(),
-                    backend=default_backend()
-                )
-
-                # Convert to JWK format
-                from jwt.algorithms import RSAAlgorithm
-                jwk = RSAAlgorithm.to_jwk(public_key)
-                jwk_dict = json.loads(jwk)
+            # Current key first, then retired keys still in their overlap period
+            key_set = signing_key_store.current()
+            for kid, public_key in key_set.verification_keys.items():
+                jwk_dict = json.loads(RSAAlgorithm.to_jwk(public_key))
                 jwk_dict["use"] = "sig"
-                jwk_dict["kid"] = "current"
+                jwk_dict["kid"] = kid
                 jwk_dict["alg"] = settings.JWT_ALGORITHM
                 keys.append(jwk_dict)
 
-            # TODO: Add previous key for overlap period
-            # During rotation overlap, both keys should be in the JWK set
-
             logger.info("JWK set generated", key_count=len(keys))
 
         except Exception as e:
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.services.supabase_client import SupabaseClient
 from services.auth.repositories.user_repository import UserRepository
+from services.auth.core.audit import AuditEvent, audit_sink
 
 logger = logging.getLogger(__name__)
 
@@ -141,15 +142,10 @@ class OAuthService:
             await self.session.commit()
 
             # Log OAuth login
-            from services.auth.repositories.audit_log_repository import AuditLogRepository
-            audit_repo = AuditLogRepository(self.session)
-
-            await audit_repo.create({
-                "user_id": user.id,
-                "event_type": f"oauth_login_{provider.value}",
-                "timestamp": datetime.utcnow()
-            })
-            await self.session.commit()
+            await audit_sink.emit(AuditEvent(
+                action=f"oauth_login_{provider.value}",
+                user_id=user.id
+            ))
 
             return {
                 "access_token": session_data.get("access_token"),
@@ -1,12 +1,12 @@
 """Password reset service."""
 
 from typing import Dict, Any
-from datetime import datetime
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.auth.services.supabase_client import SupabaseClient
 from services.auth.repositories.user_repository import UserRepository
+from services.auth.core.audit import AuditEvent, audit_sink
 from services.auth.config import settings
 
 logger = logging.getLogger(__name__)
@@ -57,15 +57,10 @@ class PasswordResetService:
                 )
 
                 # Log password reset request
-                from services.auth.repositories.audit_log_repository import AuditLogRepository
-                audit_repo = AuditLogRepository(self.session)
-
-                await audit_repo.create({
-                    "user_id": user.id,
-                    "event_type": "password_reset_requested",
-                    "timestamp": datetime.utcnow()
-                })
-                await self.session.commit()
+                await audit_sink.emit(AuditEvent(
+                    action="password_reset_requested",
+                    user_id=user.id
+                ))
 
             except Exception as e:
                 logger.error(f"password_reset_request_failed - email={email}, error={str(e)}")
@@ -112,16 +107,12 @@ class PasswordResetService:
             # Log successful password reset
             user = await self.user_repo.get_by_email(email)
             if user:
-                from services.auth.repositories.audit_log_repository import AuditLogRepository
-                audit_repo = AuditLogRepository(self.session)
-
-                await audit_repo.create(
-                    user_id=user.id,
+                await audit_sink.emit(AuditEvent(
                     action="password_reset_completed",
+                    user_id=user.id,
                     ip_address="",
                     user_agent=""
-                )
-                await self.session.commit()
+                ))
 
             logger.info(f"password_reset_completed - email={email}")
 
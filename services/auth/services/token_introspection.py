@@ -13,8 +13,7 @@ import jwt
 import structlog
 
 from services.auth.services.jwt_service import JWTService
-from services.auth.core.exceptions import InvalidTokenError, TokenExpiredError, TokenRevokedError
-from services.auth.core.cache import redis_client
+from services.auth.core.exceptions import InvalidTokenError, TokenExpiredError
 
 logger = structlog.get_logger(__name__)
 
@@ -55,59 +54,101 @@ class TokenIntrospectionService:
             - exp, iat, nbf, sub, jti: token claims
             - Custom claims (role, company_id, etc.)
         """
-        try:
-            # Try to decode without verification first to get type
-            unverified = jwt.decode(
-                token,
-                options={"verify_signature": False, "verify_exp": False}
-            )
+        results = await self.introspect_batch([token], token_type_hint)
+        return results[0]
 
-            token_type = token_type_hint or unverified.get("token_type", "access")
-
-            # Verify token with full validation
-            payload = await self.jwt_service.verify_token(token, token_type)
-
-            # Build RFC 7662 compliant introspection response
-            response = {
-                "active": True,
-                "scope": " ".join(payload.get("permissions", [])),
-                "client_id": payload.get("iss", "auth-service"),
-                "username": payload.get("email"),
-                "token_type": token_type,
-                "exp": payload.get("exp"),
-                "iat": payload.get("iat"),
-                "nbf": payload.get("nbf"),
-                "sub": payload.get("sub"),
-                "aud": payload.get("aud"),
-                "iss": payload.get("iss"),
-                "jti": payload.get("jti"),
-            }
+    async def introspect_batch(
+        self,
+        tokens: list[str],
+        token_type_hint: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Introspect many tokens at once.
 
-            # Add custom claims
-            if "role" in payload:
-                response["role"] = payload["role"]
-            if "company_id" in payload:
-                response["company_id"] = payload["company_id"]
-            if "email" in payload:
-                response["email"] = payload["email"]
-            if "name" in payload:
-                response["name"] = payload["name"]
-
-            logger.info(
-                "Token introspection successful",
-                token_type=token_type,
-                jti=payload.get("jti"),
-                active=True
-            )
+        Each token is verified with a single decode, and revocation of all
+        access tokens is resolved together (one Redis round trip at most).
 
-            return response
+        Args:
+            tokens: JWT token strings
+            token_type_hint: Optional hint about token type, applied to every token
 
-        except (TokenExpiredError, TokenRevokedError, InvalidTokenError) as e:
-            logger.info("Token introspection failed", error=str(e), active=False)
-            return {"active": False}
+        Returns:
+            One introspection response per token, in input order
+        """
+        decoded: list[Optional[tuple[dict[str, Any], str]]] = []
+        for token in tokens:
+            try:
+                payload = self.jwt_service.decode_token(token)
+                token_type = token_type_hint or payload.get("token_type", "access")
+                if payload.get("token_type") != token_type:
+                    raise InvalidTokenError(
+                        f"Invalid token type. Expected {token_type}, got {payload.get('token_type')}"
+                    )
+                decoded.append((payload, token_type))
+            except (TokenExpiredError, InvalidTokenError) as e:
+                logger.info("Token introspection failed", error=str(e), active=False)
+                decoded.append(None)
+
+        # Revocation is only tracked for access tokens
+        access_jtis = [
+            entry[0].get("jti") for entry in decoded
+            if entry is not None and entry[1] == "access"
+        ]
+        try:
+            revoked = await self.jwt_service.get_revoked_jtis([jti for jti in access_jtis if jti])
         except Exception as e:
             logger.error("Introspection error", error=str(e))
-            return {"active": False}
+            revoked = None
+
+        results = []
+        for entry in decoded:
+            if entry is None:
+                results.append({"active": False})
+                continue
+
+            payload, token_type = entry
+            if token_type == "access" and (revoked is None or payload.get("jti") in revoked):
+                results.append({"active": False})
+                continue
+
+            results.append(self._build_response(payload, token_type))
+
+        logger.info(
+            "Token introspection completed",
+            tokens=len(tokens),
+            active=sum(1 for result in results if result["active"])
+        )
+
+        return results
+
+    def _build_response(self, payload: dict[str, Any], token_type: str) -> dict[str, Any]:
+        """Build an RFC 7662 introspection response for a verified token."""
+        response = {
+            "active": True,
+            "scope": " ".join(payload.get("permissions", [])),
+            "client_id": payload.get("iss", "auth-service"),
+            "username": payload.get("email"),
+            "token_type": token_type,
+            "exp": payload.get("exp"),
+            "iat": payload.get("iat"),
+            "nbf": payload.get("nbf"),
+            "sub": payload.get("sub"),
+            "aud": payload.get("aud"),
+            "iss": payload.get("iss"),
+            "jti": payload.get("jti"),
+        }
+
+        # Add custom claims
+        if "role" in payload:
+            response["role"] = payload["role"]
+        if "company_id" in payload:
+            response["company_id"] = payload["company_id"]
+        if "email" in payload:
+            response["email"] = payload["email"]
+        if "name" in payload:
+            response["name"] = payload["name"]
+
+        return response
 
     async def revoke_token(self, token: str) -> bool:
         """
@@ -125,7 +166,7 @@ class TokenIntrospectionService:
             # Decode without expiration check (allow revoking expired tokens)
             payload = jwt.decode(
                 token,
-                self.jwt_service.public_key,
+                self.jwt_service.get_verification_key(token),
                 algorithms=[self.jwt_service.algorithm],
                 options={"verify_exp": False}  # Allow revoking expired tokens
             )
@@ -159,7 +200,7 @@ class TokenIntrospectionService:
             # Get full payload
             payload = jwt.decode(
                 token,
-                self.jwt_service.public_key,
+                self.jwt_service.get_verification_key(token),
                 algorithms=[self.jwt_service.algorithm],
                 options={"verify_exp": False}
             )
@@ -14,6 +14,7 @@ from services.auth.models.user import User
 from services.auth.models.refresh_token import RefreshToken
 from services.auth.repositories.refresh_token_repository import RefreshTokenRepository
 from services.auth.core.cache import RedisClient
+from services.auth.services.key_rotation import KeyRotationService
 
 
 # Pytest asyncio configuration
@@ -84,6 +85,34 @@ async def redis_client() -> AsyncGenerator[RedisClient, None]:
     await client.disconnect()
 
 
+@pytest.fixture
+async def fake_redis_client() -> AsyncGenerator[RedisClient, None]:
+    """Create a Redis client backed by in-process fakeredis (with Lua support)."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    client = RedisClient()
+    client.redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    yield client
+
+    await client.redis.flushall()
+    await client.disconnect()
+
+
+@pytest.fixture
+def jwt_key_files(tmp_path, monkeypatch):
+    """Write a fresh RSA key pair and point the JWT settings at it."""
+    private_pem, public_pem = KeyRotationService().generate_key_pair()
+    private_path = tmp_path / "private.pem"
+    public_path = tmp_path / "public.pem"
+    private_path.write_bytes(private_pem)
+    public_path.write_bytes(public_pem)
+
+    monkeypatch.setattr(settings, "JWT_PRIVATE_KEY_PATH", str(private_path))
+    monkeypatch.setattr(settings, "JWT_PUBLIC_KEY_PATH", str(public_path))
+    monkeypatch.setattr(settings, "JWT_KEY_PASSWORD", None)
+
+
 # User fixtures
 @pytest.fixture
 async def test_user(db_session: AsyncSession) -> User:
@@ -0,0 +1,125 @@
+"""Benchmark harness for auth token operations.
+
+Runs an operation a fixed number of times from a pool of concurrent workers
+and reports latency percentiles and throughput. Results are written as JSON
+so runs can be compared across commits.
+
+Environment:
+    AUTH_BENCHMARK_OPERATIONS: Operations per benchmark run (default 200)
+    AUTH_BENCHMARK_CONCURRENCY: Comma-separated worker counts (default "1,16")
+    AUTH_BENCHMARK_OUTPUT: JSON results file (default .benchmarks/auth_tokens.json)
+"""
+
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import numpy as np
+
+BENCHMARK_OPERATIONS = int(os.getenv("AUTH_BENCHMARK_OPERATIONS", "200"))
+BENCHMARK_CONCURRENCY = [
+    int(value) for value in os.getenv("AUTH_BENCHMARK_CONCURRENCY", "1,16").split(",")
+]
+BENCHMARK_OUTPUT = Path(os.getenv("AUTH_BENCHMARK_OUTPUT", ".benchmarks/auth_tokens.json"))
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency and throughput of one benchmark run."""
+
+    name: str
+    concurrency: int
+    operations: int
+    errors: int
+    seconds: float
+    ops_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} (concurrency={self.concurrency}): "
+            f"{self.ops_per_second:.0f} ops/s, p50={self.p50_ms:.2f}ms, "
+            f"p95={self.p95_ms:.2f}ms, p99={self.p99_ms:.2f}ms, errors={self.errors}"
+        )
+
+
+async def run_benchmark(
+    name: str,
+    operation: Callable[[int], Awaitable[object]],
+    operations: int = BENCHMARK_OPERATIONS,
+    concurrency: int = 1
+) -> BenchmarkResult:
+    """
+    Run ``operation(i)`` for i in range(operations) on ``concurrency`` workers.
+
+    Args:
+        name: Benchmark name used in the results
+        operation: Coroutine function taking the operation index
+        operations: Total number of operations
+        concurrency: Number of workers running operations at once
+
+    Returns:
+        Benchmark result; failed operations are counted in ``errors``
+    """
+    indexes = iter(range(operations))
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for i in indexes:
+            start = time.perf_counter()
+            try:
+                await operation(i)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return BenchmarkResult(
+        name=name,
+        concurrency=concurrency,
+        operations=operations,
+        errors=errors,
+        seconds=round(seconds, 4),
+        ops_per_second=round(operations / seconds, 2),
+        p50_ms=round(float(p50), 3),
+        p95_ms=round(float(p95), 3),
+        p99_ms=round(float(p99), 3),
+        max_ms=round(max(latencies), 3),
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(results: list[BenchmarkResult], path: Path = BENCHMARK_OUTPUT) -> None:
+    """Write benchmark results, with the commit they were measured on, as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(report, indent=2))
@@ -0,0 +1,73 @@
+"""Fixtures for the auth benchmarks: SQLite and fakeredis stand-ins for Postgres and Redis."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Callable, Generator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from services.auth.core.cache import RedisClient
+from services.auth.database import Base
+from services.auth.models.user import User
+from services.auth.services import jwt_service as jwt_service_module
+from services.auth.services.jwt_service import JWTService
+from services.auth.tests.performance.benchmark import BenchmarkResult, write_results
+
+
+@pytest.fixture(scope="session")
+def benchmark_results() -> Generator[list[BenchmarkResult], None, None]:
+    """Collect results of every benchmark and write them as JSON at the end."""
+    results: list[BenchmarkResult] = []
+    yield results
+    if results:
+        write_results(results)
+
+
+@pytest.fixture
+async def bench_sessionmaker(tmp_path) -> AsyncGenerator[async_sessionmaker, None]:
+    """File-backed SQLite database, so concurrent sessions share its data."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def bench_redis(fake_redis_client: RedisClient, monkeypatch) -> RedisClient:
+    """Route the JWT service's Redis calls to fakeredis."""
+    monkeypatch.setattr(jwt_service_module, "redis_client", fake_redis_client)
+    return fake_redis_client
+
+
+@pytest.fixture
+async def bench_user(bench_sessionmaker: async_sessionmaker) -> User:
+    """User the benchmarked tokens are issued to."""
+    async with bench_sessionmaker() as session:
+        user = User(
+            email="bench@example.com",
+            name="Bench User",
+            role="user"
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+
+@pytest.fixture
+def request_jwt_service(
+    jwt_key_files,
+    bench_redis: RedisClient,
+    bench_sessionmaker: async_sessionmaker
+) -> Callable[[], AsyncIterator[JWTService]]:
+    """JWT service with its own session per request, committed at the end, as in the API."""
+
+    @asynccontextmanager
+    async def jwt_service_for_request() -> AsyncIterator[JWTService]:
+        async with bench_sessionmaker() as session:
+            yield JWTService(session)
+            await session.commit()
+
+    return jwt_service_for_request
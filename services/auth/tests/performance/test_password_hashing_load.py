@@ -0,0 +1,74 @@
+"""Load test for password hashing under concurrent logins.
+
+Compares running bcrypt inline on the event loop (the previous behaviour)
+against the PasswordHasher worker pool, measuring login throughput and the
+latency of concurrent token-refresh-like requests on the same loop.
+"""
+
+import asyncio
+import time
+
+import bcrypt
+import numpy as np
+import pytest
+
+from services.auth.core.password import PasswordHasher, verify_password
+
+CONCURRENT_LOGINS = 16
+BCRYPT_COST = 8  # Lower than production (12) to keep the test fast; ratios still hold
+REFRESH_IO_SECONDS = 0.001  # Stand-in for the Redis/DB round trips of a refresh
+
+
+async def _inline_login(password: str, hashed: str) -> bool:
+    """The previous login path: bcrypt blocks the event loop."""
+    return verify_password(password, hashed)
+
+
+async def _refresh_latencies(stop: asyncio.Event) -> list:
+    """Issue refresh-like requests back to back until logins finish."""
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(REFRESH_IO_SECONDS)
+        latencies.append((time.perf_counter() - start - REFRESH_IO_SECONDS) * 1000)
+    return latencies
+
+
+async def _run_burst(login, password: str, hashed: str):
+    stop = asyncio.Event()
+    refresher = asyncio.create_task(_refresh_latencies(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login(password, hashed) for _ in range(CONCURRENT_LOGINS)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    latencies = await refresher
+    assert all(results)
+    return CONCURRENT_LOGINS / elapsed, np.percentile(latencies, 99), max(latencies)
+
+
+@pytest.mark.performance
+class TestPasswordHashingLoad:
+    """Login throughput and refresh latency during a login burst."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_latency_during_login_burst(self):
+        """Refresh p99 should stay low while logins hash on the worker pool."""
+        password = "MyP@ssw0rd!"
+        hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_COST)).decode()
+        hasher = PasswordHasher(max_workers=4, max_pending=CONCURRENT_LOGINS, queue_timeout=30.0)
+
+        try:
+            inline_tput, inline_p99, inline_max = await _run_burst(_inline_login, password, hashed)
+            pool_tput, pool_p99, pool_max = await _run_burst(hasher.verify, password, hashed)
+        finally:
+            hasher.shutdown()
+
+        print(f"\n=== Password Hashing Load ({CONCURRENT_LOGINS} concurrent logins, bcrypt cost {BCRYPT_COST}) ===")
+        print(f"Inline bcrypt: {inline_tput:7.1f} logins/s | refresh p99 {inline_p99:7.2f}ms | max {inline_max:7.2f}ms")
+        print(f"Worker pool:   {pool_tput:7.1f} logins/s | refresh p99 {pool_p99:7.2f}ms | max {pool_max:7.2f}ms")
+
+        assert pool_p99 < inline_p99, "Refresh requests still stall behind bcrypt"
+        assert pool_tput > inline_tput * 0.5, "Worker pool login throughput regressed"
@@ -0,0 +1,223 @@
+"""Unit tests for the buffered audit log writer."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from services.auth.core.audit import AuditEvent, AuditSink
+from services.auth.core.cache import RedisClient
+from services.auth.database import Base
+from services.auth.models.audit_log import AuditLog
+
+OVERFLOW_KEY = "test:audit_overflow"
+DEAD_LETTER_KEY = "test:audit_dead_letter"
+
+
+@pytest.fixture
+async def sessionmaker(tmp_path):
+    """File-backed SQLite database the sink writes to."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+def make_sink(redis: RedisClient, session_factory, **kwargs) -> AuditSink:
+    options = {"batch_size": 3, "flush_interval": 60, "max_queue_size": 100}
+    options.update(kwargs)
+    return AuditSink(
+        redis, session_factory, overflow_key=OVERFLOW_KEY, dead_letter_key=DEAD_LETTER_KEY, **options
+    )
+
+
+def failing_sessionmaker():
+    raise ConnectionError("database unavailable")
+
+
+async def count_logs(session_factory) -> int:
+    async with session_factory() as session:
+        return (await session.execute(select(func.count(AuditLog.id)))).scalar()
+
+
+async def wait_for_logs(session_factory, expected: int, timeout: float = 2.0) -> None:
+    """Wait until the background writer has written ``expected`` logs."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while await count_logs(session_factory) != expected:
+        assert asyncio.get_running_loop().time() < deadline, f"{expected} logs not written"
+        await asyncio.sleep(0.01)
+
+
+class TestBatching:
+    """Events are written in batches, off the request path."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushed_and_rest_drained_on_stop(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test a full batch is written at once and the remainder on shutdown."""
+        sink = make_sink(fake_redis_client, sessionmaker)
+        await sink.start()
+
+        for _ in range(3):
+            await sink.emit(AuditEvent(action="login", user_id=uuid4()))
+        await wait_for_logs(sessionmaker, 3)
+
+        await sink.emit(AuditEvent(action="logout"))
+        await asyncio.sleep(0.05)
+        assert len(sink) == 1
+
+        await sink.stop()
+
+        assert await count_logs(sessionmaker) == 4
+        assert len(sink) == 0
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_interval(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test a lone event is written once the flush interval passes."""
+        sink = make_sink(fake_redis_client, sessionmaker, flush_interval=0.05)
+        await sink.start()
+        event = AuditEvent(action="role_updated", metadata={"new_role": "admin"})
+
+        await sink.emit(event)
+        await wait_for_logs(sessionmaker, 1)
+        await sink.stop()
+
+        async with sessionmaker() as session:
+            log = (await session.execute(select(AuditLog))).scalar_one()
+        assert (log.id, log.action, log.metadata_json) == (event.id, "role_updated", {"new_role": "admin"})
+
+    @pytest.mark.asyncio
+    async def test_written_through_when_not_started(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test events are written immediately without a background writer."""
+        sink = make_sink(fake_redis_client, sessionmaker)
+
+        await sink.emit(AuditEvent(action="login"))
+
+        assert await count_logs(sessionmaker) == 1
+
+
+class TestOverflow:
+    """Events that cannot be written right away are parked in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_spills_to_redis_and_is_replayed(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test events beyond the queue limit survive and reach the database."""
+        sink = make_sink(fake_redis_client, sessionmaker, batch_size=10, max_queue_size=2)
+        await sink.start()
+
+        for _ in range(5):
+            await sink.emit(AuditEvent(action="login"))
+        assert await fake_redis_client.redis.llen(OVERFLOW_KEY) == 3
+
+        sink._wakeup.set()
+        await wait_for_logs(sessionmaker, 5)
+        await sink.stop()
+
+        assert await fake_redis_client.redis.llen(OVERFLOW_KEY) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_kept_until_database_recovers(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test a batch the database rejected is replayed by a later flush."""
+        sink = make_sink(fake_redis_client, failing_sessionmaker)
+        events = [AuditEvent(action="login") for _ in range(2)]
+
+        for event in events:
+            await sink.emit(event)
+        assert await fake_redis_client.redis.llen(OVERFLOW_KEY) == 2
+
+        sink.session_factory = sessionmaker
+        await sink._replay_overflow()
+
+        async with sessionmaker() as session:
+            ids = (await session.execute(select(AuditLog.id).order_by(AuditLog.timestamp))).scalars().all()
+        assert ids == [event.id for event in events]
+
+
+    @pytest.mark.asyncio
+    async def test_failed_replay_keeps_events_in_order(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test a replay the database fails leaves the overflow list as it was."""
+        sink = make_sink(fake_redis_client, failing_sessionmaker)
+        spilled = [AuditEvent(action="login") for _ in range(5)]
+        await fake_redis_client.redis.rpush(OVERFLOW_KEY, *(event.to_json() for event in spilled))
+
+        await sink._replay_overflow()
+
+        overflow = await fake_redis_client.redis.lrange(OVERFLOW_KEY, 0, -1)
+        assert [AuditEvent.from_json(item).id for item in overflow] == [event.id for event in spilled]
+        assert await fake_redis_client.redis.llen(sink.processing_key) == 0
+
+    @pytest.mark.asyncio
+    async def test_events_claimed_by_interrupted_replay_requeued_on_start(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test events left in the processing list by a crash are written after a restart."""
+        sink = make_sink(fake_redis_client, sessionmaker)
+        claimed = [AuditEvent(action="login") for _ in range(2)]
+        spilled = AuditEvent(action="logout")
+        await fake_redis_client.redis.rpush(sink.processing_key, *(event.to_json() for event in claimed))
+        await fake_redis_client.redis.rpush(OVERFLOW_KEY, spilled.to_json())
+
+        await sink.start()
+        assert await fake_redis_client.redis.llen(sink.processing_key) == 0
+        sink._wakeup.set()
+        await wait_for_logs(sessionmaker, 3)
+        await sink.stop()
+
+        async with sessionmaker() as session:
+            ids = (await session.execute(select(AuditLog.id).order_by(AuditLog.timestamp))).scalars().all()
+        assert ids == [event.id for event in [*claimed, spilled]]
+
+
+class TestRejectedEvents:
+    """A row the database rejects does not hold back the rest of its batch."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_event_dead_lettered_and_rest_written(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test the offending event is isolated and every other event is written."""
+        sink = make_sink(fake_redis_client, sessionmaker)
+        existing = AuditEvent(action="login")
+        await sink.emit(existing)
+        batch = [AuditEvent(action="login") for _ in range(6)]
+        batch[3] = AuditEvent(action="login", id=existing.id)
+
+        await sink._write_or_spill(batch)
+
+        assert await count_logs(sessionmaker) == 6
+        assert await fake_redis_client.redis.llen(OVERFLOW_KEY) == 0
+        dead_letters = await fake_redis_client.redis.lrange(DEAD_LETTER_KEY, 0, -1)
+        assert [AuditEvent.from_json(item).id for item in dead_letters] == [existing.id]
+
+    @pytest.mark.asyncio
+    async def test_rejected_event_does_not_block_replay(
+        self, fake_redis_client: RedisClient, sessionmaker
+    ):
+        """Test replay drains the overflow list past an event the database rejects."""
+        sink = make_sink(fake_redis_client, sessionmaker)
+        existing = AuditEvent(action="login")
+        await sink.emit(existing)
+        spilled = [AuditEvent(action="login", id=existing.id)] + [AuditEvent(action="login") for _ in range(4)]
+        await fake_redis_client.redis.rpush(OVERFLOW_KEY, *(event.to_json() for event in spilled))
+
+        await sink._replay_overflow()
+
+        assert await fake_redis_client.redis.llen(OVERFLOW_KEY) == 0
+        assert await fake_redis_client.redis.llen(DEAD_LETTER_KEY) == 1
+        assert await count_logs(sessionmaker) == 5
@@ -0,0 +1,184 @@
+"""Unit tests for batched Redis operations in the JWT service."""
+
+import json
+import pytest
+from prometheus_client import REGISTRY
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from services.auth.config import settings
+from services.auth.core.cache import RedisClient
+from services.auth.services import jwt_service as jwt_service_module
+from services.auth.services.jwt_service import JWTService, REVOKED_TOKEN_TTL_SECONDS
+
+
+@pytest.fixture
+def redis(fake_redis_client: RedisClient, monkeypatch) -> RedisClient:
+    """Route the JWT service's Redis calls to fakeredis."""
+    monkeypatch.setattr(jwt_service_module, "redis_client", fake_redis_client)
+    return fake_redis_client
+
+
+@pytest.fixture
+def jwt_service(jwt_key_files, redis) -> JWTService:
+    """Create JWT service with a mocked refresh token repository."""
+    service = JWTService(MagicMock())
+    service.token_repo = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def round_trips(redis, mocker):
+    """Spy on every way the JWT service can reach Redis."""
+    return {
+        name: mocker.spy(redis, name)
+        for name in ("pipeline", "run_script", "get", "setex", "ttl", "sadd", "expire", "smembers", "delete", "publish")
+    }
+
+
+def _count(round_trips) -> int:
+    return sum(spy.call_count for spy in round_trips.values())
+
+
+class TestTokenIssuance:
+    """Token issuance takes a single Redis round trip."""
+
+    @pytest.mark.asyncio
+    async def test_create_token_pair_single_round_trip(self, jwt_service: JWTService, redis: RedisClient, round_trips):
+        """Test login writes access metadata and family membership in one pipeline."""
+        user_id = uuid4()
+
+        access_token, refresh_token = await jwt_service.create_token_pair(
+            user_id=user_id, email="test@example.com", role="user"
+        )
+
+        assert _count(round_trips) == 1
+        assert round_trips["pipeline"].call_count == 1
+
+        access = await jwt_service.verify_token(access_token)
+        refresh = await jwt_service.verify_token(refresh_token, token_type="refresh")
+        metadata = json.loads(await redis.get(f"token:{access['jti']}"))
+        assert metadata == {"user_id": str(user_id), "valid": True, "type": "access"}
+        assert await redis.smembers(f"token_family:{refresh['fid']}") == {refresh["jti"]}
+        assert await redis.ttl(f"token_family:{refresh['fid']}") > 0
+
+    @pytest.mark.asyncio
+    async def test_create_access_token_single_round_trip(self, jwt_service: JWTService, round_trips):
+        """Test access token issuance is one pipelined write."""
+        await jwt_service.create_access_token(user_id=uuid4(), email="test@example.com", role="admin")
+
+        assert _count(round_trips) == 1
+
+    @pytest.mark.asyncio
+    async def test_issuance_latency_recorded(self, jwt_service: JWTService):
+        """Test the round trip is observed in the per-operation histogram."""
+        labels = {"operation": "create_token_pair"}
+        before = REGISTRY.get_sample_value("auth_redis_operation_duration_seconds_count", labels) or 0
+
+        await jwt_service.create_token_pair(user_id=uuid4(), email="test@example.com", role="user")
+
+        assert REGISTRY.get_sample_value("auth_redis_operation_duration_seconds_count", labels) == before + 1
+
+
+class TestRevocation:
+    """Revocation takes a single Redis round trip, whatever the family size."""
+
+    @pytest.mark.asyncio
+    async def test_revoke_token(self, jwt_service: JWTService, redis: RedisClient, round_trips):
+        """Test single-token revocation invalidates metadata, keeps its TTL and notifies verifiers."""
+        _, jti = await jwt_service.create_access_token(user_id=uuid4(), email="test@example.com", role="user")
+        ttl_before = await redis.ttl(f"token:{jti}")
+        pubsub = redis.redis.pubsub()
+        await pubsub.subscribe(settings.TOKEN_REVOCATION_CHANNEL)
+        round_trips_before = _count(round_trips)
+
+        await jwt_service.revoke_token(jti)
+
+        assert _count(round_trips) == round_trips_before + 1
+        assert json.loads(await redis.get(f"token:{jti}"))["valid"] is False
+        assert 0 < await redis.ttl(f"token:{jti}") <= ttl_before
+        assert REVOKED_TOKEN_TTL_SECONDS - 5 <= await redis.ttl(f"revoked:{jti}") <= REVOKED_TOKEN_TTL_SECONDS
+        assert await jwt_service._is_token_revoked(jti)
+
+        await pubsub.get_message(timeout=1)  # subscribe confirmation
+        message = await pubsub.get_message(timeout=1)
+        assert message["data"] == jti
+        await pubsub.aclose()
+
+    @pytest.mark.asyncio
+    async def test_revoke_unknown_token(self, jwt_service: JWTService, redis: RedisClient):
+        """Test revoking a token without cached metadata still deny-lists it."""
+        await jwt_service.revoke_token("unknown-jti")
+
+        assert await redis.get("token:unknown-jti") is None
+        assert await redis.exists("revoked:unknown-jti") == 1
+
+    @pytest.mark.asyncio
+    async def test_revoke_token_family_single_round_trip(self, jwt_service: JWTService, redis: RedisClient, round_trips):
+        """Test revoking a large family is one scripted round trip."""
+        family_id = "family-1"
+        jtis = [f"jti-{i}" for i in range(50)]
+        for jti in jtis:
+            await jwt_service._add_token_to_family(family_id, jti)
+        round_trips_before = _count(round_trips)
+
+        await jwt_service._revoke_token_family(family_id)
+
+        assert _count(round_trips) == round_trips_before + 1
+        assert round_trips["run_script"].call_count == 1
+        assert await redis.exists(f"token_family:{family_id}") == 0
+        assert await redis.exists(*[f"revoked:{jti}" for jti in jtis]) == len(jtis)
+        jwt_service.token_repo.revoke_family.assert_awaited_once_with(family_id)
+
+    @pytest.mark.asyncio
+    async def test_revocation_script_declares_its_keys(self, jwt_service: JWTService, round_trips):
+        """Test the family set and every explicit token's keys are passed in KEYS."""
+        await jwt_service.revoke_token("jti-1")
+        await jwt_service._revoke_token_family("family-1")
+
+        first, second = round_trips["run_script"].call_args_list
+        assert first.kwargs["keys"] == ["token:jti-1", "revoked:jti-1"]
+        assert second.kwargs["keys"] == ["token_family:family-1"]
+
+    @pytest.mark.asyncio
+    async def test_revoke_empty_family(self, jwt_service: JWTService, redis: RedisClient):
+        """Test revoking an unknown family is a no-op in Redis."""
+        await jwt_service._revoke_token_family("missing-family")
+
+        assert await redis.redis.dbsize() == 0
+        jwt_service.token_repo.revoke_family.assert_awaited_once_with("missing-family")
+
+
+class TestRedisClientBatching:
+    """Tests for RedisClient batch primitives."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_not_sent_on_error(self, fake_redis_client: RedisClient):
+        """Test queued commands are discarded if the block raises."""
+        with pytest.raises(ValueError):
+            async with fake_redis_client.pipeline("test") as pipe:
+                pipe.set("key", "value")
+                raise ValueError("abort")
+
+        assert await fake_redis_client.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_script_registered_once(self, fake_redis_client: RedisClient, mocker):
+        """Test scripts are registered once and reused by SHA."""
+        register = mocker.spy(fake_redis_client.redis, "register_script")
+
+        for _ in range(3):
+            assert await fake_redis_client.run_script("test", "return ARGV[1]", args=["ok"]) == "ok"
+
+        assert register.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_connection(self):
+        """Test batch operations fail clearly before connect()."""
+        client = RedisClient()
+
+        with pytest.raises(RuntimeError):
+            async with client.pipeline("test"):
+                pass
+        with pytest.raises(RuntimeError):
+            await client.run_script("test", "return 1")
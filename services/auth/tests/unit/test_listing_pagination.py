@@ -0,0 +1,192 @@
+"""Unit tests for database-side filtering and keyset pagination of admin listings."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from services.auth.database import Base
+from services.auth.models.audit_log import AuditLog
+from services.auth.models.invite import InviteCode
+from services.auth.models.user import User
+from services.auth.repositories.audit_log_repository import AuditLogRepository
+from services.auth.repositories.invite_repository import InviteCodeRepository
+from services.auth.repositories.pagination import decode_cursor, encode_cursor, split_page
+from services.auth.repositories.user_repository import UserRepository
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+async def fetch_all_pages(list_page, limit: int, sort_attribute: str = "created_at") -> list[list]:
+    """Follow next cursors until the last page, as an API client would."""
+    pages, cursor = [], None
+    while True:
+        rows = await list_page(limit=limit + 1, cursor=cursor)
+        page, cursor = split_page(rows, limit, sort_attribute)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+async def db_session(tmp_path):
+    """File-backed SQLite session; the pooled connections all see its tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'listing.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def users(db_session: AsyncSession) -> list[User]:
+    """Users, several sharing a created_at, so ids have to break ties."""
+    users = [
+        User(
+            email=f"user{i}@example.com",
+            name=f"User {i}",
+            role="admin" if i % 3 == 0 else "user",
+            created_at=CREATED_AT + timedelta(minutes=i // 2)
+        )
+        for i in range(9)
+    ]
+    users.append(User(email="percent%@example.com", name="Percent", created_at=CREATED_AT))
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+class TestCursor:
+    """Cursor encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the position it was built from."""
+        row_id = uuid4()
+
+        assert decode_cursor(encode_cursor(CREATED_AT, row_id)) == (CREATED_AT, row_id)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(CREATED_AT, uuid4())[:-4]])
+    def test_malformed_cursor_rejected(self, cursor: str):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestUserListing:
+    """Filtering and keyset pagination of the admin user listing."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_users_once(self, db_session: AsyncSession, users: list[User]):
+        """Test cursors walk every user exactly once, newest first."""
+        repo = UserRepository(db_session)
+
+        pages = await fetch_all_pages(repo.list_all, limit=3)
+
+        listed = [user.id for page in pages for user in page]
+        expected = sorted(users, key=lambda u: (u.created_at, u.id), reverse=True)
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert listed == [user.id for user in expected]
+
+    @pytest.mark.asyncio
+    async def test_offset_ignored_with_cursor(self, db_session: AsyncSession, users: list[User]):
+        """Test a cursor alone positions the page, whatever offset is passed along."""
+        repo = UserRepository(db_session)
+        _, cursor = split_page(await repo.list_all(limit=4), 3)
+
+        with_offset = await repo.list_all(limit=3, offset=5, cursor=cursor)
+
+        assert [user.id for user in with_offset] == [
+            user.id for user in await repo.list_all(limit=3, cursor=cursor)
+        ]
+        assert [user.id for user in await repo.list_all(limit=3, offset=3)] == [
+            user.id for user in with_offset
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filters_applied_before_paging(self, db_session: AsyncSession, users: list[User]):
+        """Test pages are full and the total counts every match, not just one page."""
+        repo = UserRepository(db_session)
+
+        page, next_cursor = split_page(
+            await repo.list_all(limit=3, role="user", search="USER"), 2
+        )
+
+        assert len(page) == 2 and next_cursor is not None
+        assert all(user.role == "user" for user in page)
+        assert await repo.count(role="user", search="USER") == 6
+
+    @pytest.mark.asyncio
+    async def test_search_wildcards_matched_literally(self, db_session: AsyncSession, users: list[User]):
+        """Test LIKE wildcards in the search term do not match everything."""
+        repo = UserRepository(db_session)
+
+        assert [user.email for user in await repo.list_all(search="%")] == ["percent%@example.com"]
+        assert await repo.count(search="_") == 0
+
+
+class TestInviteListing:
+    """Counting and keyset pagination of invite codes."""
+
+    @pytest.mark.asyncio
+    async def test_count_and_pages_match_status_filter(self, db_session: AsyncSession):
+        """Test the total and the pages only include invites with the status."""
+        now = datetime.now(timezone.utc)
+        creator_id = uuid4()
+        invites = [
+            InviteCode(
+                code=f"code-{i}",
+                creator_id=creator_id,
+                expires_at=now + timedelta(days=7),
+                revoked_at=now if i % 2 else None,
+                created_at=CREATED_AT
+            )
+            for i in range(7)
+        ]
+        db_session.add_all(invites)
+        await db_session.commit()
+        repo = InviteCodeRepository(db_session)
+
+        pages = await fetch_all_pages(
+            lambda **kwargs: repo.list_all(status_filter="revoked", **kwargs), limit=2
+        )
+
+        assert await repo.count(status_filter="revoked") == 3
+        assert await repo.count() == 7
+        assert sorted(invite.code for page in pages for invite in page) == [
+            "code-1", "code-3", "code-5"
+        ]
+
+
+class TestAuditLogListing:
+    """Keyset pagination of audit logs."""
+
+    @pytest.mark.asyncio
+    async def test_user_logs_paged_by_cursor(self, db_session: AsyncSession):
+        """Test a user's logs are walked once with cursors."""
+        user_id = uuid4()
+        db_session.add_all(
+            AuditLog(
+                user_id=user_id if i < 5 else uuid4(),
+                action="login" if i % 2 else "logout",
+                timestamp=CREATED_AT + timedelta(seconds=i // 2)
+            )
+            for i in range(8)
+        )
+        await db_session.commit()
+        repo = AuditLogRepository(db_session)
+
+        pages = await fetch_all_pages(
+            lambda **kwargs: repo.get_user_logs(user_id, **kwargs), limit=2, sort_attribute="timestamp"
+        )
+        login_pages = await fetch_all_pages(
+            lambda **kwargs: repo.get_logs_by_action("login", **kwargs), limit=3, sort_attribute="timestamp"
+        )
+
+        logs = [log for page in pages for log in page]
+        assert len(logs) == len({log.id for log in logs}) == 5
+        assert [log.timestamp for log in logs] == sorted((log.timestamp for log in logs), reverse=True)
+        assert sum(len(page) for page in login_pages) == 4
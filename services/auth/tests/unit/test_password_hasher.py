@@ -0,0 +1,173 @@
+"""Unit tests for the async password hashing pool."""
+
+import asyncio
+import threading
+import bcrypt
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+
+from services.auth.core import password as password_module
+from services.auth.core.exceptions import AuthenticationError, PasswordHasherBusyError
+from services.auth.core.password import (
+    PasswordHasher,
+    hash_password,
+    verify_and_rehash_password,
+)
+from services.auth.schemas.auth import UserLoginRequest
+from services.auth.services import auth_service as auth_service_module
+from services.auth.services.auth_service import AuthService
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    """Use a low bcrypt cost so tests run quickly."""
+    monkeypatch.setattr(password_module, "BCRYPT_ROUNDS", 5)
+
+
+@pytest.fixture
+def hasher():
+    """Create a small password hasher and stop its workers afterwards."""
+    pool = PasswordHasher(max_workers=2, max_pending=4, queue_timeout=1.0)
+    yield pool
+    pool.shutdown()
+
+
+def _hash_with_cost(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+class TestPasswordHasher:
+    """Test hashing on the worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, hasher: PasswordHasher):
+        """Test hashes produced on the pool verify correctly."""
+        hashed = await hasher.hash("MyP@ssw0rd!")
+
+        assert hashed.startswith("$2b$05$")
+        assert await hasher.verify("MyP@ssw0rd!", hashed) is True
+        assert await hasher.verify("wrong", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop(self, hasher: PasswordHasher, monkeypatch):
+        """Test bcrypt runs on a dedicated worker thread."""
+        threads = []
+        monkeypatch.setattr(
+            password_module, "hash_password",
+            lambda password: threads.append(threading.current_thread().name) or "hashed"
+        )
+
+        await hasher.hash("MyP@ssw0rd!")
+
+        assert threads[0].startswith("password-hash")
+
+    @pytest.mark.asyncio
+    async def test_back_pressure_rejects_when_saturated(self, monkeypatch):
+        """Test callers are rejected once max_pending jobs are admitted."""
+        hasher = PasswordHasher(max_workers=1, max_pending=1, queue_timeout=0.05)
+        release = threading.Event()
+        monkeypatch.setattr(password_module, "hash_password", lambda password: release.wait(5) and "hashed")
+        labels = {"operation": "hash"}
+        rejected_before = REGISTRY.get_sample_value("auth_password_hash_rejected_total", labels) or 0
+
+        first = asyncio.create_task(hasher.hash("one"))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(PasswordHasherBusyError):
+                await hasher.hash("two")
+        finally:
+            release.set()
+            assert await first == "hashed"
+            hasher.shutdown()
+
+        assert REGISTRY.get_sample_value("auth_password_hash_rejected_total", labels) == rejected_before + 1
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_drains(self, hasher: PasswordHasher):
+        """Test queue depth and in-progress gauges return to zero."""
+        hashed = _hash_with_cost("MyP@ssw0rd!", 4)
+
+        await asyncio.gather(*(hasher.verify("MyP@ssw0rd!", hashed) for _ in range(8)))
+
+        assert REGISTRY.get_sample_value("auth_password_hash_queue_depth") == 0
+        assert REGISTRY.get_sample_value("auth_password_hash_in_progress") == 0
+
+
+class TestRehash:
+    """Test transparent rehash of outdated hashes."""
+
+    def test_outdated_hash_is_upgraded(self):
+        """Test a valid password with a weak hash yields a new hash."""
+        is_valid, new_hash = verify_and_rehash_password("MyP@ssw0rd!", _hash_with_cost("MyP@ssw0rd!", 4))
+
+        assert is_valid is True
+        assert new_hash.startswith("$2b$05$")
+
+    def test_current_hash_not_rehashed(self):
+        """Test a hash at the current cost is kept."""
+        assert verify_and_rehash_password("MyP@ssw0rd!", hash_password("MyP@ssw0rd!")) == (True, None)
+
+    def test_invalid_password_not_rehashed(self):
+        """Test a wrong password never produces a new hash."""
+        assert verify_and_rehash_password("wrong", _hash_with_cost("MyP@ssw0rd!", 4)) == (False, None)
+
+
+class TestLoginRehash:
+    """Test AuthService.login upgrades weak hashes."""
+
+    @pytest.fixture
+    def auth_service(self, hasher: PasswordHasher, monkeypatch):
+        """Create auth service with mocked repositories."""
+        monkeypatch.setattr(auth_service_module, "password_hasher", hasher)
+        service = AuthService(AsyncMock())
+        service.user_repo = AsyncMock()
+        return service
+
+    def _user(self, password_hash: str):
+        user = MagicMock(id=uuid4(), email="test@example.com", role="user", password_hash=password_hash)
+        user.name = "Test User"
+        user.is_deleted.return_value = False
+        return user
+
+    @pytest.mark.asyncio
+    async def test_login_stores_rehashed_password(self, auth_service: AuthService):
+        """Test login with an outdated hash persists an upgraded one."""
+        user = self._user(_hash_with_cost("MyP@ssw0rd!", 4))
+        auth_service.user_repo.get_by_email.return_value = user
+
+        await auth_service.login(UserLoginRequest(email="test@example.com", password="MyP@ssw0rd!"))
+
+        fields = auth_service.user_repo.update_fields.await_args.kwargs
+        assert "last_login" in fields
+        assert fields["password_hash"].startswith("$2b$05$")
+
+    @pytest.mark.asyncio
+    async def test_login_keeps_current_hash(self, auth_service: AuthService):
+        """Test login with a current hash only updates last_login."""
+        auth_service.user_repo.get_by_email.return_value = self._user(hash_password("MyP@ssw0rd!"))
+
+        await auth_service.login(UserLoginRequest(email="test@example.com", password="MyP@ssw0rd!"))
+
+        assert set(auth_service.user_repo.update_fields.await_args.kwargs) == {"last_login"}
+
+    @pytest.mark.asyncio
+    async def test_login_wrong_password(self, auth_service: AuthService):
+        """Test wrong password is rejected without touching the user row."""
+        auth_service.user_repo.get_by_email.return_value = self._user(_hash_with_cost("MyP@ssw0rd!", 4))
+
+        with pytest.raises(AuthenticationError):
+            await auth_service.login(UserLoginRequest(email="test@example.com", password="wrong"))
+
+        auth_service.user_repo.update_fields.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_login_busy_propagates(self, auth_service: AuthService, hasher: PasswordHasher, mocker):
+        """Test a saturated pool surfaces as PasswordHasherBusyError, not a login failure."""
+        auth_service.user_repo.get_by_email.return_value = self._user(hash_password("MyP@ssw0rd!"))
+        mocker.patch.object(hasher, "verify_and_rehash", side_effect=PasswordHasherBusyError("busy"))
+
+        with pytest.raises(PasswordHasherBusyError):
+            await auth_service.login(UserLoginRequest(email="test@example.com", password="MyP@ssw0rd!"))
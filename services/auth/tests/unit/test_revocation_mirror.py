@@ -0,0 +1,174 @@
+"""Unit tests for the in-process revocation mirror."""
+
+import asyncio
+import time
+import pytest
+from prometheus_client import REGISTRY
+from unittest.mock import AsyncMock, MagicMock
+
+from services.auth.core.cache import RedisClient
+from services.auth.core.revocation import RevocationMirror
+from services.auth.services import jwt_service as jwt_service_module
+from services.auth.services.jwt_service import JWTService
+
+CHANNEL = "test:token_revocations"
+
+
+@pytest.fixture
+def redis(fake_redis_client: RedisClient, monkeypatch) -> RedisClient:
+    """Route the JWT service's Redis calls to fakeredis."""
+    monkeypatch.setattr(jwt_service_module, "redis_client", fake_redis_client)
+    return fake_redis_client
+
+
+@pytest.fixture
+async def mirror(redis: RedisClient, monkeypatch):
+    """Revocation mirror over fakeredis, installed as the JWT service's mirror."""
+    mirror = RevocationMirror(
+        redis,
+        channel=CHANNEL,
+        key_prefix="revoked:",
+        entry_ttl=3600,
+        resync_interval=3600,
+        reconnect_delay=0.01,
+    )
+    monkeypatch.setattr(jwt_service_module, "revocation_mirror", mirror)
+    monkeypatch.setattr(jwt_service_module.settings, "TOKEN_REVOCATION_CHANNEL", CHANNEL)
+    yield mirror
+    await mirror.stop()
+
+
+async def _wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+def _lookups(source: str) -> float:
+    return REGISTRY.get_sample_value("auth_revocation_mirror_lookups_total", {"source": source}) or 0.0
+
+
+class TestResync:
+    """Full resync from the Redis deny-list."""
+
+    @pytest.mark.asyncio
+    async def test_loads_existing_revocations(self, mirror: RevocationMirror, redis: RedisClient):
+        """Test that deny-list keys present before startup are mirrored."""
+        await redis.setex("revoked:jti-1", 600, "1")
+        await redis.setex("revoked:jti-2", 600, "1")
+        await redis.setex("token:jti-3", 600, "{}")
+
+        await mirror.resync("startup")
+
+        assert len(mirror) == 2
+        assert mirror.is_revoked("jti-1")
+        assert not mirror.is_revoked("jti-3")
+
+    @pytest.mark.asyncio
+    async def test_entries_keep_redis_ttl(self, mirror: RevocationMirror, redis: RedisClient):
+        """Test that a mirrored entry expires when its deny-list key does."""
+        await redis.setex("revoked:short", 1, "1")
+        await mirror.resync("startup")
+
+        assert mirror.is_revoked("short")
+
+        mirror._expiry_by_jti["short"] = time.time() - 1
+
+        assert not mirror.is_revoked("short")
+        assert len(mirror) == 0
+
+    @pytest.mark.asyncio
+    async def test_resync_drops_removed_entries(self, mirror: RevocationMirror, redis: RedisClient):
+        """Test that a resync replaces the mirror rather than merging into it."""
+        mirror.add("stale")
+
+        await mirror.resync("periodic")
+
+        assert not mirror.is_revoked("stale")
+
+
+class TestSync:
+    """Background subscription and reconnects."""
+
+    @pytest.mark.asyncio
+    async def test_notifications_applied(self, mirror: RevocationMirror, redis: RedisClient):
+        """Test that revocations published after startup reach the mirror."""
+        await mirror.start()
+        await _wait_until(lambda: mirror.synced)
+
+        await redis.redis.publish(CHANNEL, "published-jti")
+
+        await _wait_until(lambda: "published-jti" in mirror._expiry_by_jti)
+        assert mirror.is_revoked("published-jti")
+        assert REGISTRY.get_sample_value("auth_revocation_mirror_synced") == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resyncs(self, mirror: RevocationMirror, redis: RedisClient):
+        """Test that the mirror falls out of sync on errors and resyncs on reconnect."""
+        connection = redis.redis
+        redis.redis = None
+        before = REGISTRY.get_sample_value("auth_revocation_mirror_resyncs_total", {"reason": "reconnect"}) or 0.0
+
+        await mirror.start()
+        await asyncio.sleep(0.05)
+        assert not mirror.synced
+
+        await connection.setex("revoked:missed-jti", 600, "1")
+        redis.redis = connection
+
+        await _wait_until(lambda: mirror.synced)
+        assert mirror.is_revoked("missed-jti")
+        assert REGISTRY.get_sample_value("auth_revocation_mirror_resyncs_total", {"reason": "reconnect"}) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_stop_marks_unsynced(self, mirror: RevocationMirror):
+        """Test that a stopped mirror is no longer trusted."""
+        await mirror.start()
+        await _wait_until(lambda: mirror.synced)
+
+        await mirror.stop()
+
+        assert not mirror.synced
+
+
+class TestRevocationChecks:
+    """JWT service revocation checks against the mirror."""
+
+    @pytest.fixture
+    def jwt_service(self) -> JWTService:
+        service = JWTService.__new__(JWTService)
+        service.token_repo = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_synced_mirror_skips_redis(self, jwt_service: JWTService, mirror: RevocationMirror, redis: RedisClient, mocker):
+        """Test that revocation checks make no Redis round trip while in sync."""
+        await redis.setex("revoked:revoked-jti", 600, "1")
+        await mirror.start()
+        await _wait_until(lambda: mirror.synced)
+        exists = mocker.spy(redis, "exists")
+
+        assert await jwt_service._is_token_revoked("revoked-jti")
+        assert not await jwt_service._is_token_revoked("valid-jti")
+        assert exists.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_unsynced_mirror_falls_back_to_redis(self, jwt_service: JWTService, mirror: RevocationMirror, redis: RedisClient):
+        """Test that Redis answers while the mirror is not in sync."""
+        await redis.setex("revoked:revoked-jti", 600, "1")
+        before = _lookups("redis")
+
+        assert await jwt_service._is_token_revoked("revoked-jti")
+        assert _lookups("redis") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_local_revocations_visible_immediately(self, jwt_service: JWTService, mirror: RevocationMirror, redis: RedisClient):
+        """Test that tokens revoked by this process are mirrored without waiting for pub/sub."""
+        await redis.sadd("token_family:family-1", "member-1", "member-2")
+
+        await jwt_service.revoke_token("single-jti")
+        await jwt_service._revoke_token_family("family-1")
+
+        assert {"single-jti", "member-1", "member-2"} <= set(mirror._expiry_by_jti)
@@ -0,0 +1,169 @@
+"""Unit tests for the process-wide JWT key store."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import jwt as pyjwt
+import pytest
+
+from services.auth.config import settings
+from services.auth.core import keys as keys_module
+from services.auth.core.cache import RedisClient
+from services.auth.core.exceptions import InvalidTokenError
+from services.auth.core.keys import BACKUP_TIMESTAMP_FORMAT, SigningKeyStore, key_id
+from services.auth.services import jwt_service as jwt_service_module
+from services.auth.services import key_rotation as key_rotation_module
+from services.auth.services.jwt_service import JWTService
+from services.auth.services.key_rotation import KeyRotationService
+
+
+@pytest.fixture
+def key_store(jwt_key_files, monkeypatch) -> SigningKeyStore:
+    """Fresh key store shared by the JWT service and key rotation."""
+    store = SigningKeyStore(reload_interval=3600)
+    monkeypatch.setattr(jwt_service_module, "signing_key_store", store)
+    monkeypatch.setattr(key_rotation_module, "signing_key_store", store)
+    return store
+
+
+@pytest.fixture
+def redis(fake_redis_client: RedisClient, monkeypatch) -> RedisClient:
+    """Route Redis calls of the JWT service and key rotation to fakeredis."""
+    monkeypatch.setattr(jwt_service_module, "redis_client", fake_redis_client)
+    monkeypatch.setattr(key_rotation_module, "redis_client", fake_redis_client)
+    return fake_redis_client
+
+
+def make_jwt_service() -> JWTService:
+    service = JWTService(MagicMock())
+    service.token_repo = AsyncMock()
+    return service
+
+
+def write_key_pair(private_path: str, public_path: str) -> None:
+    private_pem, public_pem = KeyRotationService().generate_key_pair()
+    with open(private_path, "wb") as f:
+        f.write(private_pem)
+    with open(public_path, "wb") as f:
+        f.write(public_pem)
+
+
+class TestKeyLoading:
+    """Keys are parsed once per process, not per request."""
+
+    def test_keys_loaded_once(self, key_store: SigningKeyStore, mocker):
+        """Test many JWT services share one parsed key pair."""
+        load_private = mocker.spy(keys_module.serialization, "load_pem_private_key")
+
+        services = [make_jwt_service() for _ in range(10)]
+
+        assert load_private.call_count == 1
+        assert all(service.private_key is services[0].private_key for service in services)
+
+    @pytest.mark.asyncio
+    async def test_token_tagged_with_kid(self, key_store: SigningKeyStore, redis: RedisClient):
+        """Test the kid header is the RFC 7638 thumbprint verifiers compute."""
+        cortex_keys = pytest.importorskip("cortex_auth.keys")
+        token, _ = await make_jwt_service().create_access_token(
+            user_id=uuid4(), email="test@example.com", role="user"
+        )
+
+        with open(settings.JWT_PUBLIC_KEY_PATH) as f:
+            expected = cortex_keys.key_id(cortex_keys.parse_public_key(f.read()))
+        assert pyjwt.get_unverified_header(token)["kid"] == expected == key_store.current().kid
+
+    def test_mismatched_files_keep_previous_keys(self, key_store: SigningKeyStore):
+        """Test a half-written rotation does not replace working keys."""
+        kid = key_store.current().kid
+        # Only the private key of the next pair has been written so far
+        private_pem, _ = KeyRotationService().generate_key_pair()
+        with open(settings.JWT_PRIVATE_KEY_PATH, "wb") as f:
+            f.write(private_pem)
+
+        key_store.reload()
+
+        assert key_store.current().kid == kid
+
+
+class TestKeyRotation:
+    """Rotations are swapped in without dropping tokens signed before them."""
+
+    @pytest.mark.asyncio
+    async def test_rotation_hot_swaps_keys(self, key_store: SigningKeyStore, redis: RedisClient):
+        """Test new tokens use the new key while old tokens still verify."""
+        jwt_service = make_jwt_service()
+        old_token, _ = await jwt_service.create_access_token(
+            user_id=uuid4(), email="test@example.com", role="user"
+        )
+        old_kid = pyjwt.get_unverified_header(old_token)["kid"]
+
+        assert await KeyRotationService().rotate_keys() is True
+
+        new_token, _ = await jwt_service.create_access_token(
+            user_id=uuid4(), email="test@example.com", role="user"
+        )
+        new_kid = pyjwt.get_unverified_header(new_token)["kid"]
+        assert new_kid != old_kid
+        assert jwt_service.decode_token(old_token, "access")["sub"]
+        assert jwt_service.decode_token(new_token, "access")["sub"]
+
+        jwks = await KeyRotationService().get_jwks()
+        assert [key["kid"] for key in jwks["keys"]] == [new_kid, old_kid]
+
+    @pytest.mark.asyncio
+    async def test_rotation_by_another_process(self, key_store: SigningKeyStore, redis: RedisClient):
+        """Test a token with an unknown kid triggers a reload of the key files."""
+        jwt_service = make_jwt_service()
+        write_key_pair(settings.JWT_PRIVATE_KEY_PATH, settings.JWT_PUBLIC_KEY_PATH)
+
+        # Signed by the other process with the new key
+        other_store = SigningKeyStore()
+        token = pyjwt.encode(
+            {
+                "sub": str(uuid4()),
+                "token_type": "access",
+                "iss": settings.JWT_ISSUER,
+                "aud": settings.JWT_AUDIENCE,
+                "exp": datetime.utcnow() + timedelta(minutes=5),
+            },
+            other_store.current().private_key,
+            algorithm="RS256",
+            headers={"kid": other_store.current().kid},
+        )
+
+        assert jwt_service.decode_token(token, "access")
+        assert key_store.current().kid == other_store.current().kid
+
+    def test_retired_keys_loaded_from_backups(self, key_store: SigningKeyStore):
+        """Test a restarted process trusts keys retired within the overlap window."""
+        backup_dir = keys_module.get_key_backup_dir()
+        now = datetime.utcnow()
+        recent = backup_dir / (now - timedelta(days=1)).strftime(BACKUP_TIMESTAMP_FORMAT)
+        expired = backup_dir / (
+            now - timedelta(days=settings.JWT_KEY_OVERLAP_DAYS + 1)
+        ).strftime(BACKUP_TIMESTAMP_FORMAT)
+        for directory in (recent, expired):
+            directory.mkdir(parents=True)
+            write_key_pair(str(directory / "private_key.pem"), str(directory / "public_key.pem"))
+
+        kids = list(SigningKeyStore().current().verification_keys)
+
+        def backup_kid(directory):
+            with open(directory / "public_key.pem", "rb") as f:
+                return key_id(keys_module.serialization.load_pem_public_key(f.read()))
+
+        assert kids == [key_store.current().kid, backup_kid(recent)]
+
+    def test_unknown_kid_rejected(self, key_store: SigningKeyStore):
+        """Test a token signed with an untrusted key fails verification."""
+        other_private, _ = KeyRotationService().generate_key_pair()
+        token = pyjwt.encode(
+            {"sub": "x", "token_type": "access"},
+            other_private,
+            algorithm="RS256",
+            headers={"kid": "unknown"},
+        )
+
+        with pytest.raises(InvalidTokenError):
+            make_jwt_service().decode_token(token, "access")
@@ -0,0 +1,223 @@
+"""Unit tests for batch token introspection."""
+
+import jwt as pyjwt
+import pytest
+from base64 import b64encode
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.auth.api.v1 import auth as auth_module
+from services.auth.config import settings
+from services.auth.core.cache import RedisClient
+from services.auth.core.revocation import RevocationMirror
+from services.auth.database import get_db
+from services.auth.services import jwt_service as jwt_service_module
+from services.auth.services.jwt_service import JWTService
+from services.auth.services.token_introspection import TokenIntrospectionService
+
+
+@pytest.fixture
+def redis(fake_redis_client: RedisClient, monkeypatch) -> RedisClient:
+    """Route the JWT service's Redis calls to fakeredis, with an unsynced mirror."""
+    monkeypatch.setattr(jwt_service_module, "redis_client", fake_redis_client)
+    monkeypatch.setattr(
+        jwt_service_module,
+        "revocation_mirror",
+        RevocationMirror(fake_redis_client, channel="test", key_prefix="revoked:", entry_ttl=3600),
+    )
+    return fake_redis_client
+
+
+@pytest.fixture
+def jwt_service(jwt_key_files, redis) -> JWTService:
+    """Create JWT service with a mocked refresh token repository."""
+    service = JWTService(MagicMock())
+    service.token_repo = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def introspection_service(jwt_service: JWTService) -> TokenIntrospectionService:
+    """Create token introspection service instance."""
+    return TokenIntrospectionService(jwt_service=jwt_service)
+
+
+async def _access_token(jwt_service: JWTService, **claims) -> tuple[str, str]:
+    return await jwt_service.create_access_token(
+        user_id=uuid4(), email="user@example.com", role="user", **claims
+    )
+
+
+class TestIntrospectBatch:
+    """Batch introspection returns per-token results."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_request_order(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService):
+        """Test that active and inactive tokens are reported per token, in order."""
+        valid, valid_jti = await _access_token(jwt_service, permissions=["read:profile"])
+        revoked, revoked_jti = await _access_token(jwt_service)
+        await jwt_service.revoke_token(revoked_jti)
+        refresh = await jwt_service.create_refresh_token(user_id=uuid4())
+
+        results = await introspection_service.introspect_batch([valid, revoked, "invalid.token.here", refresh])
+
+        assert [result["active"] for result in results] == [True, False, False, True]
+        assert results[0]["jti"] == valid_jti
+        assert results[0]["scope"] == "read:profile"
+        assert results[1] == {"active": False}
+        assert results[3]["token_type"] == "refresh"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_inactive(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService):
+        """Test that an expired token is inactive without affecting the rest of the batch."""
+        valid, _ = await _access_token(jwt_service)
+        expired = pyjwt.encode(
+            {"sub": str(uuid4()), "token_type": "access", "jti": "expired", "exp": 1,
+             "aud": jwt_service_module.settings.JWT_AUDIENCE, "iss": jwt_service_module.settings.JWT_ISSUER},
+            jwt_service.private_key,
+            algorithm=jwt_service.algorithm,
+        )
+
+        results = await introspection_service.introspect_batch([expired, valid])
+
+        assert [result["active"] for result in results] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_type_hint_mismatch_inactive(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService):
+        """Test that a token of another type than the hint is inactive."""
+        access, _ = await _access_token(jwt_service)
+
+        results = await introspection_service.introspect_batch([access], token_type_hint="refresh")
+
+        assert results == [{"active": False}]
+
+    @pytest.mark.asyncio
+    async def test_each_token_decoded_once(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService, mocker):
+        """Test that tokens are not decoded a second time before verification."""
+        tokens = [(await _access_token(jwt_service))[0] for _ in range(5)]
+        decode = mocker.spy(jwt_service_module.jwt, "decode")
+
+        await introspection_service.introspect_batch(tokens)
+
+        assert decode.call_count == len(tokens)
+
+    @pytest.mark.asyncio
+    async def test_revocation_single_round_trip(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService, redis: RedisClient, mocker):
+        """Test that revocation for the whole batch is resolved with one MGET."""
+        tokens = [(await _access_token(jwt_service))[0] for _ in range(10)]
+        mget = mocker.spy(redis, "mget")
+        exists = mocker.spy(redis, "exists")
+
+        results = await introspection_service.introspect_batch(tokens)
+
+        assert all(result["active"] for result in results)
+        assert mget.call_count == 1
+        assert exists.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_synced_mirror_skips_redis(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService, redis: RedisClient, mocker):
+        """Test that a synced revocation mirror answers without Redis."""
+        valid, _ = await _access_token(jwt_service)
+        revoked, revoked_jti = await _access_token(jwt_service)
+        await jwt_service.revoke_token(revoked_jti)
+        jwt_service_module.revocation_mirror.synced = True
+        mget = mocker.spy(redis, "mget")
+
+        results = await introspection_service.introspect_batch([valid, revoked])
+
+        assert [result["active"] for result in results] == [True, False]
+        assert mget.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_revocation_lookup_failure_fails_closed(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService, redis: RedisClient, mocker):
+        """Test that access tokens are inactive when revocation cannot be checked."""
+        access, _ = await _access_token(jwt_service)
+        refresh = await jwt_service.create_refresh_token(user_id=uuid4())
+        mocker.patch.object(redis, "mget", side_effect=ConnectionError("redis down"))
+
+        results = await introspection_service.introspect_batch([access, refresh])
+
+        assert [result["active"] for result in results] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_single_introspect_uses_batch_path(self, introspection_service: TokenIntrospectionService, jwt_service: JWTService):
+        """Test that introspect() returns the same response as a batch of one."""
+        access, jti = await _access_token(jwt_service)
+
+        result = await introspection_service.introspect(access, token_type_hint="access")
+
+        assert result["active"] is True
+        assert result["jti"] == jti
+        assert result["username"] == "user@example.com"
+
+
+@pytest.fixture
+def introspection_app(monkeypatch) -> FastAPI:
+    """Mount the auth router with one registered client and a stubbed service."""
+    class FakeIntrospectionService:
+        def __init__(self, jwt_service):
+            pass
+
+        async def introspect_batch(self, tokens, token_type_hint=None):
+            return [{"active": False} for _ in tokens]
+
+    monkeypatch.setattr(settings, "INTROSPECTION_CLIENTS", {"gateway": "gateway-secret"})
+    monkeypatch.setattr(auth_module, "JWTService", MagicMock())
+    monkeypatch.setattr(auth_module, "TokenIntrospectionService", FakeIntrospectionService)
+    app = FastAPI()
+    app.include_router(auth_module.router, prefix="/api/v1/auth")
+    app.dependency_overrides[get_db] = lambda: MagicMock()
+    return app
+
+
+def _basic(client_id: str, client_secret: str) -> dict[str, str]:
+    credentials = b64encode(f"{client_id}:{client_secret}".encode()).decode()
+    return {"Authorization": f"Basic {credentials}"}
+
+
+class TestIntrospectBatchEndpoint:
+    """The batch endpoint authenticates its caller as a client before introspecting."""
+
+    def test_registered_client_accepted(self, introspection_app: FastAPI):
+        """Test that a registered client gets one result per token."""
+        client = TestClient(introspection_app)
+
+        response = client.post(
+            "/api/v1/auth/introspect/batch",
+            json={"tokens": ["a.b.c", "d.e.f"]},
+            headers=_basic("gateway", "gateway-secret"),
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"results": [{"active": False}, {"active": False}]}
+
+    def test_unauthenticated_call_rejected(self, introspection_app: FastAPI):
+        """Test that a call without credentials gets 401."""
+        client = TestClient(introspection_app)
+
+        response = client.post("/api/v1/auth/introspect/batch", json={"tokens": ["a.b.c"]})
+
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Basic"
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            _basic("gateway", "wrong-secret"),
+            _basic("unknown", ""),
+            {"Authorization": "Bearer a.b.c"},
+            {"Authorization": "Basic not-base64!"},
+        ],
+    )
+    def test_invalid_credentials_rejected(self, introspection_app: FastAPI, headers):
+        """Test that wrong, unknown or malformed client credentials get 401."""
+        client = TestClient(introspection_app)
+
+        response = client.post(
+            "/api/v1/auth/introspect/batch", json={"tokens": ["a.b.c"]}, headers=headers
+        )
+
+        assert response.status_code == 401
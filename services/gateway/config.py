@@ -75,6 +75,42 @@ class GatewaySettings(BaseSettings):
         description="Path prefixes that bypass authentication"
     )
 
+    # Verified-Token Cache
+    token_cache_enabled: bool = Field(
+        default=True,
+        description="Cache verified access tokens to skip repeated RS256 validation"
+    )
+    token_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of verified tokens kept in the LRU cache"
+    )
+    token_revocation_channel: str = Field(
+        default="auth:token_revocations",
+        description="Redis pub/sub channel on which the auth service publishes revoked JTIs"
+    )
+
+    # Upstream Connection Pools
+    upstream_max_connections: int = Field(
+        default=100,
+        description="Maximum concurrent connections per upstream service"
+    )
+    upstream_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections retained per upstream service"
+    )
+    upstream_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle upstream connection is kept open"
+    )
+    upstream_connect_timeout: float = Field(
+        default=5.0,
+        description="Timeout in seconds for establishing an upstream connection"
+    )
+    upstream_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with upstream services"
+    )
+
     # Monitoring
     metrics_enabled: bool = Field(default=True)
     log_auth_failures: bool = Field(default=True)
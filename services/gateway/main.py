@@ -12,20 +12,26 @@ This gateway provides:
 import httpx
 import logging
 import uvicorn
-from typing import Any, Dict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from prometheus_client import make_asgi_app
 
 from shared.config.settings import settings
 from cortex_auth import require_auth, require_admin, get_current_user
+from cortex_auth import settings as auth_settings
 from cortex_auth.models import User
 
 # Gateway-specific imports
 from .config import settings as gateway_settings
 from .middleware import AuthenticationMiddleware
 from .metrics import auth_metrics
+from .routing import build_route_table
+from .token_cache import RevocationListener, VerifiedTokenCache
+from .upstream import UpstreamPools
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +40,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open pooled upstream clients and the revocation listener for the app's lifetime."""
+    await upstream_pools.start()
+    if revocation_listener is not None:
+        await revocation_listener.start()
+    yield
+    if revocation_listener is not None:
+        await revocation_listener.stop()
+    await upstream_pools.close()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Cortex API Gateway",
@@ -41,8 +60,71 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+)
+
+# Service routing configuration
+SERVICE_ROUTES = {
+    "/auth": settings.auth_service_url,
+    "/financial": settings.financial_service_url,
+    "/hr": settings.hr_service_url,
+    "/legal": settings.legal_service_url,
+    "/procurement": settings.procurement_service_url,
+    "/documents": settings.documents_service_url,
+    "/ai": settings.ai_service_url,
+}
+
+# Services that need full path preservation (don't strip prefix)
+PRESENTATION_SERVICE_PREFIXES = ["/api/v1/ppt", "/api/export-as-pdf", "/api/v1/webhook", "/api/v1/mock", "/static", "/app_data"]
+
+PRESENTATION_SERVICE = "presentation"
+
+# Connection-scoped headers that must not be forwarded by a proxy (RFC 9110 §7.6.1)
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+})
+
+# Routing and public/auth classification, compiled once at startup
+route_table = build_route_table(
+    service_routes=[
+        (route_prefix, route_prefix.strip("/"), url)
+        for route_prefix, url in SERVICE_ROUTES.items()
+    ],
+    passthrough_routes=[
+        (prefix, PRESENTATION_SERVICE, settings.presentation_service_url)
+        for prefix in PRESENTATION_SERVICE_PREFIXES
+    ],
+    public_endpoints=gateway_settings.public_endpoints,
+    public_prefixes=gateway_settings.public_path_prefixes,
 )
 
+# One persistent connection pool per upstream service
+upstream_pools = UpstreamPools({
+    **{route_prefix.strip("/"): url for route_prefix, url in SERVICE_ROUTES.items()},
+    PRESENTATION_SERVICE: settings.presentation_service_url,
+})
+
+# Verified-token cache, kept coherent with revocations published by the auth service
+token_cache = None
+revocation_listener = None
+if gateway_settings.token_cache_enabled:
+    token_cache = VerifiedTokenCache(
+        max_entries=gateway_settings.token_cache_max_entries,
+        clock_skew_seconds=auth_settings.auth_clock_skew_seconds,
+    )
+    revocation_listener = RevocationListener(
+        token_cache,
+        redis_url=settings.redis_url,
+        channel=gateway_settings.token_revocation_channel,
+    )
+
 # Configure CORS with environment-based origins
 app.add_middleware(
     CORSMiddleware,
@@ -55,7 +137,11 @@ app.add_middleware(
 
 # Add authentication middleware (with canary deployment support)
 if gateway_settings.auth_enabled:
-    app.add_middleware(AuthenticationMiddleware)
+    app.add_middleware(
+        AuthenticationMiddleware,
+        route_table=route_table,
+        token_cache=token_cache,
+    )
     logger.info(
         f"Authentication middleware enabled "
         f"(canary: {gateway_settings.canary_enabled}, "
@@ -66,20 +152,6 @@ if gateway_settings.auth_enabled:
 metrics_app = make_asgi_app()
 app.mount("/metrics", metrics_app)
 
-# Service routing configuration
-SERVICE_ROUTES = {
-    "/auth": settings.auth_service_url,
-    "/financial": settings.financial_service_url,
-    "/hr": settings.hr_service_url,
-    "/legal": settings.legal_service_url,
-    "/procurement": settings.procurement_service_url,
-    "/documents": settings.documents_service_url,
-    "/ai": settings.ai_service_url,
-}
-
-# Services that need full path preservation (don't strip prefix)
-PRESENTATION_SERVICE_PREFIXES = ["/api/v1/ppt", "/api/export-as-pdf", "/api/v1/webhook", "/api/v1/mock", "/static", "/app_data"]
-
 
 @app.get("/")
 async def root():
@@ -183,127 +255,150 @@ async def gateway_proxy(request: Request, path: str):
     """
     logger.info(f"🔍 Gateway received request: {request.method} /{path}")
 
-    # Check if this is a presentation service request (preserve full path)
-    service_url = None
-    service_path = None
-
-    for prefix in PRESENTATION_SERVICE_PREFIXES:
-        if f"/{path}".startswith(prefix):
-            service_url = settings.presentation_service_url
-            service_path = f"/{path}"  # Keep full path
-            break
-
-    # If not presentation service, check other services
-    if not service_url:
-        for route_prefix, url in SERVICE_ROUTES.items():
-            if f"/{path}".startswith(route_prefix):
-                service_url = url
-                # Remove the service prefix from the path
-                service_path = f"/{path}".replace(route_prefix, "", 1)
-                if not service_path:
-                    service_path = "/"
-                break
-
-    if not service_url:
+    # Reuse the match computed by the auth middleware when available
+    route = getattr(request.state, "route", None) or route_table.lookup(f"/{path}")
+
+    if route.upstream is None:
         raise HTTPException(status_code=404, detail="Service not found")
 
+    service = route.upstream.service
+
     # Build the target URL
-    target_url = f"{service_url}{service_path}"
+    target_url = route.target_url
     logger.info(f"🎯 Routing to: {target_url}")
 
     # Get query parameters
     query_params = dict(request.query_params)
 
-    # Get headers (excluding host)
-    headers = dict(request.headers)
+    # Get headers (excluding host and hop-by-hop headers)
+    headers = _forwardable_headers(request.headers.items())
     headers.pop("host", None)
 
     # Forward authentication cookies to downstream services
     # This ensures that authenticated requests maintain their auth context
     # The downstream services can use cortex-auth to validate the same token
 
-    # Get body for POST/PUT/PATCH requests
+    # Stream the body upstream for POST/PUT/PATCH requests instead of buffering it
     body = None
     if request.method in ["POST", "PUT", "PATCH"]:
-        body = await request.body()
+        body = request.stream()
+
+    # Keeps the pooled client tracked until the relayed response is closed
+    exit_stack = AsyncExitStack()
+
+    # Check if this is a streaming endpoint
+    is_streaming = "stream" in path
+    logger.info(f"🔎 Streaming check: path='{path}', is_streaming={is_streaming}")
 
     try:
-        # Check if this is a streaming endpoint
-        is_streaming = "stream" in path
-        logger.info(f"🔎 Streaming check: path='{path}', is_streaming={is_streaming}")
-
-        if is_streaming:
-            logger.info(f"🌊 STREAMING REQUEST DETECTED: {path} -> {target_url}")
-            # For streaming endpoints, use StreamingResponse
-            async def stream_proxy():
-                logger.info(f"🚀 Starting stream proxy for {target_url}")
-                chunk_count = 0
-                async with httpx.AsyncClient(follow_redirects=True) as client:
-                    async with client.stream(
-                        method=request.method,
-                        url=target_url,
-                        params=query_params,
-                        headers=headers,
-                        content=body,
-                        timeout=60.0,  # Longer timeout for streaming
-                    ) as response:
-                        logger.info(f"📡 Stream response status: {response.status_code}")
-                        async for chunk in response.aiter_bytes():
-                            chunk_count += 1
-                            if chunk_count % 10 == 0:
-                                logger.info(f"📦 Streamed {chunk_count} chunks so far...")
-                            yield chunk
-                logger.info(f"✅ Stream completed. Total chunks: {chunk_count}")
-
-            return StreamingResponse(
-                stream_proxy(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",  # Disable buffering in nginx if present
-                }
-            )
-        else:
-            # For regular endpoints
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.request(
-                    method=request.method,
-                    url=target_url,
-                    params=query_params,
-                    headers=headers,
-                    content=body,
-                    timeout=30.0,
-                )
-
-            # Return appropriate response based on content type
-            content_type = response.headers.get("content-type", "")
-
-            # For static files (images, SVG, CSS, JS, etc.), return raw content
-            if any(ct in content_type.lower() for ct in ["image/", "text/css", "text/javascript", "application/javascript", "font/", "application/octet-stream"]):
-                from fastapi.responses import Response
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=content_type,
-                )
-
-            # For JSON responses
-            return JSONResponse(
-                content=response.json() if response.content else None,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-            )
+        client = await exit_stack.enter_async_context(upstream_pools.track(service))
+        upstream_request = client.build_request(
+            method=request.method,
+            url=target_url,
+            params=query_params,
+            headers=headers,
+            content=body,
+            timeout=60.0 if is_streaming else 30.0,  # Longer timeout for streaming
+        )
+        response = await client.send(upstream_request, stream=True)
+        exit_stack.push_async_callback(response.aclose)
     except httpx.TimeoutException:
+        await exit_stack.aclose()
         raise HTTPException(status_code=504, detail="Service timeout")
     except httpx.RequestError as e:
+        await exit_stack.aclose()
         logger.error(f"Error proxying request to {target_url}: {e}")
         raise HTTPException(status_code=503, detail="Service unavailable")
     except Exception as e:
+        await exit_stack.aclose()
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=500, detail="Internal gateway error")
 
+    if is_streaming:
+        logger.info(f"🌊 STREAMING REQUEST DETECTED: {path} -> {target_url}")
+        logger.info(f"📡 Stream response status: {response.status_code}")
+        return _relay_response(
+            response,
+            exit_stack,
+            target_url,
+            log_progress=True,
+            header_overrides={
+                "content-type": "text/event-stream",
+                "cache-control": "no-cache",
+                "x-accel-buffering": "no",  # Disable buffering in nginx if present
+            },
+        )
+
+    # Relay every other response as raw bytes, without decoding or re-serializing it
+    return _relay_response(response, exit_stack, target_url)
+
+
+def _forwardable_headers(items: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Drop hop-by-hop headers, which only apply to a single connection."""
+    return {
+        key: value
+        for key, value in items
+        if key.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+
+def _relay_response(
+    response: httpx.Response,
+    exit_stack: AsyncExitStack,
+    target_url: str,
+    log_progress: bool = False,
+    header_overrides: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """
+    Build a response that streams the upstream body back to the client.
+
+    Upstream headers are copied verbatim (repeated headers such as
+    ``Set-Cookie`` included), minus hop-by-hop headers and any overrides.
+    """
+    header_overrides = header_overrides or {}
+    relay = StreamingResponse(
+        _relay_upstream_body(response, exit_stack, target_url, log_progress),
+        status_code=response.status_code,
+        background=BackgroundTask(exit_stack.aclose),
+    )
+    relay.raw_headers = [
+        (key.lower(), value)
+        for key, value in response.headers.raw
+        if key.decode("latin-1").lower() not in HOP_BY_HOP_HEADERS
+        and key.decode("latin-1").lower() not in header_overrides
+    ] + [
+        (key.encode("latin-1"), value.encode("latin-1"))
+        for key, value in header_overrides.items()
+    ]
+    return relay
+
+
+async def _relay_upstream_body(
+    response: httpx.Response,
+    exit_stack: AsyncExitStack,
+    target_url: str,
+    log_progress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Yield the upstream body exactly as received on the wire.
+
+    ``aiter_raw`` skips content decoding, so compressed bodies are forwarded
+    as-is together with their ``Content-Encoding`` header.
+    """
+    chunk_count = 0
+    try:
+        async for chunk in response.aiter_raw():
+            chunk_count += 1
+            if log_progress and chunk_count % 10 == 0:
+                logger.info(f"📦 Streamed {chunk_count} chunks so far...")
+            yield chunk
+        if log_progress:
+            logger.info(f"✅ Stream completed. Total chunks: {chunk_count}")
+    except httpx.HTTPError as e:
+        logger.error(f"Upstream stream from {target_url} aborted after {chunk_count} chunks: {e}")
+    finally:
+        await exit_stack.aclose()
+
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=settings.gateway_port)
\ No newline at end of file
@@ -23,6 +23,17 @@ canary_requests_total = Counter(
     ["authenticated"]
 )
 
+auth_token_cache_entries = Gauge(
+    "gateway_auth_token_cache_entries",
+    "Number of verified tokens currently cached"
+)
+
+auth_token_cache_evictions_total = Counter(
+    "gateway_auth_token_cache_evictions_total",
+    "Verified-token cache evictions",
+    ["reason"]
+)
+
 active_authenticated_requests = Gauge(
     "gateway_active_authenticated_requests",
     "Number of currently active authenticated requests"
@@ -41,6 +52,24 @@ proxy_duration_seconds = Histogram(
     ["service", "method"]
 )
 
+proxy_upstream_inflight_requests = Gauge(
+    "gateway_proxy_upstream_inflight_requests",
+    "Number of requests currently in flight to each upstream service",
+    ["service"]
+)
+
+proxy_upstream_pool_connections = Gauge(
+    "gateway_proxy_upstream_pool_connections",
+    "Connections held by each upstream pool",
+    ["service", "state"]
+)
+
+proxy_upstream_pool_max_connections = Gauge(
+    "gateway_proxy_upstream_pool_max_connections",
+    "Configured connection limit of each upstream pool",
+    ["service"]
+)
+
 
 class AuthMetrics:
     """Convenience class for accessing auth metrics."""
@@ -48,10 +77,15 @@ class AuthMetrics:
     def __init__(self):
         self.auth_validations_total = auth_validations_total
         self.auth_validation_duration_seconds = auth_validation_duration_seconds
+        self.auth_token_cache_entries = auth_token_cache_entries
+        self.auth_token_cache_evictions_total = auth_token_cache_evictions_total
         self.canary_requests_total = canary_requests_total
         self.active_authenticated_requests = active_authenticated_requests
         self.proxy_requests_total = proxy_requests_total
         self.proxy_duration_seconds = proxy_duration_seconds
+        self.proxy_upstream_inflight_requests = proxy_upstream_inflight_requests
+        self.proxy_upstream_pool_connections = proxy_upstream_pool_connections
+        self.proxy_upstream_pool_max_connections = proxy_upstream_pool_max_connections
 
 
 # Singleton instance
@@ -4,7 +4,8 @@ Authentication middleware for the Gateway service.
 
 import logging
 import random
-from typing import Callable
+import time
+from typing import Callable, Optional
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -13,7 +14,7 @@ from starlette.responses import Response
 from cortex_auth import (
     extract_token_from_cookie,
     decode_token,
-    create_user_from_token,
+    User,
     TokenMissingError,
     TokenExpiredError,
     TokenInvalidError,
@@ -22,6 +23,8 @@ from cortex_auth import (
 from cortex_auth import settings as auth_settings
 from .config import settings as gateway_settings
 from .metrics import auth_metrics
+from .routing import RouteTable, build_route_table
+from .token_cache import VerifiedTokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +39,22 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     - Implements canary deployment (gradual rollout)
     - Tracks authentication metrics
     - Forwards authenticated user to request state
+    - Caches verified tokens to skip repeated RS256 validation
     """
 
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        route_table: Optional[RouteTable] = None,
+        token_cache: Optional[VerifiedTokenCache] = None,
+    ):
         super().__init__(app)
-        self.public_endpoints = set(gateway_settings.public_endpoints)
-        self.public_prefixes = gateway_settings.public_path_prefixes
+        self.token_cache = token_cache
+        self.route_table = route_table or build_route_table(
+            service_routes=[],
+            public_endpoints=gateway_settings.public_endpoints,
+            public_prefixes=gateway_settings.public_path_prefixes,
+        )
 
         logger.info(
             f"Authentication middleware initialized "
@@ -51,16 +64,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 
     def is_public_endpoint(self, path: str) -> bool:
         """Check if endpoint is public (no auth required)."""
-        # Exact match
-        if path in self.public_endpoints:
-            return True
-
-        # Prefix match
-        for prefix in self.public_prefixes:
-            if path.startswith(prefix):
-                return True
-
-        return False
+        return self.route_table.lookup(path).is_public
 
     def should_authenticate(self, request: Request) -> bool:
         """
@@ -70,8 +74,12 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         - If canary disabled: authenticate all non-public requests
         - If canary enabled: randomly authenticate X% of traffic
         """
+        # Resolve the route once; the proxy reuses it from request state
+        route = self.route_table.lookup(request.url.path)
+        request.state.route = route
+
         # Always skip public endpoints
-        if self.is_public_endpoint(request.url.path):
+        if route.is_public:
             return False
 
         # If auth disabled globally, skip all
@@ -107,16 +115,31 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         # Authenticate request
         try:
             # Extract token from httpOnly cookie
-            token = extract_token_from_cookie(request)
+            token = extract_token_from_cookie(request.cookies)
 
             if not token:
                 raise TokenMissingError("Authentication required")
 
-            # Decode and validate JWT
-            payload = decode_token(token, auth_settings.auth_public_key)
+            start = time.perf_counter()
+            cached = self.token_cache.get(token) if self.token_cache is not None else None
+
+            if cached is not None:
+                user = cached.user
+                cache_result = "cache_hit"
+            else:
+                # Decode and validate JWT
+                payload = decode_token(token, auth_settings.auth_public_key)
+                user = User.from_token_payload(payload)
+                if self.token_cache is not None:
+                    self.token_cache.put(token, payload, user)
+                cache_result = "cache_miss"
+
+            if gateway_settings.metrics_enabled:
+                auth_metrics.auth_validation_duration_seconds.labels(
+                    result=cache_result
+                ).observe(time.perf_counter() - start)
 
-            # Create user object and attach to request state
-            user = create_user_from_token(payload)
+            # Attach user to request state
             request.state.user = user
             request.state.authenticated = True
 
@@ -0,0 +1,145 @@
+"""
+Precompiled route table for the Gateway.
+
+Upstream routes and public (no-auth) paths are compiled once into a trie of
+path segments, so a single walk over the request path yields the upstream
+service, the rewritten upstream path and the public/auth classification.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Upstream:
+    """An upstream service reachable through the gateway."""
+
+    service: str
+    url: str
+    strip_prefix: bool
+
+
+class RouteMatch(NamedTuple):
+    """Result of resolving a request path against the route table."""
+
+    upstream: Optional[Upstream]
+    upstream_path: Optional[str]
+    is_public: bool
+
+    @property
+    def target_url(self) -> Optional[str]:
+        """Full upstream URL for the request, if the path is routable."""
+        if self.upstream is None:
+            return None
+        return f"{self.upstream.url}{self.upstream_path}"
+
+
+class _Node:
+    """Trie node keyed by a single path segment."""
+
+    __slots__ = ("children", "upstream", "public_prefix", "public_exact")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.upstream: Optional[Upstream] = None
+        self.public_prefix = False
+        self.public_exact = False
+
+
+class RouteTable:
+    """
+    Segment trie with longest-prefix matching.
+
+    Prefixes match on whole path segments: ``/auth`` matches ``/auth`` and
+    ``/auth/login`` but not ``/authors``.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self.route_count = 0
+
+    @staticmethod
+    def _segments(path: str) -> list:
+        if not path.startswith("/"):
+            raise ValueError(f"Route paths must start with '/': {path!r}")
+        return path.split("/")[1:]
+
+    def _insert(self, path: str) -> _Node:
+        node = self._root
+        for segment in self._segments(path):
+            node = node.children.setdefault(segment, _Node())
+        return node
+
+    def add_upstream(self, prefix: str, service: str, url: str, strip_prefix: bool = True) -> None:
+        """Route ``prefix`` to ``url``, optionally stripping the prefix upstream."""
+        node = self._insert(prefix.rstrip("/") or "/")
+        node.upstream = Upstream(service=service, url=url.rstrip("/"), strip_prefix=strip_prefix)
+        self.route_count += 1
+
+    def add_public_prefix(self, prefix: str) -> None:
+        """Mark every path under ``prefix`` as public."""
+        self._insert(prefix.rstrip("/") or "/").public_prefix = True
+        self.route_count += 1
+
+    def add_public_endpoint(self, path: str) -> None:
+        """Mark exactly ``path`` as public."""
+        self._insert(path).public_exact = True
+        self.route_count += 1
+
+    def lookup(self, path: str) -> RouteMatch:
+        """Resolve ``path`` to its upstream, rewritten path and auth classification."""
+        node = self._root
+        upstream: Optional[Upstream] = node.upstream
+        upstream_end = 0
+        is_public = node.public_prefix
+        consumed = 0
+        exhausted = True
+
+        for segment in self._segments(path):
+            child = node.children.get(segment)
+            if child is None:
+                exhausted = False
+                break
+            node = child
+            consumed += 1 + len(segment)
+            if node.upstream is not None:
+                upstream, upstream_end = node.upstream, consumed
+            if node.public_prefix:
+                is_public = True
+
+        if exhausted and node.public_exact:
+            is_public = True
+
+        if upstream is None:
+            return RouteMatch(upstream=None, upstream_path=None, is_public=is_public)
+
+        upstream_path = path[upstream_end:] if upstream.strip_prefix else path
+        return RouteMatch(
+            upstream=upstream,
+            upstream_path=upstream_path or "/",
+            is_public=is_public,
+        )
+
+
+def build_route_table(
+    service_routes: Iterable[Tuple[str, str, str]],
+    passthrough_routes: Iterable[Tuple[str, str, str]] = (),
+    public_endpoints: Iterable[str] = (),
+    public_prefixes: Iterable[str] = (),
+) -> RouteTable:
+    """
+    Compile the gateway routing configuration into a ``RouteTable``.
+
+    ``service_routes`` have their prefix stripped before proxying, while
+    ``passthrough_routes`` keep the full path. Both are ``(prefix, service, url)``.
+    """
+    table = RouteTable()
+    for prefix, service, url in service_routes:
+        table.add_upstream(prefix, service, url, strip_prefix=True)
+    for prefix, service, url in passthrough_routes:
+        table.add_upstream(prefix, service, url, strip_prefix=False)
+    for path in public_endpoints:
+        table.add_public_endpoint(path)
+    for prefix in public_prefixes:
+        table.add_public_prefix(prefix)
+    return table
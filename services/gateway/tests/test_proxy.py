@@ -0,0 +1,84 @@
+"""
+Tests for the Gateway proxy pass-through.
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from services.gateway.main import upstream_pools
+
+
+async def _chunks(data: bytes):
+    """Serve a body as a byte stream, like a real network response."""
+    yield data
+
+
+@pytest.fixture
+def upstream_requests(monkeypatch):
+    """Route the presentation upstream pool to an in-process mock transport."""
+    received = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        received.append(request)
+
+        if request.url.path.endswith("/export"):
+            return httpx.Response(
+                200,
+                headers=[
+                    ("content-type", "application/json"),
+                    ("content-encoding", "gzip"),
+                ],
+                content=_chunks(gzip.compress(json.dumps({"slides": 40}).encode())),
+            )
+
+        return httpx.Response(
+            201,
+            headers=[
+                ("content-type", "application/json"),
+                ("set-cookie", "a=1; Path=/"),
+                ("set-cookie", "b=2; Path=/"),
+                ("connection", "close"),
+            ],
+            content=_chunks(body),
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(upstream_pools._clients, "presentation", client)
+    return received
+
+
+class TestProxyPassThrough:
+    """Test raw relaying of proxied requests and responses."""
+
+    def test_request_body_is_forwarded(self, test_client, upstream_requests):
+        """Request body should reach the upstream unchanged."""
+        payload = b'{"prompt": "quarterly review", "n_slides": 10}'
+
+        response = test_client.post(
+            "/api/v1/ppt/presentation/create",
+            content=payload,
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 201
+        assert response.content == payload
+        assert upstream_requests[0].url.path == "/api/v1/ppt/presentation/create"
+
+    def test_repeated_headers_preserved_and_hop_by_hop_dropped(self, test_client, upstream_requests):
+        """Every Set-Cookie header is relayed, connection headers are not."""
+        response = test_client.post("/api/v1/ppt/presentation/create", content=b"{}")
+
+        assert response.headers.get_list("set-cookie") == ["a=1; Path=/", "b=2; Path=/"]
+        assert response.headers.get("connection") != "close"
+
+    def test_compressed_body_relayed_without_decoding(self, test_client, upstream_requests):
+        """Encoded upstream bodies are forwarded as-is with their encoding header."""
+        response = test_client.get("/api/v1/ppt/presentation/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"slides": 40}
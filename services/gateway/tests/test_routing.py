@@ -0,0 +1,81 @@
+"""
+Tests for the Gateway precompiled route table.
+"""
+
+import pytest
+
+from services.gateway.routing import RouteTable, build_route_table
+
+
+@pytest.fixture
+def route_table() -> RouteTable:
+    """Route table mirroring the gateway configuration."""
+    return build_route_table(
+        service_routes=[
+            ("/auth", "auth", "http://auth:8001"),
+            ("/financial", "financial", "http://financial:8002"),
+        ],
+        passthrough_routes=[
+            ("/api/v1/ppt", "presentation", "http://presentation:8008"),
+            ("/static", "presentation", "http://presentation:8008"),
+        ],
+        public_endpoints=["/", "/health"],
+        public_prefixes=["/auth/api/v1/auth/login", "/api/v1/ppt"],
+    )
+
+
+class TestRouteLookup:
+    """Test upstream resolution and path rewriting."""
+
+    def test_strips_service_prefix(self, route_table):
+        match = route_table.lookup("/financial/api/v1/suppliers")
+
+        assert match.upstream.service == "financial"
+        assert match.upstream_path == "/api/v1/suppliers"
+        assert match.target_url == "http://financial:8002/api/v1/suppliers"
+
+    def test_prefix_only_rewrites_to_root(self, route_table):
+        assert route_table.lookup("/auth").upstream_path == "/"
+        assert route_table.lookup("/auth/").upstream_path == "/"
+
+    def test_repeated_prefix_is_stripped_once(self, route_table):
+        match = route_table.lookup("/auth/api/v1/auth/me")
+
+        assert match.upstream_path == "/api/v1/auth/me"
+
+    def test_passthrough_keeps_full_path(self, route_table):
+        match = route_table.lookup("/api/v1/ppt/presentation/generate")
+
+        assert match.upstream.service == "presentation"
+        assert match.upstream_path == "/api/v1/ppt/presentation/generate"
+
+    def test_matches_whole_segments_only(self, route_table):
+        assert route_table.lookup("/authors").upstream is None
+        assert route_table.lookup("/statics/logo.png").upstream is None
+
+    def test_unknown_path_has_no_upstream(self, route_table):
+        match = route_table.lookup("/unknown/path")
+
+        assert match.upstream is None
+        assert match.target_url is None
+
+
+class TestPublicClassification:
+    """Test public/auth classification."""
+
+    def test_exact_public_endpoints(self, route_table):
+        assert route_table.lookup("/").is_public
+        assert route_table.lookup("/health").is_public
+        assert not route_table.lookup("/health/details").is_public
+
+    def test_public_prefixes(self, route_table):
+        assert route_table.lookup("/auth/api/v1/auth/login").is_public
+        assert route_table.lookup("/api/v1/ppt/presentation/stream").is_public
+
+    def test_protected_paths(self, route_table):
+        assert not route_table.lookup("/auth/api/v1/auth/me").is_public
+        assert not route_table.lookup("/financial/api/v1/suppliers").is_public
+
+    def test_rejects_relative_paths(self):
+        with pytest.raises(ValueError):
+            RouteTable().add_upstream("auth", "auth", "http://auth:8001")
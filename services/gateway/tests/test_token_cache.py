@@ -0,0 +1,105 @@
+"""
+Tests for the Gateway verified-token cache.
+"""
+
+import time
+
+import pytest
+
+from cortex_auth.models import User
+from services.gateway.token_cache import RevocationListener, VerifiedTokenCache
+
+
+def _payload(jti: str, expires_in: float = 3600) -> dict:
+    return {
+        "user_id": "user-456",
+        "email": "user@test.com",
+        "name": "Regular User",
+        "roles": ["user"],
+        "permissions": [],
+        "exp": time.time() + expires_in,
+        "jti": jti,
+    }
+
+
+def _cache_token(cache: VerifiedTokenCache, token: str, jti: str, expires_in: float = 3600):
+    payload = _payload(jti, expires_in)
+    cache.put(token, payload, User.from_token_payload(payload))
+
+
+@pytest.fixture
+def cache() -> VerifiedTokenCache:
+    return VerifiedTokenCache(max_entries=2, clock_skew_seconds=60)
+
+
+class TestVerifiedTokenCache:
+    """Test caching, expiry and eviction of verified tokens."""
+
+    def test_hit_returns_payload_and_user(self, cache):
+        _cache_token(cache, "token-a", "jti-a")
+
+        entry = cache.get("token-a")
+
+        assert entry.payload["jti"] == "jti-a"
+        assert entry.user.email == "user@test.com"
+        assert cache.get("token-b") is None
+
+    def test_expires_before_exp_by_clock_skew(self, cache):
+        _cache_token(cache, "token-a", "jti-a", expires_in=30)
+
+        # exp is within the 60s skew window, so the entry is never served
+        assert cache.get("token-a") is None
+
+    def test_tokens_without_exp_are_not_cached(self, cache):
+        payload = _payload("jti-a")
+        del payload["exp"]
+        cache.put("token-a", payload, User.from_token_payload(payload))
+
+        assert cache.get("token-a") is None
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        _cache_token(cache, "token-a", "jti-a")
+        _cache_token(cache, "token-b", "jti-b")
+        cache.get("token-a")
+        _cache_token(cache, "token-c", "jti-c")
+
+        assert cache.get("token-a") is not None
+        assert cache.get("token-b") is None
+        assert len(cache) == 2
+
+    def test_invalidate_by_jti(self, cache):
+        _cache_token(cache, "token-a", "jti-a")
+
+        assert cache.invalidate_jti("jti-a") is True
+        assert cache.get("token-a") is None
+        assert cache.invalidate_jti("jti-a") is False
+
+    def test_disabled_cache_always_misses(self, cache):
+        _cache_token(cache, "token-a", "jti-a")
+        cache.enabled = False
+
+        assert cache.get("token-a") is None
+
+
+class TestRevocationListener:
+    """Test revocation messages evict cached tokens."""
+
+    def test_revocation_message_evicts_entry(self, cache):
+        listener = RevocationListener(cache, redis_url="redis://localhost:6379/0", channel="revocations")
+        _cache_token(cache, "token-a", "jti-a")
+
+        listener.handle_message(b"jti-a")
+
+        assert cache.get("token-a") is None
+
+
+class TestMiddlewareTokenCache:
+    """Test the middleware serves repeated tokens from the cache."""
+
+    def test_repeated_token_is_cached(self, test_client, user_token):
+        from services.gateway.main import token_cache
+
+        token_cache.clear()
+        test_client.get("/api/profile", cookies={"cortex_access_token": user_token})
+
+        assert token_cache.get(user_token) is not None
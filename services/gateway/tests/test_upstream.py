@@ -0,0 +1,61 @@
+"""
+Tests for the Gateway upstream connection pools.
+"""
+
+import pytest
+import httpx
+
+from services.gateway.metrics import auth_metrics
+from services.gateway.upstream import UpstreamPools
+
+
+@pytest.fixture
+def pools():
+    """Create upstream pools for two fake services."""
+    return UpstreamPools({
+        "financial": "http://financial:8002",
+        "presentation": "http://presentation:8008",
+    })
+
+
+class TestUpstreamPools:
+    """Test pooled upstream client lifecycle."""
+
+    async def test_client_is_reused_per_service(self, pools):
+        """The same service should always get the same client."""
+        first = pools.client("financial")
+        second = pools.client("financial")
+
+        assert isinstance(first, httpx.AsyncClient)
+        assert first is second
+        assert pools.client("presentation") is not first
+
+        await pools.close()
+
+    async def test_unknown_service_raises(self, pools):
+        """Services outside the routing table have no pool."""
+        with pytest.raises(KeyError):
+            pools.client("unknown")
+
+    async def test_start_and_close(self, pools):
+        """Start creates every pool and close shuts them down."""
+        await pools.start()
+        client = pools.client("financial")
+
+        await pools.close()
+
+        assert client.is_closed
+        assert pools.client("financial") is not client
+        await pools.close()
+
+    async def test_track_counts_inflight_requests(self, pools):
+        """In-flight gauge should rise during a request and fall afterwards."""
+        gauge = auth_metrics.proxy_upstream_inflight_requests.labels(service="financial")
+        initial = gauge._value.get()
+
+        async with pools.track("financial") as client:
+            assert client is pools.client("financial")
+            assert gauge._value.get() == initial + 1
+
+        assert gauge._value.get() == initial
+        await pools.close()
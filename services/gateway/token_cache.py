@@ -0,0 +1,203 @@
+"""
+Verified-token cache for the Gateway authentication middleware.
+
+Access tokens are verified with RS256 once and the decoded payload and
+``User`` are kept in a bounded LRU, keyed by a SHA-256 hash of the token.
+Entries expire at the token's ``exp`` minus the clock skew tolerance, and
+revocations published by the auth service evict them immediately.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from redis.asyncio import Redis
+
+from cortex_auth.models import User
+
+from .metrics import auth_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """A verified token's decoded payload and user."""
+
+    payload: Dict[str, Any]
+    user: User
+    expires_at: float
+    jti: Optional[str]
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified access tokens.
+
+    Only the token hash is stored, never the raw token. While ``enabled`` is
+    False (e.g. revocations cannot be received) every lookup misses.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock_skew_seconds: int = 60):
+        self.max_entries = max_entries
+        self.clock_skew_seconds = clock_skew_seconds
+        self.enabled = True
+        self._entries: "OrderedDict[str, CachedToken]" = OrderedDict()
+        self._keys_by_jti: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[CachedToken]:
+        """Return the cached verification result for ``token``, if still valid."""
+        if not self.enabled:
+            return None
+
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.time():
+            self._remove(key, reason="expired")
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, token: str, payload: Dict[str, Any], user: User) -> None:
+        """Cache a verified token until its expiry (minus clock skew)."""
+        if not self.enabled:
+            return
+
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            # Tokens without a numeric expiry are always re-verified
+            return
+
+        expires_at = exp - self.clock_skew_seconds
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        jti = payload.get("jti")
+        self._entries[key] = CachedToken(payload=payload, user=user, expires_at=expires_at, jti=jti)
+        self._entries.move_to_end(key)
+        if jti:
+            self._keys_by_jti[jti] = key
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest, reason="capacity")
+
+        auth_metrics.auth_token_cache_entries.set(len(self._entries))
+
+    def invalidate_jti(self, jti: str) -> bool:
+        """Evict the entry for a revoked token ID. Returns True if one was cached."""
+        key = self._keys_by_jti.get(jti)
+        if key is None or key not in self._entries:
+            return False
+        self._remove(key, reason="revoked")
+        return True
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._keys_by_jti.clear()
+        auth_metrics.auth_token_cache_entries.set(0)
+
+    def _remove(self, key: str, reason: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry.jti and self._keys_by_jti.get(entry.jti) == key:
+            del self._keys_by_jti[entry.jti]
+        auth_metrics.auth_token_cache_evictions_total.labels(reason=reason).inc()
+        auth_metrics.auth_token_cache_entries.set(len(self._entries))
+
+
+class RevocationListener:
+    """
+    Evicts cached tokens when the auth service publishes a revocation.
+
+    The auth service publishes each revoked JTI on a Redis pub/sub channel
+    alongside its ``revoked:{jti}`` key. Messages sent while disconnected are
+    lost, so the cache is disabled while the subscription is down and cleared
+    on every (re)connect.
+    """
+
+    def __init__(
+        self,
+        cache: VerifiedTokenCache,
+        redis_url: str,
+        channel: str,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.cache = cache
+        self.redis_url = redis_url
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self.cache.enabled = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and wait for the background task to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def handle_message(self, data: Any) -> None:
+        """Apply one revocation message (the revoked JTI)."""
+        jti = data.decode() if isinstance(data, bytes) else str(data)
+        if self.cache.invalidate_jti(jti):
+            logger.info(f"Evicted revoked token from cache: jti={jti}")
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            redis = Redis.from_url(self.redis_url)
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Revocations may have been missed while disconnected
+                    self.cache.clear()
+                    self.cache.enabled = True
+                    delay = self.reconnect_delay
+                    logger.info(f"Listening for token revocations on '{self.channel}'")
+
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.cache.enabled = False
+                self.cache.clear()
+                logger.warning(
+                    f"Token revocation listener disconnected: {e}; retrying in {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+            finally:
+                self.cache.enabled = False
+                await redis.aclose()
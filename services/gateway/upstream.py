@@ -0,0 +1,122 @@
+"""
+Persistent upstream HTTP clients for the Gateway proxy.
+
+Each backend service gets its own long-lived ``httpx.AsyncClient`` so proxied
+requests reuse keep-alive connections instead of paying a TCP (and TLS)
+handshake per call.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+
+from .config import settings as gateway_settings
+from .metrics import auth_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamPools:
+    """
+    Registry of pooled HTTP clients, one per upstream service.
+
+    Clients are created lazily on first use (or eagerly via ``start``) and
+    closed together on ``close``.
+    """
+
+    def __init__(self, upstreams: Dict[str, str]):
+        self.upstreams = dict(upstreams)
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _build_client(self, service: str) -> httpx.AsyncClient:
+        """Create the pooled client for a single upstream service."""
+        limits = httpx.Limits(
+            max_connections=gateway_settings.upstream_max_connections,
+            max_keepalive_connections=gateway_settings.upstream_max_keepalive_connections,
+            keepalive_expiry=gateway_settings.upstream_keepalive_expiry,
+        )
+        timeout = httpx.Timeout(30.0, connect=gateway_settings.upstream_connect_timeout)
+
+        if gateway_settings.metrics_enabled:
+            auth_metrics.proxy_upstream_pool_max_connections.labels(
+                service=service
+            ).set(gateway_settings.upstream_max_connections)
+
+        try:
+            return httpx.AsyncClient(
+                limits=limits,
+                timeout=timeout,
+                http2=gateway_settings.upstream_http2,
+                follow_redirects=True,
+            )
+        except ImportError:
+            logger.warning(
+                f"HTTP/2 requested for upstream '{service}' but the 'h2' package "
+                f"is not installed; falling back to HTTP/1.1"
+            )
+            return httpx.AsyncClient(
+                limits=limits,
+                timeout=timeout,
+                follow_redirects=True,
+            )
+
+    def client(self, service: str) -> httpx.AsyncClient:
+        """Return the pooled client for ``service``, creating it if needed."""
+        client = self._clients.get(service)
+        if client is None:
+            if service not in self.upstreams:
+                raise KeyError(f"Unknown upstream service: {service}")
+            client = self._build_client(service)
+            self._clients[service] = client
+        return client
+
+    async def start(self) -> None:
+        """Create all upstream clients up front."""
+        for service in self.upstreams:
+            self.client(service)
+        logger.info(f"Upstream pools ready: {', '.join(self.upstreams)}")
+
+    async def close(self) -> None:
+        """Close all upstream clients and their connections."""
+        clients, self._clients = self._clients, {}
+        for service, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing upstream pool '{service}': {e}")
+
+    @asynccontextmanager
+    async def track(self, service: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yield the client for ``service`` while tracking in-flight usage.
+
+        Pool occupancy is sampled when the request finishes.
+        """
+        client = self.client(service)
+        inflight = auth_metrics.proxy_upstream_inflight_requests.labels(service=service)
+
+        if gateway_settings.metrics_enabled:
+            inflight.inc()
+        try:
+            yield client
+        finally:
+            if gateway_settings.metrics_enabled:
+                inflight.dec()
+                self._record_pool_usage(service, client)
+
+    def _record_pool_usage(self, service: str, client: httpx.AsyncClient) -> None:
+        """Export active/idle connection counts for an upstream pool."""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections: Optional[list] = getattr(pool, "connections", None)
+        if not isinstance(connections, list):
+            return
+
+        idle = sum(1 for conn in connections if conn.is_idle())
+        auth_metrics.proxy_upstream_pool_connections.labels(
+            service=service, state="idle"
+        ).set(idle)
+        auth_metrics.proxy_upstream_pool_connections.labels(
+            service=service, state="active"
+        ).set(len(connections) - idle)
@@ -1,9 +1,17 @@
+import asyncio
 from contextlib import asynccontextmanager
 import os
 
 from fastapi import FastAPI
 
 from services.presentation.services.database import create_db_and_tables
+from services.presentation.services.docling_service import DOCLING_SERVICE
+from services.presentation.services.download_manager import DOWNLOAD_MANAGER
+from services.presentation.services.icon_finder_service import ICON_FINDER_SERVICE
+from services.presentation.services.layout_cache import LAYOUT_CACHE
+from services.presentation.services.pdf_page_renderer import PDF_PAGE_RENDERER
+from services.presentation.services.llm_client_registry import LLM_CLIENT_REGISTRY
+from services.presentation.services.temp_file_service import TEMP_FILE_SERVICE
 from services.presentation.utils.get_env import get_app_data_directory_env
 from services.presentation.utils.model_availability import (
     check_llm_and_image_provider_api_or_model_availability,
@@ -14,10 +22,23 @@ from services.presentation.utils.model_availability import (
 async def app_lifespan(_: FastAPI):
     """
     Lifespan context manager for FastAPI application.
-    Initializes the application data directory and checks LLM model availability.
+    Clears the temp directory left by the previous run, initializes the
+    application data directory, checks LLM model availability, loads the
+    icons collection and starts the docling and PDF rendering workers.
+    Closes the shared LLM provider clients, template cache, asset downloads,
+    docling and PDF rendering workers on shutdown.
 
     """
+    TEMP_FILE_SERVICE.cleanup_base_dir()
     os.makedirs(get_app_data_directory_env(), exist_ok=True)
     await create_db_and_tables()
     await check_llm_and_image_provider_api_or_model_availability()
+    await asyncio.to_thread(ICON_FINDER_SERVICE.load)
+    DOCLING_SERVICE.start()
+    PDF_PAGE_RENDERER.start()
     yield
+    await LLM_CLIENT_REGISTRY.close()
+    await LAYOUT_CACHE.close()
+    await DOWNLOAD_MANAGER.close()
+    DOCLING_SERVICE.close()
+    PDF_PAGE_RENDERER.close()
@@ -3,6 +3,7 @@ import uuid
 from fastapi import Body, Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from prometheus_client import make_asgi_app
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from services.presentation.api.lifespan import app_lifespan
@@ -70,6 +71,9 @@ async def export_as_pdf_endpoint(
     return {"path": presentation_and_path.path}
 
 
+# Mount Prometheus metrics endpoint
+app.mount("/metrics", make_asgi_app())
+
 # Mount static files for app_data directory (images, exports, etc.)
 app_data_dir = get_app_data_directory_env()
 if app_data_dir:
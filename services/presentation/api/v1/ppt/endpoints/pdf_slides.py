@@ -67,13 +67,6 @@ async def process_pdf_slides(
                 pdf_content = await pdf_file.read()
                 f.write(pdf_content)
 
-            # Generate screenshots from PDF using ImageMagick
-            screenshot_paths = await DocumentsLoader.get_page_images_from_pdf_async(
-                pdf_path, temp_dir
-            )
-            print(f"Generated {len(screenshot_paths)} PDF screenshots")
-
-            # Move screenshots to images directory and generate URLs
             images_dir = get_images_directory()
             presentation_id = uuid.uuid4()
             presentation_images_dir = os.path.join(images_dir, str(presentation_id))
@@ -81,9 +74,13 @@ async def process_pdf_slides(
 
             slides_data = []
 
-            for i, screenshot_path in enumerate(screenshot_paths, 1):
-                # Move screenshot to permanent location
-                screenshot_filename = f"slide_{i}.png"
+            # Copy each page to its permanent location as soon as it is
+            # rendered, while the remaining pages are still rendering
+            async for (
+                slide_number,
+                screenshot_path,
+            ) in DocumentsLoader.stream_page_images_from_pdf(pdf_path, temp_dir):
+                screenshot_filename = f"slide_{slide_number}.png"
                 permanent_screenshot_path = os.path.join(
                     presentation_images_dir, screenshot_filename
                 )
@@ -102,9 +99,13 @@ async def process_pdf_slides(
                     screenshot_url = "/static/images/placeholder.jpg"
 
                 slides_data.append(
-                    PdfSlideData(slide_number=i, screenshot_url=screenshot_url)
+                    PdfSlideData(slide_number=slide_number, screenshot_url=screenshot_url)
                 )
 
+            # Pages arrive in completion order
+            slides_data.sort(key=lambda slide: slide.slide_number)
+            print(f"Generated {len(slides_data)} PDF screenshots")
+
             return PdfSlidesResponse(
                 success=True, slides=slides_data, total_slides=len(slides_data)
             )
@@ -34,6 +34,7 @@ from services.presentation.models.sql.template import TemplateModel
 
 from services.presentation.services.documents_loader import DocumentsLoader
 from services.presentation.services.llm_client import LLMClient
+from services.presentation.services.llm_scheduler import set_llm_flow
 from services.presentation.services.webhook_service import WebhookService
 from services.presentation.utils.get_layout_by_name import get_layout_by_name
 from services.presentation.services.image_generation_service import ImageGenerationService
@@ -41,7 +42,12 @@ from services.presentation.utils.dict_utils import deep_update
 from services.presentation.utils.export_utils import export_presentation
 from services.presentation.utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from services.presentation.models.sql.slide import SlideModel
-from services.presentation.models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
+from services.presentation.models.sse_response import (
+    SSECacheHitResponse,
+    SSECompleteResponse,
+    SSEErrorResponse,
+    SSEResponse,
+)
 
 from services.presentation.services.database import get_async_session
 from services.presentation.services.temp_file_service import TEMP_FILE_SERVICE
@@ -56,6 +62,7 @@ from services.presentation.utils.llm_calls.generate_presentation_structure impor
     generate_presentation_structure,
 )
 from services.presentation.utils.llm_calls.generate_slide_content import (
+    get_slide_content_and_cache_status,
     get_slide_content_from_type_and_outline,
 )
 from services.presentation.utils.ppt_utils import (
@@ -285,6 +292,7 @@ async def stream_presentation(
     image_generation_service = ImageGenerationService(get_images_directory())
 
     async def inner():
+        set_llm_flow(str(presentation.id))
         structure = presentation.get_structure()
         layout = presentation.get_layout()
         outline = presentation.get_presentation_outline()
@@ -301,18 +309,22 @@ async def stream_presentation(
             slide_layout = layout.slides[slide_layout_index]
 
             try:
-                slide_content = await get_slide_content_from_type_and_outline(
+                slide_content, cache_hit = await get_slide_content_and_cache_status(
                     slide_layout,
                     outline.slides[i],
                     presentation.language,
                     presentation.tone,
                     presentation.verbosity,
                     presentation.instructions,
+                    layout.name,
                 )
             except HTTPException as e:
                 yield SSEErrorResponse(detail=e.detail).to_string()
                 return
 
+            if cache_hit:
+                yield SSECacheHitResponse(index=i).to_string()
+
             slide = SlideModel(
                 presentation=id,
                 layout_group=layout.name,
@@ -524,6 +536,9 @@ async def generate_presentation_handler(
     async_status: Optional[AsyncPresentationGenerationTaskModel],
     sql_session: AsyncSession = Depends(get_async_session),
 ):
+    # Queue this presentation's LLM requests fairly against other users'
+    set_llm_flow(str(presentation_id))
+
     try:
         using_slides_markdown = False
 
@@ -702,68 +717,49 @@ async def generate_presentation_handler(
             await sql_session.commit()
 
         image_generation_service = ImageGenerationService(get_images_directory())
-        async_assets_generation_tasks = []
-
-        # 7. Generate slide content concurrently (batched), then build slides and fetch assets
-        slides: List[SlideModel] = []
 
+        # 7. Generate slide content and fetch assets per slide. LLM_SCHEDULER
+        # bounds in-flight LLM requests across all presentations, so every
+        # slide is queued at once and starts as soon as a slot frees up.
         slide_layout_indices = presentation_structure.slides
         slide_layouts = [layout_model.slides[idx] for idx in slide_layout_indices]
 
-        # Schedule slide content generation and asset fetching in batches of 10
-        batch_size = 10
-        for start in range(0, len(slide_layouts), batch_size):
-            end = min(start + batch_size, len(slide_layouts))
-
-            print(f"Generating slides from {start} to {end}")
-
-            # Generate contents for this batch concurrently
-            content_tasks = [
-                get_slide_content_from_type_and_outline(
-                    slide_layouts[i],
-                    presentation_outlines.slides[i],
-                    request.language,
-                    request.tone.value,
-                    request.verbosity.value,
-                    request.instructions,
-                )
-                for i in range(start, end)
-            ]
-            batch_contents: List[dict] = await asyncio.gather(*content_tasks)
-
-            # Build slides for this batch
-            batch_slides: List[SlideModel] = []
-            for offset, slide_content in enumerate(batch_contents):
-                i = start + offset
-                slide_layout = slide_layouts[i]
-                slide = SlideModel(
-                    presentation=presentation_id,
-                    layout_group=layout_model.name,
-                    layout=slide_layout.id,
-                    index=i,
-                    speaker_note=slide_content.get("__speaker_note__"),
-                    content=slide_content,
-                )
-                slides.append(slide)
-                batch_slides.append(slide)
-
-            # Start asset fetch tasks for just-generated slides so they run while next batch is processed
-            asset_tasks = [
-                process_slide_and_fetch_assets(image_generation_service, slide)
-                for slide in batch_slides
-            ]
-            async_assets_generation_tasks.extend(asset_tasks)
+        async def generate_slide(i: int):
+            slide_content = await get_slide_content_from_type_and_outline(
+                slide_layouts[i],
+                presentation_outlines.slides[i],
+                request.language,
+                request.tone.value,
+                request.verbosity.value,
+                request.instructions,
+                layout_model.name,
+            )
+            slide = SlideModel(
+                presentation=presentation_id,
+                layout_group=layout_model.name,
+                layout=slide_layouts[i].id,
+                index=i,
+                speaker_note=slide_content.get("__speaker_note__"),
+                content=slide_content,
+            )
+            # Fetch this slide's assets while other slides are still generating
+            assets = await process_slide_and_fetch_assets(
+                image_generation_service, slide
+            )
+            return slide, assets
 
         if async_status:
-            async_status.message = "Fetching assets for slides"
+            async_status.message = "Generating slides and fetching assets"
             async_status.updated_at = datetime.now()
             sql_session.add(async_status)
             await sql_session.commit()
 
-        # Run all asset tasks concurrently while batches may still be generating content
-        generated_assets_list = await asyncio.gather(*async_assets_generation_tasks)
+        generated_slides = await asyncio.gather(
+            *(generate_slide(i) for i in range(len(slide_layouts)))
+        )
+        slides: List[SlideModel] = [slide for slide, _ in generated_slides]
         generated_assets = []
-        for assets_list in generated_assets_list:
+        for _, assets_list in generated_slides:
             generated_assets.extend(assets_list)
 
         # 8. Save PresentationModel and Slides
@@ -1,3 +1,5 @@
+import os
+
 PDF_MIME_TYPES = ["application/pdf"]
 TEXT_MIME_TYPES = ["text/plain"]
 POWERPOINT_TYPES = [
@@ -18,3 +20,16 @@ WEBP_MIME_TYPES = ["image/webp"]
 UPLOAD_ACCEPTED_FILE_TYPES = (
     PDF_MIME_TYPES + TEXT_MIME_TYPES + POWERPOINT_TYPES + WORD_TYPES
 )
+
+
+# Docling parsing: worker processes, files parsed at once per request,
+# and parsed markdown kept by file content hash
+DOCLING_WORKERS = 2
+DOCUMENTS_LOAD_CONCURRENCY = 4
+DOCLING_MARKDOWN_CACHE_MAX_ENTRIES = 128
+
+# PDF page rendering: worker processes, DPI for page images,
+# and documents whose rendered pages are kept
+PDF_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+PDF_PAGE_RESOLUTION = 150
+PDF_PAGE_CACHE_MAX_DOCUMENTS = 32
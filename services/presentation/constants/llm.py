@@ -4,3 +4,24 @@ OPENAI_URL = "https://api.openai.com/v1"
 DEFAULT_OPENAI_MODEL = "gpt-4.1"
 DEFAULT_GOOGLE_MODEL = "models/gemini-2.5-flash"
 DEFAULT_ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
+
+# Shared provider HTTP connection pools
+LLM_HTTP_MAX_CONNECTIONS = 100
+LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+LLM_HTTP_KEEPALIVE_EXPIRY = 60
+
+# Global LLM scheduler budgets per provider. None means unlimited.
+LLM_PROVIDER_BUDGETS = {
+    "openai": {"max_concurrent": 16, "requests_per_minute": 500, "tokens_per_minute": 400_000},
+    "google": {"max_concurrent": 16, "requests_per_minute": 1000, "tokens_per_minute": 1_000_000},
+    "anthropic": {"max_concurrent": 8, "requests_per_minute": 50, "tokens_per_minute": 80_000},
+    "ollama": {"max_concurrent": 2, "requests_per_minute": None, "tokens_per_minute": None},
+    "custom": {"max_concurrent": 8, "requests_per_minute": None, "tokens_per_minute": None},
+}
+LLM_DEFAULT_OUTPUT_TOKENS = 2_000
+LLM_RATE_LIMIT_MAX_RETRIES = 3
+LLM_RATE_LIMIT_DEFAULT_RETRY_AFTER = 10
+
+# Structured response cache (enabled with LLM_RESPONSE_CACHE=true)
+LLM_RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+LLM_RESPONSE_CACHE_MAX_ENTRIES = 5_000
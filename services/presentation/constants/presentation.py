@@ -1 +1,14 @@
 DEFAULT_TEMPLATES = ["general", "modern", "standard", "swift"]
+
+# Seconds a cached template is served before revalidating with the Next.js API
+LAYOUT_CACHE_REVALIDATE_AFTER = 30
+LAYOUT_CACHE_TIMEOUT = 30
+
+# Network asset downloads (slide images)
+DOWNLOAD_PER_HOST_CONCURRENCY = 6
+DOWNLOAD_TIMEOUT = 60
+ASSET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Icon search: queries arriving within the window are embedded and queried together
+ICON_SEARCH_BATCH_WINDOW = 0.01
+ICON_SEARCH_CACHE_MAX_ENTRIES = 2048
@@ -0,0 +1,120 @@
+"""
+Prometheus metrics for the presentation service.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# LLM provider clients
+llm_clients_created_total = Counter(
+    "presentation_llm_clients_created_total",
+    "Provider SDK clients created by the shared client registry",
+    ["provider"]
+)
+
+llm_http_requests_total = Counter(
+    "presentation_llm_http_requests_total",
+    "HTTP requests sent to LLM providers through shared connection pools",
+    ["provider"]
+)
+
+llm_http_connections_opened_total = Counter(
+    "presentation_llm_http_connections_opened_total",
+    "New TCP connections opened to LLM providers",
+    ["provider"]
+)
+
+# LLM scheduler
+llm_scheduler_queue_depth = Gauge(
+    "presentation_llm_scheduler_queue_depth",
+    "LLM requests waiting for a scheduler slot",
+    ["provider"]
+)
+
+llm_scheduler_in_flight = Gauge(
+    "presentation_llm_scheduler_in_flight",
+    "LLM requests currently admitted by the scheduler",
+    ["provider"]
+)
+
+llm_scheduler_wait_seconds = Histogram(
+    "presentation_llm_scheduler_wait_seconds",
+    "Time LLM requests waited in the scheduler queue",
+    ["provider"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
+llm_scheduler_rate_limited_total = Counter(
+    "presentation_llm_scheduler_rate_limited_total",
+    "Provider rate-limit (429) responses seen by the scheduler",
+    ["provider"]
+)
+
+# LLM response cache
+llm_response_cache_requests_total = Counter(
+    "presentation_llm_response_cache_requests_total",
+    "Structured LLM response cache lookups",
+    ["result"]
+)
+
+llm_response_cache_evictions_total = Counter(
+    "presentation_llm_response_cache_evictions_total",
+    "Entries evicted from the LLM response cache to stay under its size limit"
+)
+
+# Template layout cache
+layout_cache_requests_total = Counter(
+    "presentation_layout_cache_requests_total",
+    "Template layout lookups by result (hit, not_modified, miss)",
+    ["result"]
+)
+
+# Document parsing
+docling_parse_seconds = Histogram(
+    "presentation_docling_parse_seconds",
+    "Time docling workers spent converting a file to markdown",
+    ["format"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+
+docling_markdown_cache_requests_total = Counter(
+    "presentation_docling_markdown_cache_requests_total",
+    "Parsed markdown cache lookups by file content hash",
+    ["result"]
+)
+
+pdf_page_render_seconds = Histogram(
+    "presentation_pdf_page_render_seconds",
+    "Time a worker spent rendering one PDF page to an image",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+pdf_page_cache_requests_total = Counter(
+    "presentation_pdf_page_cache_requests_total",
+    "Rendered PDF page cache lookups by document hash and DPI",
+    ["result"]
+)
+
+# Network asset downloads
+asset_download_requests_total = Counter(
+    "presentation_asset_download_requests_total",
+    "Asset download requests by result (hit, coalesced, miss, failed)",
+    ["result"]
+)
+
+asset_cache_evictions_total = Counter(
+    "presentation_asset_cache_evictions_total",
+    "Downloaded assets evicted from the on-disk cache to stay under its size limit"
+)
+
+# Icon search
+icon_search_cache_requests_total = Counter(
+    "presentation_icon_search_cache_requests_total",
+    "Icon search cache lookups by result",
+    ["result"]
+)
+
+icon_search_batch_size = Histogram(
+    "presentation_icon_search_batch_size",
+    "Distinct icon queries embedded and searched in one batch",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
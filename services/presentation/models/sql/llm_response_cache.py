@@ -0,0 +1,11 @@
+from sqlmodel import JSON, Column, Field, SQLModel
+
+
+class LLMResponseCacheEntry(SQLModel, table=True):
+    __tablename__ = "llm_response_cache"
+
+    key: str = Field(primary_key=True)
+    # Unix timestamps, indexed so expiry and eviction are resolved in SQL
+    created_at: float = Field(index=True)
+    expires_at: float = Field(index=True)
+    response: dict = Field(sa_column=Column(JSON))
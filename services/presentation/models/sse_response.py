@@ -38,3 +38,13 @@ class SSECompleteResponse(BaseModel):
             event="response",
             data=json.dumps({"type": "complete", self.key: self.value}),
         ).to_string()
+
+
+class SSECacheHitResponse(BaseModel):
+    index: int
+
+    def to_string(self):
+        return SSEResponse(
+            event="response",
+            data=json.dumps({"type": "cache_hit", "index": self.index}),
+        ).to_string()
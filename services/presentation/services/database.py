@@ -13,6 +13,7 @@ from services.presentation.models.sql.async_presentation_generation_status impor
 )
 from services.presentation.models.sql.image_asset import ImageAsset
 from services.presentation.models.sql.key_value import KeyValueSqlModel
+from services.presentation.models.sql.llm_response_cache import LLMResponseCacheEntry
 from services.presentation.models.sql.ollama_pull_status import OllamaPullStatus
 from services.presentation.models.sql.presentation import PresentationModel
 from services.presentation.models.sql.slide import SlideModel
@@ -58,6 +59,7 @@ async def create_db_and_tables():
                     PresentationModel.__table__,
                     SlideModel.__table__,
                     KeyValueSqlModel.__table__,
+                    LLMResponseCacheEntry.__table__,
                     ImageAsset.__table__,
                     PresentationLayoutCodeModel.__table__,
                     TemplateModel.__table__,
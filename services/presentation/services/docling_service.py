@@ -1,3 +1,11 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+
 from docling.document_converter import (
     DocumentConverter,
     PdfFormatOption,
@@ -7,27 +15,123 @@ from docling.document_converter import (
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.datamodel.base_models import InputFormat
 
+from services.presentation.constants.documents import (
+    DOCLING_MARKDOWN_CACHE_MAX_ENTRIES,
+    DOCLING_WORKERS,
+)
+from services.presentation.metrics import (
+    docling_markdown_cache_requests_total,
+    docling_parse_seconds,
+)
+from services.presentation.utils.file_utils import get_file_hash
+from services.presentation.utils.worker_pool import create_worker_pool
+
+# Runs in DoclingService worker processes and is preloaded by their fork
+# server (utils/worker_pool.py), so this module must stay free of import-time
+# side effects
+
+# Converter of the current worker process, created once by the pool initializer
+_converter: Optional[DocumentConverter] = None
+
+
+def create_converter() -> DocumentConverter:
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = False
+
+    return DocumentConverter(
+        allowed_formats=[InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX],
+        format_options={
+            InputFormat.DOCX: WordFormatOption(
+                pipeline_options=pipeline_options,
+            ),
+            InputFormat.PPTX: PowerpointFormatOption(
+                pipeline_options=pipeline_options,
+            ),
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pipeline_options,
+            ),
+        },
+    )
+
+
+def _init_worker():
+    global _converter
+    _converter = create_converter()
+
+
+def _warm_up_worker() -> int:
+    return os.getpid()
+
+
+def _parse_in_worker(file_path: str) -> Tuple[str, float]:
+    start = time.perf_counter()
+    result = _converter.convert(file_path)
+    return result.document.export_to_markdown(), time.perf_counter() - start
+
 
 class DoclingService:
-    def __init__(self):
-        self.pipeline_options = PdfPipelineOptions()
-        self.pipeline_options.do_ocr = False
-
-        self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX],
-            format_options={
-                InputFormat.DOCX: WordFormatOption(
-                    pipeline_options=self.pipeline_options,
-                ),
-                InputFormat.PPTX: PowerpointFormatOption(
-                    pipeline_options=self.pipeline_options,
-                ),
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=self.pipeline_options,
-                ),
-            },
-        )
-
-    def parse_to_markdown(self, file_path: str) -> str:
-        result = self.converter.convert(file_path)
-        return result.document.export_to_markdown()
+    """
+    Parses PDF, DOCX and PPTX files to markdown on a pool of worker
+    processes, so conversions never block the event loop and run in
+    parallel. Each worker loads the docling models once, when the pool
+    starts. Markdown is cached by file content hash.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DOCLING_WORKERS,
+        cache_max_entries: int = DOCLING_MARKDOWN_CACHE_MAX_ENTRIES,
+    ):
+        self.max_workers = max_workers
+        self.cache_max_entries = cache_max_entries
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._markdown_cache: OrderedDict[str, str] = OrderedDict()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Workers are forked from a fork server that never loads models,
+            # since forking a process with model threads is unsafe
+            self._pool = create_worker_pool(self.max_workers, _init_worker)
+        return self._pool
+
+    def start(self):
+        """Start the workers and load their models in the background."""
+        pool = self._get_pool()
+        for _ in range(self.max_workers):
+            pool.submit(_warm_up_worker)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def parse_to_markdown(self, file_path: str) -> str:
+        file_hash = await asyncio.to_thread(get_file_hash, file_path)
+        markdown = self._markdown_cache.get(file_hash)
+        if markdown is not None:
+            self._markdown_cache.move_to_end(file_hash)
+            docling_markdown_cache_requests_total.labels(result="hit").inc()
+            return markdown
+        docling_markdown_cache_requests_total.labels(result="miss").inc()
+
+        loop = asyncio.get_running_loop()
+        try:
+            markdown, seconds = await loop.run_in_executor(
+                self._get_pool(), _parse_in_worker, file_path
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory), start a fresh pool for later files
+            self.close()
+            raise
+
+        file_format = os.path.splitext(file_path)[1].lstrip(".").lower() or "unknown"
+        docling_parse_seconds.labels(format=file_format).observe(seconds)
+        print(f"Parsed {os.path.basename(file_path)} in {seconds:.2f}s")
+
+        self._markdown_cache[file_hash] = markdown
+        while len(self._markdown_cache) > self.cache_max_entries:
+            self._markdown_cache.popitem(last=False)
+        return markdown
+
+
+DOCLING_SERVICE = DoclingService()
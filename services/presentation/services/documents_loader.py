@@ -1,16 +1,19 @@
 import mimetypes
 from fastapi import HTTPException
 import os, asyncio
-from typing import List, Tuple
-import pdfplumber
+from typing import AsyncGenerator, List, Optional, Tuple
 
 from services.presentation.constants.documents import (
+    DOCUMENTS_LOAD_CONCURRENCY,
     PDF_MIME_TYPES,
+    PDF_PAGE_RESOLUTION,
     POWERPOINT_TYPES,
     TEXT_MIME_TYPES,
     WORD_TYPES,
 )
-from services.presentation.services.docling_service import DoclingService
+from services.presentation.services.docling_service import DOCLING_SERVICE
+from services.presentation.services.pdf_page_renderer import PDF_PAGE_RENDERER
+from services.presentation.services.temp_file_service import TEMP_FILE_SERVICE
 
 
 class DocumentsLoader:
@@ -18,7 +21,7 @@ class DocumentsLoader:
     def __init__(self, file_paths: List[str]):
         self._file_paths = file_paths
 
-        self.docling_service = DoclingService()
+        self.docling_service = DOCLING_SERVICE
 
         self._documents: List[str] = []
         self._images: List[List[str]] = []
@@ -33,52 +36,72 @@ class DocumentsLoader:
 
     async def load_documents(
         self,
-        temp_dir: str,
+        temp_dir: Optional[str] = None,
         load_text: bool = True,
         load_images: bool = False,
     ):
-        documents: List[str] = []
-        images: List[str] = []
-
         for file_path in self._file_paths:
             if not os.path.exists(file_path):
                 raise HTTPException(
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
+        # Page images need a directory to be written to
+        if load_images and temp_dir is None:
+            temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
+
+        # Files are parsed in parallel, at most DOCUMENTS_LOAD_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(DOCUMENTS_LOAD_CONCURRENCY)
 
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
+        async def load_document(file_path: str) -> Tuple[str, List[str]]:
+            async with semaphore:
+                return await self.load_document(
                     file_path, load_text, load_images, temp_dir
                 )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
 
-            documents.append(document)
-            images.append(imgs)
+        results = await asyncio.gather(
+            *(load_document(file_path) for file_path in self._file_paths)
+        )
 
-        self._documents = documents
-        self._images = images
+        self._documents = [document for document, _ in results]
+        self._images = [imgs for _, imgs in results]
+
+    async def load_document(
+        self,
+        file_path: str,
+        load_text: bool,
+        load_images: bool,
+        temp_dir: Optional[str],
+    ) -> Tuple[str, List[str]]:
+        document = ""
+        imgs = []
+
+        mime_type = mimetypes.guess_type(file_path)[0]
+        if mime_type in PDF_MIME_TYPES:
+            document, imgs = await self.load_pdf(
+                file_path, load_text, load_images, temp_dir
+            )
+        elif mime_type in TEXT_MIME_TYPES:
+            document = await self.load_text(file_path)
+        elif mime_type in POWERPOINT_TYPES:
+            document = await self.load_powerpoint(file_path)
+        elif mime_type in WORD_TYPES:
+            document = await self.load_msword(file_path)
+
+        return document, imgs
 
     async def load_pdf(
         self,
         file_path: str,
         load_text: bool,
         load_images: bool,
-        temp_dir: str,
+        temp_dir: Optional[str],
     ) -> Tuple[str, List[str]]:
         image_paths = []
         document: str = ""
 
         if load_text:
-            document = self.docling_service.parse_to_markdown(file_path)
+            document = await self.docling_service.parse_to_markdown(file_path)
 
         if load_images:
             image_paths = await self.get_page_images_from_pdf_async(file_path, temp_dir)
@@ -89,25 +112,31 @@ class DocumentsLoader:
         with open(file_path, "r") as file:
             return await asyncio.to_thread(file.read)
 
-    def load_msword(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_msword(self, file_path: str) -> str:
+        return await self.docling_service.parse_to_markdown(file_path)
 
-    def load_powerpoint(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_powerpoint(self, file_path: str) -> str:
+        return await self.docling_service.parse_to_markdown(file_path)
 
     @classmethod
-    def get_page_images_from_pdf(cls, file_path: str, temp_dir: str) -> List[str]:
-        with pdfplumber.open(file_path) as pdf:
-            images = []
-            for page in pdf.pages:
-                img = page.to_image(resolution=150)
-                image_path = os.path.join(temp_dir, f"page_{page.page_number}.png")
-                img.save(image_path)
-                images.append(image_path)
-            return images
+    async def get_page_images_from_pdf_async(
+        cls,
+        file_path: str,
+        temp_dir: str,
+        pages: Optional[List[int]] = None,
+        resolution: int = PDF_PAGE_RESOLUTION,
+    ) -> List[str]:
+        return await PDF_PAGE_RENDERER.render_all(
+            file_path, temp_dir, pages, resolution
+        )
 
     @classmethod
-    async def get_page_images_from_pdf_async(cls, file_path: str, temp_dir: str):
-        return await asyncio.to_thread(
-            cls.get_page_images_from_pdf, file_path, temp_dir
-        )
+    def stream_page_images_from_pdf(
+        cls,
+        file_path: str,
+        temp_dir: str,
+        pages: Optional[List[int]] = None,
+        resolution: int = PDF_PAGE_RESOLUTION,
+    ) -> AsyncGenerator[Tuple[int, str], None]:
+        """Yields (page_number, image_path) as soon as each page is rendered."""
+        return PDF_PAGE_RENDERER.render_pages(file_path, temp_dir, pages, resolution)
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+import mimetypes
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+from urllib.parse import urlparse
+
+import aiohttp
+
+from services.presentation.constants.presentation import (
+    ASSET_CACHE_MAX_BYTES,
+    DOWNLOAD_PER_HOST_CONCURRENCY,
+    DOWNLOAD_TIMEOUT,
+)
+from services.presentation.metrics import (
+    asset_cache_evictions_total,
+    asset_download_requests_total,
+)
+from services.presentation.services.temp_file_service import TEMP_FILE_SERVICE
+from services.presentation.utils.file_utils import link_or_copy_file
+
+
+@dataclass
+class _CachedAsset:
+    # Content addressed file in the cache directory
+    path: str
+    # Name the asset is saved as in output directories
+    filename: str
+    size: int
+
+
+def get_download_filename(url: str, headers) -> str:
+    filename = os.path.basename(urlparse(url).path)
+    if filename and "." in filename:
+        return filename
+
+    content_disposition = headers.get("Content-Disposition", "")
+    if "filename=" in content_disposition:
+        return content_disposition.split("filename=")[1].strip("\"'")
+
+    content_type = headers.get("Content-Type", "")
+    if content_type:
+        extension = mimetypes.guess_extension(content_type.split(";")[0])
+        if extension:
+            return f"{uuid.uuid4()}{extension}"
+
+    return filename or str(uuid.uuid4())
+
+
+class DownloadManager:
+    """
+    Downloads network assets (slide images) over one shared HTTP session.
+
+    - At most DOWNLOAD_PER_HOST_CONCURRENCY downloads run per host
+    - Concurrent requests for the same URL share a single download
+    - Downloads are kept in an on-disk cache, addressed by content hash and
+      evicted least recently used first once ASSET_CACHE_MAX_BYTES is
+      exceeded, so exports reuse images already fetched during generation
+    """
+
+    def __init__(
+        self,
+        max_cache_bytes: int = ASSET_CACHE_MAX_BYTES,
+        per_host_concurrency: int = DOWNLOAD_PER_HOST_CONCURRENCY,
+    ):
+        self.max_cache_bytes = max_cache_bytes
+        self.per_host_concurrency = per_host_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._prefetch_tasks: Set[asyncio.Task] = set()
+        # url -> cached asset, least recently used first
+        self._assets: OrderedDict[str, _CachedAsset] = OrderedDict()
+        # cached file path -> size, shared by urls with identical content
+        self._files: Dict[str, int] = {}
+
+    @property
+    def cache_size(self) -> int:
+        return sum(self._files.values())
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                trust_env=True,
+                timeout=aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT),
+            )
+        return self._session
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def close(self):
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def download(
+        self, url: str, save_directory: str, headers: Optional[dict] = None
+    ) -> Optional[str]:
+        """Downloads url (or reuses the cached copy) into save_directory."""
+        os.makedirs(save_directory, exist_ok=True)
+
+        # Retry once if the asset was evicted before it could be linked
+        for _ in range(2):
+            asset = await self.fetch(url, headers)
+            if asset is None:
+                return None
+            save_path = os.path.join(save_directory, asset.filename)
+            try:
+                link_or_copy_file(asset.path, save_path)
+                return save_path
+            except FileNotFoundError:
+                self._forget(url)
+        return None
+
+    def prefetch(self, url: str):
+        """Starts downloading url into the cache in the background."""
+        if url in self._assets or url in self._in_flight:
+            return
+        task = asyncio.create_task(self.fetch(url))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def fetch(
+        self, url: str, headers: Optional[dict] = None
+    ) -> Optional[_CachedAsset]:
+        asset = self._assets.get(url)
+        if asset is not None:
+            if os.path.exists(asset.path):
+                self._assets.move_to_end(url)
+                asset_download_requests_total.labels(result="hit").inc()
+                return asset
+            self._forget(url)
+
+        task = self._in_flight.get(url)
+        if task is not None:
+            asset_download_requests_total.labels(result="coalesced").inc()
+        else:
+            asset_download_requests_total.labels(result="miss").inc()
+            task = asyncio.create_task(self._download_to_cache(url, headers))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+
+        # A cancelled caller must not cancel the download for the others
+        return await asyncio.shield(task)
+
+    async def _download_to_cache(
+        self, url: str, headers: Optional[dict]
+    ) -> Optional[_CachedAsset]:
+        cache_dir = TEMP_FILE_SERVICE.create_temp_dir("asset_cache")
+        partial_path = os.path.join(cache_dir, f"{uuid.uuid4()}.partial")
+        try:
+            async with self._get_host_semaphore(url):
+                async with self._get_session().get(url, headers=headers) as response:
+                    if response.status != 200:
+                        print(
+                            f"Failed to download file. HTTP status: {response.status}"
+                        )
+                        asset_download_requests_total.labels(result="failed").inc()
+                        return None
+
+                    filename = get_download_filename(url, response.headers)
+                    digest = hashlib.sha256()
+                    size = 0
+                    with open(partial_path, "wb") as file:
+                        async for chunk in response.content.iter_chunked(65536):
+                            digest.update(chunk)
+                            file.write(chunk)
+                            size += len(chunk)
+
+            path = os.path.join(
+                cache_dir, f"{digest.hexdigest()}{os.path.splitext(filename)[1]}"
+            )
+            os.replace(partial_path, path)
+        except Exception as e:
+            print(f"Error downloading file from {url}: {e}")
+            asset_download_requests_total.labels(result="failed").inc()
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return None
+
+        print(f"File downloaded successfully: {url}")
+        asset = _CachedAsset(path=path, filename=filename, size=size)
+        self._assets[url] = asset
+        self._files[path] = size
+        self._evict()
+        return asset
+
+    def _forget(self, url: str):
+        asset = self._assets.pop(url, None)
+        if asset is None:
+            return
+        if not any(each.path == asset.path for each in self._assets.values()):
+            self._files.pop(asset.path, None)
+            if os.path.exists(asset.path):
+                os.remove(asset.path)
+
+    def _evict(self):
+        # Always keep the asset that was just added
+        while self.cache_size > self.max_cache_bytes and len(self._assets) > 1:
+            url = next(iter(self._assets))
+            self._forget(url)
+            asset_cache_evictions_total.inc()
+
+
+DOWNLOAD_MANAGER = DownloadManager()
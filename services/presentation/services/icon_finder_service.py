@@ -1,61 +1,172 @@
 import asyncio
 import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+from services.presentation.constants.presentation import (
+    ICON_SEARCH_BATCH_WINDOW,
+    ICON_SEARCH_CACHE_MAX_ENTRIES,
+)
+from services.presentation.metrics import (
+    icon_search_batch_size,
+    icon_search_cache_requests_total,
+)
+
+ICONS_PATH = Path(__file__).parent.parent / "assets" / "icons.json"
+
 
 class IconFinderService:
-    def __init__(self):
+    """
+    Resolves icon queries to icon urls with a vector search over the icons
+    collection.
+
+    Queries made within ICON_SEARCH_BATCH_WINDOW of each other (e.g. all the
+    icons of a deck) are embedded in one ONNX call and sent to Chroma as one
+    bulk query. Results are kept in an LRU cache, since the same queries
+    recur across decks.
+
+    The collection is built at image build time with
+    ``python -m services.presentation.services.icon_finder_service``.
+    """
+
+    def __init__(
+        self,
+        batch_window: float = ICON_SEARCH_BATCH_WINDOW,
+        cache_max_entries: int = ICON_SEARCH_CACHE_MAX_ENTRIES,
+    ):
         self.collection_name = "icons"
-        self.client = chromadb.PersistentClient(
+        self.batch_window = batch_window
+        self.cache_max_entries = cache_max_entries
+        self.collection = None
+        self.embedding_function = None
+        self._load_lock = threading.Lock()
+        # (query, k) -> icon urls, least recently used first
+        self._cache: OrderedDict[Tuple[str, int], List[str]] = OrderedDict()
+        # Queries waiting for the next batch
+        self._pending: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _create_client(self):
+        return chromadb.PersistentClient(
             path="chroma", settings=Settings(anonymized_telemetry=False)
         )
-        print("Initializing icons collection...")
-        self._initialize_icons_collection()
-        print("Icons collection initialized.")
-
-    def _initialize_icons_collection(self):
-        self.embedding_function = ONNXMiniLM_L6_V2()
-        self.embedding_function.DOWNLOAD_PATH = "chroma/models"
-        self.embedding_function._download_model_if_not_exists()
+
+    def _create_embedding_function(self):
+        embedding_function = ONNXMiniLM_L6_V2()
+        embedding_function.DOWNLOAD_PATH = "chroma/models"
+        embedding_function._download_model_if_not_exists()
+        return embedding_function
+
+    def build_index(self):
+        """Builds the icons collection from assets/icons.json."""
+        client = self._create_client()
+        embedding_function = self._create_embedding_function()
+        with open(ICONS_PATH, "r") as f:
+            icons = json.load(f)
+
+        documents = []
+        ids = []
+        for each in icons["icons"]:
+            if each["name"].split("-")[-1] == "bold":
+                documents.append(f"{each['name']} {each['tags']}")
+                ids.append(each["name"])
+
         try:
-            self.collection = self.client.get_collection(
-                self.collection_name, embedding_function=self.embedding_function
-            )
+            client.delete_collection(self.collection_name)
         except Exception:
-            import os
-            from pathlib import Path
-            # Get the path relative to this service file
-            base_dir = Path(__file__).parent.parent
-            icons_path = base_dir / "assets" / "icons.json"
-            with open(icons_path, "r") as f:
-                icons = json.load(f)
-
-            documents = []
-            ids = []
-
-            for i, each in enumerate(icons["icons"]):
-                if each["name"].split("-")[-1] == "bold":
-                    doc_text = f"{each['name']} {each['tags']}"
-                    documents.append(doc_text)
-                    ids.append(each["name"])
-
-            if documents:
-                self.collection = self.client.create_collection(
-                    name=self.collection_name,
-                    embedding_function=self.embedding_function,
-                    metadata={"hnsw:space": "cosine"},
+            pass
+        collection = client.create_collection(
+            name=self.collection_name,
+            embedding_function=embedding_function,
+            metadata={"hnsw:space": "cosine"},
+        )
+        collection.add(documents=documents, ids=ids)
+        print(f"Icons collection built with {len(ids)} icons.")
+
+    def load(self):
+        """Loads the embedding model and the icons collection, once."""
+        with self._load_lock:
+            if self.collection is not None:
+                return
+            print("Loading icons collection...")
+            client = self._create_client()
+            embedding_function = self._create_embedding_function()
+            try:
+                collection = client.get_collection(
+                    self.collection_name, embedding_function=embedding_function
+                )
+            except Exception:
+                print("Icons collection not found, building it now.")
+                self.build_index()
+                collection = client.get_collection(
+                    self.collection_name, embedding_function=embedding_function
                 )
-                self.collection.add(documents=documents, ids=ids)
+            self.embedding_function = embedding_function
+            self.collection = collection
+            print("Icons collection loaded.")
 
-    async def search_icons(self, query: str, k: int = 1):
-        result = await asyncio.to_thread(
-            self.collection.query,
-            query_texts=[query],
-            n_results=k,
+    def _query_batch(self, queries: List[str], n_results: int) -> List[List[str]]:
+        self.load()
+        embeddings = self.embedding_function(queries)
+        result = self.collection.query(
+            query_embeddings=embeddings, n_results=n_results
         )
-        return [f"/static/icons/bold/{each}.svg" for each in result["ids"][0]]
+        return result["ids"]
+
+    async def search_icons(self, query: str, k: int = 1) -> List[str]:
+        key = (query, k)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            icon_search_cache_requests_total.labels(result="hit").inc()
+            return cached
+        icon_search_cache_requests_total.labels(result="miss").inc()
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await asyncio.shield(future)
+
+    async def search_icons_batch(self, queries: List[str], k: int = 1) -> List[List[str]]:
+        return await asyncio.gather(*(self.search_icons(query, k) for query in queries))
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.batch_window)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        queries = list(dict.fromkeys(query for query, _ in pending))
+        n_results = max(k for _, k in pending)
+        icon_search_batch_size.observe(len(queries))
+        try:
+            ids = await asyncio.to_thread(self._query_batch, queries, n_results)
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        ids_by_query = dict(zip(queries, ids))
+        for (query, k), future in pending.items():
+            icons = [f"/static/icons/bold/{each}.svg" for each in ids_by_query[query][:k]]
+            self._cache[(query, k)] = icons
+            if not future.done():
+                future.set_result(icons)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
 
 
 ICON_FINDER_SERVICE = IconFinderService()
+
+
+if __name__ == "__main__":
+    ICON_FINDER_SERVICE.build_index()
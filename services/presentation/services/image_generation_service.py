@@ -4,10 +4,17 @@ import aiohttp
 from google import genai
 from google.genai.types import GenerateContentConfig
 from openai import AsyncOpenAI
+from services.presentation.enums.llm_provider import LLMProvider
 from services.presentation.models.image_prompt import ImagePrompt
 from services.presentation.models.sql.image_asset import ImageAsset
+from services.presentation.services.download_manager import DOWNLOAD_MANAGER
+from services.presentation.services.llm_client_registry import LLM_CLIENT_REGISTRY
 from services.presentation.utils.download_helpers import download_file
-from services.presentation.utils.get_env import get_pexels_api_key_env
+from services.presentation.utils.get_env import (
+    get_google_api_key_env,
+    get_openai_api_key_env,
+    get_pexels_api_key_env,
+)
 from services.presentation.utils.get_env import get_pixabay_api_key_env
 from services.presentation.utils.image_provider import (
     is_pixels_selected,
@@ -64,6 +71,8 @@ class ImageGenerationService:
                 )
             if image_path:
                 if image_path.startswith("http"):
+                    # Cache the stock image now so exports don't download it again
+                    DOWNLOAD_MANAGER.prefetch(image_path)
                     return image_path
                 elif os.path.exists(image_path):
                     return ImageAsset(
@@ -81,7 +90,9 @@ class ImageGenerationService:
             return "/static/images/placeholder.jpg"
 
     async def generate_image_openai(self, prompt: str, output_directory: str) -> str:
-        client = AsyncOpenAI()
+        client: AsyncOpenAI = LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.OPENAI, api_key=get_openai_api_key_env()
+        )
         result = await client.images.generate(
             model="dall-e-3",
             prompt=prompt,
@@ -93,7 +104,9 @@ class ImageGenerationService:
         return await download_file(image_url, output_directory)
 
     async def generate_image_google(self, prompt: str, output_directory: str) -> str:
-        client = genai.Client()
+        client: genai.Client = LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE, api_key=get_google_api_key_env()
+        )
         response = await asyncio.to_thread(
             client.models.generate_content,
             model="gemini-2.5-flash-image-preview",
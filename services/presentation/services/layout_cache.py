@@ -0,0 +1,106 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import aiohttp
+from fastapi import HTTPException
+
+from services.presentation.constants.presentation import (
+    LAYOUT_CACHE_REVALIDATE_AFTER,
+    LAYOUT_CACHE_TIMEOUT,
+)
+from services.presentation.metrics import layout_cache_requests_total
+from services.presentation.models.presentation_layout import PresentationLayoutModel
+from services.presentation.utils.compiled_schemas import (
+    invalidate_layout_schemas,
+    precompile_layout_schemas,
+)
+
+TEMPLATE_URL = "http://localhost/api/template"
+
+
+@dataclass
+class _CachedLayout:
+    layout: PresentationLayoutModel
+    etag: Optional[str]
+    # sha256 of the template JSON, for servers that don't send an ETag
+    version: str
+    validated_at: float
+
+
+class LayoutCache:
+    """
+    In-process cache of parsed templates from the Next.js template API.
+
+    A cached layout is served without a round trip for
+    LAYOUT_CACHE_REVALIDATE_AFTER seconds. After that it is revalidated with
+    If-None-Match, and an unchanged body (same ETag, or same content hash)
+    keeps the already parsed model. Layout-management endpoints invalidate
+    a group when its templates are saved or deleted.
+
+    Returned models are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, revalidate_after: float = LAYOUT_CACHE_REVALIDATE_AFTER):
+        self.revalidate_after = revalidate_after
+        self._layouts: Dict[str, _CachedLayout] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=LAYOUT_CACHE_TIMEOUT)
+            )
+        return self._session
+
+    async def get(self, layout_name: str) -> PresentationLayoutModel:
+        cached = self._layouts.get(layout_name)
+        now = time.monotonic()
+        if cached and now - cached.validated_at < self.revalidate_after:
+            layout_cache_requests_total.labels(result="hit").inc()
+            return cached.layout
+
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+        async with self._get_session().get(
+            TEMPLATE_URL, params={"group": layout_name}, headers=headers
+        ) as response:
+            if response.status == 304 and cached:
+                cached.validated_at = now
+                layout_cache_requests_total.labels(result="not_modified").inc()
+                return cached.layout
+            if response.status != 200:
+                error_text = await response.text()
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Template '{layout_name}' not found: {error_text}",
+                )
+            body = await response.read()
+            etag = response.headers.get("ETag")
+
+        version = hashlib.sha256(body).hexdigest()
+        if cached and cached.version == version:
+            cached.etag = etag
+            cached.validated_at = now
+            layout_cache_requests_total.labels(result="not_modified").inc()
+            return cached.layout
+
+        layout = PresentationLayoutModel(**json.loads(body))
+        precompile_layout_schemas(layout)
+        self._layouts[layout_name] = _CachedLayout(layout, etag, version, now)
+        layout_cache_requests_total.labels(result="miss").inc()
+        return layout
+
+    def invalidate(self, layout_name: str):
+        self._layouts.pop(layout_name, None)
+        invalidate_layout_schemas(layout_name)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._layouts.clear()
+
+
+LAYOUT_CACHE = LayoutCache()
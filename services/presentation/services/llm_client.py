@@ -39,6 +39,8 @@ from services.presentation.models.llm_tool_call import (
     OpenAIToolCallFunction,
 )
 from services.presentation.models.llm_tools import LLMDynamicTool, LLMTool
+from services.presentation.services.llm_client_registry import LLM_CLIENT_REGISTRY
+from services.presentation.services.llm_scheduler import LLM_SCHEDULER, estimate_tokens
 from services.presentation.services.llm_tool_calls_handler import LLMToolCallsHandler
 from services.presentation.utils.async_iterator import iterator_to_async
 from services.presentation.utils.dummy_functions import do_nothing_async
@@ -53,13 +55,10 @@ from services.presentation.utils.get_env import (
     get_tool_calls_env,
     get_web_grounding_env,
 )
+from services.presentation.utils.compiled_schemas import get_parameters_schema
 from services.presentation.utils.llm_provider import get_llm_provider, get_model
 from services.presentation.utils.parsers import parse_bool_or_none
-from services.presentation.utils.schema_utils import (
-    ensure_strict_json_schema,
-    flatten_json_schema,
-    remove_titles_from_schema,
-)
+from services.presentation.utils.schema_utils import ensure_strict_json_schema
 
 
 class LLMClient:
@@ -112,7 +111,9 @@ class LLMClient:
                 status_code=400,
                 detail="OpenAI API Key is not set",
             )
-        return AsyncOpenAI()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.OPENAI, api_key=get_openai_api_key_env()
+        )
 
     def _get_google_client(self):
         if not get_google_api_key_env():
@@ -120,7 +121,9 @@ class LLMClient:
                 status_code=400,
                 detail="Google API Key is not set",
             )
-        return genai.Client()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE, api_key=get_google_api_key_env()
+        )
 
     def _get_anthropic_client(self):
         if not get_anthropic_api_key_env():
@@ -128,10 +131,13 @@ class LLMClient:
                 status_code=400,
                 detail="Anthropic API Key is not set",
             )
-        return AsyncAnthropic()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.ANTHROPIC, api_key=get_anthropic_api_key_env()
+        )
 
     def _get_ollama_client(self):
-        return AsyncOpenAI(
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.OLLAMA,
             base_url=(get_ollama_url_env() or "http://localhost:11434") + "/v1",
             api_key="ollama",
         )
@@ -142,7 +148,8 @@ class LLMClient:
                 status_code=400,
                 detail="Custom LLM URL is not set",
             )
-        return AsyncOpenAI(
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.CUSTOM,
             base_url=get_custom_llm_url_env(),
             api_key=get_custom_llm_api_key_env() or "null",
         )
@@ -403,6 +410,19 @@ class LLMClient:
         messages: List[LLMMessage],
         max_tokens: Optional[int] = None,
         tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
+    ):
+        return await LLM_SCHEDULER.run(
+            self.llm_provider,
+            estimate_tokens(messages, max_tokens),
+            lambda: self._generate(model, messages, max_tokens, tools),
+        )
+
+    async def _generate(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
@@ -579,9 +599,7 @@ class LLMClient:
                         {
                             "name": "ResponseSchema",
                             "description": "Provide response to the user",
-                            "parameters": remove_titles_from_schema(
-                                flatten_json_schema(response_format)
-                            ),
+                            "parameters": get_parameters_schema(response_format),
                         }
                     ]
                 )
@@ -774,6 +792,23 @@ class LLMClient:
         strict: bool = False,
         tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
         max_tokens: Optional[int] = None,
+    ) -> dict:
+        return await LLM_SCHEDULER.run(
+            self.llm_provider,
+            estimate_tokens(messages, max_tokens),
+            lambda: self._generate_structured(
+                model, messages, response_format, strict, tools, max_tokens
+            ),
+        )
+
+    async def _generate_structured(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool = False,
+        tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
+        max_tokens: Optional[int] = None,
     ) -> dict:
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
@@ -1094,6 +1129,19 @@ class LLMClient:
         messages: List[LLMMessage],
         max_tokens: Optional[int] = None,
         tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
+    ):
+        return LLM_SCHEDULER.stream(
+            self.llm_provider,
+            estimate_tokens(messages, max_tokens),
+            lambda: self._stream(model, messages, max_tokens, tools),
+        )
+
+    def _stream(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
@@ -1300,9 +1348,7 @@ class LLMClient:
                         {
                             "name": "ResponseSchema",
                             "description": "Provide response to the user",
-                            "parameters": remove_titles_from_schema(
-                                flatten_json_schema(response_format)
-                            ),
+                            "parameters": get_parameters_schema(response_format),
                         }
                     ]
                 )
@@ -1518,6 +1564,23 @@ class LLMClient:
         strict: bool = False,
         tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
         max_tokens: Optional[int] = None,
+    ):
+        return LLM_SCHEDULER.stream(
+            self.llm_provider,
+            estimate_tokens(messages, max_tokens),
+            lambda: self._stream_structured(
+                model, messages, response_format, strict, tools, max_tokens
+            ),
+        )
+
+    def _stream_structured(
+        self,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+        strict: bool = False,
+        tools: Optional[List[type[LLMTool] | LLMDynamicTool]] = None,
+        max_tokens: Optional[int] = None,
     ):
         parsed_tools = self.tool_calls_handler.parse_tools(tools)
 
@@ -0,0 +1,112 @@
+import inspect
+from typing import Any, Optional
+
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient as AnthropicHttpxClient
+from google import genai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient as OpenAIHttpxClient
+
+from services.presentation.constants.llm import (
+    LLM_HTTP_KEEPALIVE_EXPIRY,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.metrics import (
+    llm_clients_created_total,
+    llm_http_connections_opened_total,
+    llm_http_requests_total,
+)
+
+
+class LLMClientRegistry:
+    """
+    Process-wide provider SDK clients, keyed by provider, base URL and API key.
+
+    Clients are created on first use and shared by every LLMClient, so their
+    HTTP connection pools (and TLS sessions) are reused across requests and
+    slides. A changed key or URL simply gets its own client.
+
+    SDK-level retries are disabled: the LLM request scheduler owns rate-limit
+    retries, so a 429 reaches it at once instead of after hidden retries
+    made while holding its slot.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[LLMProvider, Optional[str], Optional[str]], Any] = {}
+
+    def get_client(
+        self,
+        provider: LLMProvider,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
+        key = (provider, base_url, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._create_client(provider, base_url, api_key)
+            self._clients[key] = client
+            llm_clients_created_total.labels(provider=provider.value).inc()
+        return client
+
+    def _create_client(
+        self,
+        provider: LLMProvider,
+        base_url: Optional[str],
+        api_key: Optional[str],
+    ):
+        match provider:
+            case LLMProvider.ANTHROPIC:
+                return AsyncAnthropic(
+                    api_key=api_key,
+                    max_retries=0,
+                    http_client=AnthropicHttpxClient(
+                        **self._http_client_options(provider)
+                    ),
+                )
+            case LLMProvider.GOOGLE:
+                # The GenAI SDK manages its own connection pool; sharing the
+                # client instance is what keeps it warm
+                return genai.Client(api_key=api_key)
+            case _:
+                return AsyncOpenAI(
+                    base_url=base_url,
+                    api_key=api_key,
+                    max_retries=0,
+                    http_client=OpenAIHttpxClient(**self._http_client_options(provider)),
+                )
+
+    def _http_client_options(self, provider: LLMProvider) -> dict:
+        async def trace(event_name: str, _info: dict):
+            if event_name == "connection.connect_tcp.complete":
+                llm_http_connections_opened_total.labels(provider=provider.value).inc()
+
+        async def on_request(request: httpx.Request):
+            llm_http_requests_total.labels(provider=provider.value).inc()
+            request.extensions.setdefault("trace", trace)
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            "event_hooks": {"request": [on_request]},
+        }
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                print(f"Error closing LLM client: {e}")
+
+
+LLM_CLIENT_REGISTRY = LLMClientRegistry()
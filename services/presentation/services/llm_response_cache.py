@@ -0,0 +1,157 @@
+import hashlib
+import json
+import time
+from typing import List, Optional
+
+from sqlalchemy import delete
+from sqlmodel import select
+
+from services.presentation.constants.llm import (
+    LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    LLM_RESPONSE_CACHE_TTL,
+)
+from services.presentation.metrics import (
+    llm_response_cache_evictions_total,
+    llm_response_cache_requests_total,
+)
+from services.presentation.models.llm_message import LLMMessage
+from services.presentation.models.sql.llm_response_cache import LLMResponseCacheEntry
+from services.presentation.services.database import async_session_maker
+from services.presentation.utils.get_env import get_llm_response_cache_env
+from services.presentation.utils.parsers import parse_bool_or_none
+
+KEY_PREFIX = "llm_response_cache:"
+
+
+def normalize_messages(messages: List[LLMMessage]) -> List[dict]:
+    """Messages with indentation and blank lines removed, so formatting-only
+    differences in prompt templates map to the same cache entry."""
+    normalized = []
+    for message in messages:
+        content = message.content
+        if isinstance(content, str):
+            content = "\n".join(
+                line.strip() for line in content.splitlines() if line.strip()
+            )
+        normalized.append({"role": message.role, "content": content})
+    return normalized
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for structured LLM responses.
+
+    Entries are stored in the presentation database (LLMResponseCacheEntry)
+    under a SHA-256 of the provider, model, normalized messages and response
+    schema, so every worker shares them. Entries expire after ``ttl`` seconds
+    and the oldest entries are evicted once there are more than
+    ``max_entries``. Eviction runs in SQL every ``max_entries // 10`` writes
+    of a worker rather than on every write.
+    """
+
+    def __init__(
+        self,
+        ttl: int = LLM_RESPONSE_CACHE_TTL,
+        max_entries: int = LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._evict_every = max(1, max_entries // 10)
+        self._writes_since_evict = 0
+
+    @property
+    def enabled(self) -> bool:
+        return parse_bool_or_none(get_llm_response_cache_env()) or False
+
+    def get_key(
+        self,
+        provider: str,
+        model: str,
+        messages: List[LLMMessage],
+        response_format: dict,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "messages": normalize_messages(messages),
+                "response_format": response_format,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[dict]:
+        try:
+            async with async_session_maker() as session:
+                entry = await session.get(LLMResponseCacheEntry, key)
+                if entry and entry.expires_at <= time.time():
+                    await session.delete(entry)
+                    await session.commit()
+                    entry = None
+        except Exception as e:
+            print(f"LLM response cache lookup failed: {e}")
+            return None
+
+        llm_response_cache_requests_total.labels(
+            result="hit" if entry else "miss"
+        ).inc()
+        return entry.response if entry else None
+
+    async def set(self, key: str, response: dict):
+        now = time.time()
+        try:
+            async with async_session_maker() as session:
+                await session.execute(
+                    delete(LLMResponseCacheEntry).where(
+                        LLMResponseCacheEntry.key == key
+                    )
+                )
+                session.add(
+                    LLMResponseCacheEntry(
+                        key=key,
+                        created_at=now,
+                        expires_at=now + self.ttl,
+                        response=response,
+                    )
+                )
+                await session.commit()
+
+                self._writes_since_evict += 1
+                if self._writes_since_evict >= self._evict_every:
+                    self._writes_since_evict = 0
+                    await self._evict(session, now)
+        except Exception as e:
+            print(f"LLM response cache write failed: {e}")
+
+    async def _evict(self, session, now: float):
+        # Drop expired entries first
+        expired = await session.execute(
+            delete(LLMResponseCacheEntry).where(
+                LLMResponseCacheEntry.expires_at <= now
+            )
+        )
+        n_evicted = expired.rowcount or 0
+
+        # Then, when over the limit, the oldest down to 90% of it
+        newest_first = select(LLMResponseCacheEntry.key).order_by(
+            LLMResponseCacheEntry.created_at.desc()
+        )
+        over_limit = await session.scalar(newest_first.offset(self.max_entries).limit(1))
+        if over_limit is not None:
+            oldest = await session.execute(
+                delete(LLMResponseCacheEntry).where(
+                    LLMResponseCacheEntry.key.in_(
+                        newest_first.offset(int(self.max_entries * 0.9))
+                    )
+                )
+            )
+            n_evicted += oldest.rowcount or 0
+
+        await session.commit()
+        if n_evicted:
+            llm_response_cache_evictions_total.inc(n_evicted)
+
+
+LLM_RESPONSE_CACHE = LLMResponseCache()
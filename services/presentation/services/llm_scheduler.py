@@ -0,0 +1,316 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from services.presentation.constants.llm import (
+    LLM_DEFAULT_OUTPUT_TOKENS,
+    LLM_PROVIDER_BUDGETS,
+    LLM_RATE_LIMIT_DEFAULT_RETRY_AFTER,
+    LLM_RATE_LIMIT_MAX_RETRIES,
+)
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.metrics import (
+    llm_scheduler_in_flight,
+    llm_scheduler_queue_depth,
+    llm_scheduler_rate_limited_total,
+    llm_scheduler_wait_seconds,
+)
+from services.presentation.models.llm_message import LLMMessage
+from services.presentation.utils.get_env import get_llm_budget_env
+
+T = TypeVar("T")
+
+WINDOW_SECONDS = 60.0
+
+# Requests are queued fairly between flows (e.g. one flow per presentation)
+llm_flow: ContextVar[str] = ContextVar("llm_flow", default="default")
+
+
+def set_llm_flow(flow_id: str):
+    """Queue LLM requests made from the current context under ``flow_id``."""
+    llm_flow.set(flow_id)
+
+
+def get_provider_budget(provider: str) -> dict:
+    """
+    Scheduler budget of ``provider``: LLM_PROVIDER_BUDGETS, overridden per
+    limit from the environment, e.g. LLM_ANTHROPIC_REQUESTS_PER_MINUTE=4000
+    or LLM_OLLAMA_MAX_CONCURRENT=8 ("none" for unlimited).
+    """
+    budget = dict(LLM_PROVIDER_BUDGETS.get(provider, {}))
+    for name in ("max_concurrent", "requests_per_minute", "tokens_per_minute"):
+        value = get_llm_budget_env(provider, name)
+        if not value:
+            continue
+        try:
+            budget[name] = None if value.strip().lower() == "none" else int(value)
+        except ValueError:
+            print(f"Ignoring invalid LLM budget {provider} {name}: {value}")
+    return budget
+
+
+def estimate_tokens(messages: List[LLMMessage], max_tokens: Optional[int] = None) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the output."""
+    prompt_chars = sum(len(str(getattr(message, "content", ""))) for message in messages)
+    return prompt_chars // 4 + (max_tokens or LLM_DEFAULT_OUTPUT_TOKENS)
+
+
+def get_retry_after(e: Exception) -> Optional[float]:
+    """Seconds to back off if ``e`` is a provider rate-limit error, otherwise None."""
+    status = getattr(e, "status_code", None) or getattr(e, "code", None)
+    if status != 429:
+        return None
+
+    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    return LLM_RATE_LIMIT_DEFAULT_RETRY_AFTER
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: int
+    flow: str
+
+
+class _ProviderQueue:
+    def __init__(
+        self,
+        provider: str,
+        max_concurrent: int,
+        requests_per_minute: Optional[int],
+        tokens_per_minute: Optional[int],
+    ):
+        self.provider = provider
+        self.max_concurrent = max_concurrent
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.in_flight = 0
+        self.paused_until = 0.0
+        # Waiting requests per flow; flows are served round-robin
+        self.flows: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+        # Requests admitted during the last minute: (admitted_at, tokens)
+        self.window: deque[tuple[float, int]] = deque()
+        self.window_tokens = 0
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._wakeup_at = 0.0
+
+    def budget_wait(self, tokens: int, now: float) -> float:
+        """Seconds until a request of ``tokens`` fits the per-minute budgets."""
+        while self.window and self.window[0][0] <= now - WINDOW_SECONDS:
+            self.window_tokens -= self.window.popleft()[1]
+
+        wait = 0.0
+        if self.requests_per_minute and len(self.window) >= self.requests_per_minute:
+            oldest = self.window[len(self.window) - self.requests_per_minute]
+            wait = max(wait, oldest[0] + WINDOW_SECONDS - now)
+
+        # An oversized request still runs once the window has drained
+        if (
+            self.tokens_per_minute
+            and self.window
+            and self.window_tokens + tokens > self.tokens_per_minute
+        ):
+            excess = self.window_tokens + tokens - self.tokens_per_minute
+            for admitted_at, admitted_tokens in self.window:
+                excess -= admitted_tokens
+                if excess <= 0:
+                    break
+            wait = max(wait, admitted_at + WINDOW_SECONDS - now)
+
+        return wait
+
+    def admit(self, waiter: _Waiter, now: float):
+        self.in_flight += 1
+        self.window.append((now, waiter.tokens))
+        self.window_tokens += waiter.tokens
+        llm_scheduler_in_flight.labels(provider=self.provider).set(self.in_flight)
+        waiter.future.set_result(None)
+
+    def remove(self, waiter: _Waiter):
+        queue = self.flows.get(waiter.flow)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self.flows[waiter.flow]
+
+    def wake_at(self, when: float, callback: Callable[[], None]):
+        """Call ``callback`` at monotonic time ``when`` (keeping the earliest wakeup)."""
+        if self._wakeup is not None:
+            if self._wakeup_at <= when:
+                return
+            self._wakeup.cancel()
+
+        def wake():
+            self._wakeup = None
+            callback()
+
+        self._wakeup_at = when
+        self._wakeup = asyncio.get_running_loop().call_later(
+            max(0.0, when - time.monotonic()), wake
+        )
+
+
+class LLMScheduler:
+    """
+    Process-wide admission control for LLM requests.
+
+    Each provider has a window of at most ``max_concurrent`` in-flight
+    requests plus per-minute request and token budgets (LLM_PROVIDER_BUDGETS,
+    overridable from the environment, see get_provider_budget).
+    A request starts as soon as a slot frees up, instead of waiting for a
+    whole batch to finish. Waiting requests are served round-robin across
+    flows so one large deck cannot starve other users, and a 429 pauses the
+    provider for its retry-after period before the request is retried.
+    """
+
+    def __init__(self, budgets: Optional[dict] = None):
+        # Explicit budgets replace the defaults and environment overrides
+        self.budgets = budgets
+        self._queues: dict[str, _ProviderQueue] = {}
+
+    def _get_queue(self, provider: LLMProvider) -> _ProviderQueue:
+        name = provider.value
+        queue = self._queues.get(name)
+        if queue is None:
+            budget = (
+                self.budgets.get(name, {})
+                if self.budgets is not None
+                else get_provider_budget(name)
+            )
+            queue = _ProviderQueue(
+                name,
+                max_concurrent=budget.get("max_concurrent") or 1,
+                requests_per_minute=budget.get("requests_per_minute"),
+                tokens_per_minute=budget.get("tokens_per_minute"),
+            )
+            self._queues[name] = queue
+        return queue
+
+    async def run(
+        self,
+        provider: LLMProvider,
+        tokens: int,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run ``call`` once admitted, retrying after provider rate limits."""
+        queue = self._get_queue(provider)
+        for attempt in range(LLM_RATE_LIMIT_MAX_RETRIES + 1):
+            await self._acquire(queue, tokens)
+            try:
+                return await call()
+            except Exception as e:
+                retry_after = get_retry_after(e)
+                if retry_after is None:
+                    raise
+                self._pause(queue, retry_after)
+                if attempt == LLM_RATE_LIMIT_MAX_RETRIES:
+                    raise
+                print(f"{provider.value} rate limited, retrying in {retry_after:.1f}s")
+            finally:
+                self._release(queue)
+
+    async def stream(
+        self,
+        provider: LLMProvider,
+        tokens: int,
+        call: Callable[[], AsyncIterator[T]],
+    ) -> AsyncGenerator[T, None]:
+        """Iterate ``call()`` while holding a slot for the whole stream."""
+        queue = self._get_queue(provider)
+        await self._acquire(queue, tokens)
+        try:
+            async for chunk in call():
+                yield chunk
+        except Exception as e:
+            retry_after = get_retry_after(e)
+            if retry_after is not None:
+                self._pause(queue, retry_after)
+            raise
+        finally:
+            self._release(queue)
+
+    async def _acquire(self, queue: _ProviderQueue, tokens: int):
+        flow = llm_flow.get()
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), tokens, flow)
+        queue.flows.setdefault(flow, deque()).append(waiter)
+        llm_scheduler_queue_depth.labels(provider=queue.provider).inc()
+        enqueued_at = time.monotonic()
+        try:
+            self._dispatch(queue)
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release(queue)
+            else:
+                queue.remove(waiter)
+                self._dispatch(queue)
+            raise
+        finally:
+            llm_scheduler_queue_depth.labels(provider=queue.provider).dec()
+            llm_scheduler_wait_seconds.labels(provider=queue.provider).observe(
+                time.monotonic() - enqueued_at
+            )
+
+    def _release(self, queue: _ProviderQueue):
+        queue.in_flight -= 1
+        llm_scheduler_in_flight.labels(provider=queue.provider).set(queue.in_flight)
+        self._dispatch(queue)
+
+    def _pause(self, queue: _ProviderQueue, seconds: float):
+        llm_scheduler_rate_limited_total.labels(provider=queue.provider).inc()
+        queue.paused_until = max(queue.paused_until, time.monotonic() + seconds)
+
+    def _dispatch(self, queue: _ProviderQueue):
+        while queue.flows and queue.in_flight < queue.max_concurrent:
+            now = time.monotonic()
+            if now < queue.paused_until:
+                queue.wake_at(queue.paused_until, lambda: self._dispatch(queue))
+                return
+
+            flow, waiters = next(iter(queue.flows.items()))
+            waiter = waiters[0]
+            if waiter.future.done():
+                queue.remove(waiter)
+                continue
+
+            wait = queue.budget_wait(waiter.tokens, now)
+            if wait > 0:
+                queue.wake_at(now + wait, lambda: self._dispatch(queue))
+                return
+
+            waiters.popleft()
+            if waiters:
+                queue.flows.move_to_end(flow)
+            else:
+                del queue.flows[flow]
+            queue.admit(waiter, now)
+
+
+LLM_SCHEDULER = LLMScheduler()
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from services.presentation.constants.documents import (
+    PDF_PAGE_CACHE_MAX_DOCUMENTS,
+    PDF_PAGE_RESOLUTION,
+    PDF_RENDER_WORKERS,
+)
+from services.presentation.metrics import (
+    pdf_page_cache_requests_total,
+    pdf_page_render_seconds,
+)
+from services.presentation.services.temp_file_service import TEMP_FILE_SERVICE
+from services.presentation.utils.file_utils import get_file_hash, link_or_copy_file
+from services.presentation.utils.pdf_utils import get_pdf_page_count, render_pdf_page
+from services.presentation.utils.worker_pool import create_worker_pool
+
+
+class PdfPageRenderer:
+    """
+    Renders PDF pages to PNG on a pool of worker processes, one task per
+    page, and yields each page as soon as it is ready.
+
+    Rendered pages are cached on disk by document content hash and
+    resolution, so re-rendering the same file (or rendering the rest of
+    its pages later) only renders what is missing.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PDF_RENDER_WORKERS,
+        cache_max_documents: int = PDF_PAGE_CACHE_MAX_DOCUMENTS,
+    ):
+        self.max_workers = max_workers
+        self.cache_max_documents = cache_max_documents
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # (document hash, resolution) -> cache directory, least recently used first
+        self._cached_documents: OrderedDict[Tuple[str, int], str] = OrderedDict()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = create_worker_pool(self.max_workers)
+        return self._pool
+
+    def start(self):
+        """Start the workers up front, so no request waits for them."""
+        pool = self._get_pool()
+        for _ in range(self.max_workers):
+            pool.submit(os.getpid)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_cache_dir(self, document_hash: str, resolution: int) -> str:
+        key = (document_hash, resolution)
+        cache_dir = self._cached_documents.get(key)
+        if cache_dir is None:
+            cache_dir = TEMP_FILE_SERVICE.create_temp_dir(
+                os.path.join("pdf_page_cache", f"{document_hash}_{resolution}")
+            )
+            self._cached_documents[key] = cache_dir
+        self._cached_documents.move_to_end(key)
+
+        while len(self._cached_documents) > self.cache_max_documents:
+            _, evicted_dir = self._cached_documents.popitem(last=False)
+            shutil.rmtree(evicted_dir, ignore_errors=True)
+        return cache_dir
+
+    async def render_pages(
+        self,
+        file_path: str,
+        output_dir: str,
+        pages: Optional[List[int]] = None,
+        resolution: int = PDF_PAGE_RESOLUTION,
+    ) -> AsyncGenerator[Tuple[int, str], None]:
+        """
+        Yields ``(page_number, image_path)`` in completion order.
+
+        Args:
+            file_path: PDF to render
+            output_dir: Directory the page images are placed in (page_{n}.png)
+            pages: 1-based page numbers to render, all pages if None
+            resolution: DPI, lower for thumbnails
+        """
+        document_hash = await asyncio.to_thread(get_file_hash, file_path)
+        if pages is None:
+            page_count = await asyncio.to_thread(get_pdf_page_count, file_path)
+            pages = list(range(1, page_count + 1))
+        cache_dir = self._get_cache_dir(document_hash, resolution)
+
+        loop = asyncio.get_running_loop()
+        pending = {}
+        for page_number in pages:
+            cached_path = os.path.join(cache_dir, f"page_{page_number}.png")
+            if os.path.exists(cached_path):
+                pdf_page_cache_requests_total.labels(result="hit").inc()
+                output_path = os.path.join(output_dir, f"page_{page_number}.png")
+                link_or_copy_file(cached_path, output_path)
+                yield page_number, output_path
+                continue
+
+            pdf_page_cache_requests_total.labels(result="miss").inc()
+            future = loop.run_in_executor(
+                self._get_pool(),
+                render_pdf_page,
+                file_path,
+                page_number,
+                resolution,
+                cached_path,
+            )
+            pending[future] = (page_number, cached_path)
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Yield finished pages in page order
+                for future in sorted(done, key=lambda f: pending[f][0]):
+                    page_number, cached_path = pending.pop(future)
+                    seconds = future.result()
+                    pdf_page_render_seconds.observe(seconds)
+                    output_path = os.path.join(output_dir, f"page_{page_number}.png")
+                    link_or_copy_file(cached_path, output_path)
+                    yield page_number, output_path
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def render_all(
+        self,
+        file_path: str,
+        output_dir: str,
+        pages: Optional[List[int]] = None,
+        resolution: int = PDF_PAGE_RESOLUTION,
+    ) -> List[str]:
+        """Renders the pages and returns their image paths in page order."""
+        rendered = [
+            rendered_page
+            async for rendered_page in self.render_pages(
+                file_path, output_dir, pages, resolution
+            )
+        ]
+        return [image_path for _, image_path in sorted(rendered)]
+
+
+PDF_PAGE_RENDERER = PdfPageRenderer()
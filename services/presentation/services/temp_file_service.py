@@ -9,7 +9,6 @@ class TempFileService:
 
     def __init__(self):
         self.base_dir = get_temp_directory_env() or "/tmp/presenton"
-        self.cleanup_base_dir()
         os.makedirs(self.base_dir, exist_ok=True)
 
     def create_dir_in_dir(self, base_dir: str, dir_name: Optional[str] = None) -> str:
@@ -64,7 +63,9 @@ class TempFileService:
             os.rmdir(dir_path)
 
     def cleanup_base_dir(self):
+        """Empties the base dir; only at startup, before any file is created."""
         self.cleanup_temp_dir(self.base_dir)
+        os.makedirs(self.base_dir, exist_ok=True)
 
 
 TEMP_FILE_SERVICE = TempFileService()
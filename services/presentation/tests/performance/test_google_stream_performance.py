@@ -0,0 +1,85 @@
+"""Event-loop lag under parallel Gemini-style streams.
+
+Each fake stream blocks for every chunk like the synchronous
+``client.models.generate_content_stream`` iterator. Compares the previous
+inline wrapper, which ran ``next()`` on the event loop, against the
+thread-backed ``iterator_to_async``, measuring how late a loop ticker
+wakes up while the streams run.
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from services.presentation.utils.async_iterator import iterator_to_async
+
+PARALLEL_STREAMS = 8
+CHUNKS_PER_STREAM = 10
+CHUNK_NETWORK_WAIT = 0.01
+TICK_INTERVAL = 0.001
+
+
+def _previous_iterator_to_async(func):
+    """The previous bridge: every next() blocks the event loop thread."""
+
+    async def wrapper(*args, **kwargs):
+        for item in func(*args, **kwargs):
+            yield item
+            await asyncio.sleep(0)
+
+    return wrapper
+
+
+def _gemini_stream():
+    for i in range(CHUNKS_PER_STREAM):
+        time.sleep(CHUNK_NETWORK_WAIT)
+        yield i
+
+
+async def _tick_lags(stop: asyncio.Event) -> list:
+    """Loop lag in ms: how much later than requested each short sleep wakes up."""
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append((time.perf_counter() - start - TICK_INTERVAL) * 1000)
+    return lags
+
+
+async def _run_streams(bridge):
+    async def consume():
+        return [chunk async for chunk in bridge(_gemini_stream)()]
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_tick_lags(stop))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(consume() for _ in range(PARALLEL_STREAMS)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    lags = await ticker
+    assert all(len(chunks) == CHUNKS_PER_STREAM for chunks in results)
+    return elapsed, statistics.quantiles(lags, n=100, method="inclusive")[98], max(lags)
+
+
+@pytest.mark.performance
+class TestGoogleStreamPerformance:
+    """Parallel blocking streams must not stall the event loop."""
+
+    def test_event_loop_lag_under_parallel_streams(self):
+        previous = asyncio.run(_run_streams(_previous_iterator_to_async))
+        threaded = asyncio.run(_run_streams(iterator_to_async))
+
+        print(f"\n=== {PARALLEL_STREAMS} parallel streams x {CHUNKS_PER_STREAM} chunks ({CHUNK_NETWORK_WAIT * 1000:.0f} ms/chunk) ===")
+        print(f"{'':18} {'wall (s)':>9} {'p99 lag (ms)':>13} {'max lag (ms)':>13}")
+        print(f"{'Inline next()':18} {previous[0]:9.2f} {previous[1]:13.2f} {previous[2]:13.2f}")
+        print(f"{'Thread producer':18} {threaded[0]:9.2f} {threaded[1]:13.2f} {threaded[2]:13.2f}")
+
+        # Inline, streams run one chunk at a time and every wait stalls the loop
+        assert previous[2] >= CHUNK_NETWORK_WAIT * 1000 * 0.8
+        assert threaded[2] < previous[2]
+        assert threaded[0] < previous[0]
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.presentation.utils.async_iterator import iterator_to_async
+
+
+def slow_stream(n, delay=0.02, closed=None):
+    try:
+        for i in range(n):
+            time.sleep(delay)
+            yield i
+    finally:
+        if closed is not None:
+            closed.set()
+
+
+class TestIteratorToAsync:
+    """Test the thread-backed bridge for blocking SDK streams"""
+
+    def test_yields_items_in_order(self):
+        async def main():
+            return [item async for item in iterator_to_async(slow_stream)(5, 0)]
+
+        assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+
+    def test_event_loop_not_blocked(self):
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            async for _ in iterator_to_async(slow_stream)(5, 0.02):
+                pass
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(main()) >= 10
+
+    def test_errors_are_raised_in_consumer(self):
+        def failing_stream():
+            yield 1
+            raise ValueError("stream failed")
+
+        async def main():
+            items = []
+            with pytest.raises(ValueError):
+                async for item in iterator_to_async(failing_stream)():
+                    items.append(item)
+            return items
+
+        assert asyncio.run(main()) == [1]
+
+    def test_closing_stops_producer(self):
+        closed = threading.Event()
+
+        async def main():
+            stream = iterator_to_async(slow_stream, max_buffer=2)(1000, 0.001, closed)
+            async for item in stream:
+                if item == 3:
+                    break
+            await stream.aclose()
+            return await asyncio.to_thread(closed.wait, 1)
+
+        assert asyncio.run(main())
+
+    def test_cancellation_stops_producer(self):
+        closed = threading.Event()
+
+        async def consume():
+            async for _ in iterator_to_async(slow_stream)(1000, 0.01, closed):
+                pass
+
+        async def main():
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return await asyncio.to_thread(closed.wait, 1)
+
+        assert asyncio.run(main())
@@ -0,0 +1,107 @@
+import pytest
+
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.models.presentation_layout import (
+    PresentationLayoutModel,
+    SlideLayoutModel,
+)
+from services.presentation.utils import compiled_schemas, schema_utils
+from services.presentation.utils.compiled_schemas import (
+    get_compiled_slide_schema,
+    get_parameters_schema,
+    invalidate_layout_schemas,
+    precompile_layout_schemas,
+)
+
+
+def make_slide_layout(max_length=50):
+    return SlideLayoutModel(
+        id="intro-slide",
+        json_schema={
+            "title": "IntroSlide",
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "maxLength": max_length},
+                "image": {
+                    "$ref": "#/$defs/Image",
+                },
+            },
+            "required": ["title", "image"],
+            "$defs": {
+                "Image": {
+                    "title": "Image",
+                    "type": "object",
+                    "properties": {
+                        "__image_url__": {"type": "string"},
+                        "__image_prompt__": {"type": "string"},
+                    },
+                    "required": ["__image_url__", "__image_prompt__"],
+                }
+            },
+        },
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_schemas(monkeypatch):
+    monkeypatch.setattr(compiled_schemas, "COMPILED_SLIDE_SCHEMAS", {})
+    monkeypatch.setattr(compiled_schemas, "_COMPILED_BY_RESPONSE_SCHEMA", {})
+
+
+class TestCompiledSchemas:
+    """Test per-layout precompiled response schemas"""
+
+    def test_response_schema(self):
+        compiled = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.OPENAI)
+
+        schema = compiled.response_schema
+        assert "__image_url__" not in schema["$defs"]["Image"]["properties"]
+        assert "__speaker_note__" in schema["required"]
+        assert compiled.parameters_schema is None
+
+    def test_compiled_once_per_layout_and_provider(self, mocker):
+        spy = mocker.spy(compiled_schemas, "remove_fields_from_schema")
+        layout = PresentationLayoutModel(name="general", slides=[make_slide_layout()])
+
+        precompile_layout_schemas(layout, LLMProvider.GOOGLE)
+        first = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.GOOGLE)
+        second = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.GOOGLE)
+
+        assert first is second
+        assert spy.call_count == 1
+        assert get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.OPENAI) is not first
+        assert get_compiled_slide_schema("custom-1", make_slide_layout(), LLMProvider.GOOGLE) is not first
+
+    def test_edited_layout_is_recompiled(self):
+        first = get_compiled_slide_schema("general", make_slide_layout(50), LLMProvider.OPENAI)
+        second = get_compiled_slide_schema("general", make_slide_layout(80), LLMProvider.OPENAI)
+
+        assert second is not first
+        assert second.response_schema["properties"]["title"]["maxLength"] == 80
+
+    def test_invalidate_layout_schemas(self):
+        first = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.OPENAI)
+
+        invalidate_layout_schemas("general")
+
+        assert get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.OPENAI) is not first
+
+    def test_parameters_schema_precompiled_for_google(self, mocker):
+        compiled = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.GOOGLE)
+        spy = mocker.spy(compiled_schemas, "flatten_json_schema")
+
+        parameters = get_parameters_schema(compiled.response_schema)
+
+        assert parameters is compiled.parameters_schema
+        assert spy.call_count == 0
+        assert "$defs" not in parameters
+        assert "title" not in parameters
+        assert parameters["properties"]["image"]["properties"]["__image_prompt__"] == {"type": "string"}
+
+    def test_parameters_schema_for_other_schemas(self):
+        compiled = get_compiled_slide_schema("general", make_slide_layout(), LLMProvider.GOOGLE)
+        schema = dict(compiled.response_schema)
+
+        assert get_parameters_schema(schema) == schema_utils.remove_titles_from_schema(
+            schema_utils.flatten_json_schema(schema)
+        )
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.presentation.services import docling_service, documents_loader
+from services.presentation.services.docling_service import DoclingService
+from services.presentation.services.documents_loader import DocumentsLoader
+from services.presentation.utils import worker_pool
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """DoclingService on a thread pool with a fake converter."""
+    parsed = []
+
+    def fake_parse(file_path):
+        parsed.append(file_path)
+        time.sleep(0.05)
+        with open(file_path) as file:
+            return f"# {file.read()}", 0.05
+
+    monkeypatch.setattr(docling_service, "_parse_in_worker", fake_parse)
+    service = DoclingService(max_workers=4, cache_max_entries=2)
+    service._pool = ThreadPoolExecutor(max_workers=4)
+    service.parsed = parsed
+    yield service
+    service.close()
+
+
+def write_files(tmp_path, contents, suffix=".pdf"):
+    paths = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"file_{i}{suffix}"
+        path.write_text(content)
+        paths.append(str(path))
+    return paths
+
+
+class TestDoclingService:
+    """Test pooled docling parsing"""
+
+    def test_markdown_cached_by_content_hash(self, service, tmp_path):
+        first, same_content, other = write_files(tmp_path, ["report", "report", "notes"])
+
+        async def main():
+            return [
+                await service.parse_to_markdown(path)
+                for path in (first, same_content, other)
+            ]
+
+        assert asyncio.run(main()) == ["# report", "# report", "# notes"]
+        assert service.parsed == [first, other]
+
+    def test_cache_evicts_least_recently_used(self, service, tmp_path):
+        paths = write_files(tmp_path, ["a", "b", "c"])
+
+        async def main():
+            for path in paths:
+                await service.parse_to_markdown(path)
+            await service.parse_to_markdown(paths[0])
+
+        asyncio.run(main())
+        assert service.parsed == [*paths, paths[0]]
+
+    def test_pool_forked_from_worker_fork_server(self):
+        service = DoclingService(max_workers=1)
+
+        pool = service._get_pool()
+        try:
+            assert pool._mp_context.get_start_method() == "forkserver"
+            assert pool._mp_context.Process is worker_pool._WorkerProcess
+        finally:
+            service.close()
+
+
+class TestDocumentsLoader:
+    """Test parallel document loading"""
+
+    def test_files_parsed_in_parallel_in_order(self, service, tmp_path, monkeypatch):
+        monkeypatch.setattr(documents_loader, "DOCLING_SERVICE", service)
+        paths = write_files(tmp_path, ["one", "two", "three", "four"])
+        loader = DocumentsLoader(paths)
+
+        start = time.perf_counter()
+        asyncio.run(loader.load_documents())
+        elapsed = time.perf_counter() - start
+
+        assert loader.documents == ["# one", "# two", "# three", "# four"]
+        assert elapsed < 0.05 * len(paths)
+
+    def test_concurrency_is_capped_per_request(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(documents_loader, "DOCUMENTS_LOAD_CONCURRENCY", 2)
+        in_flight = 0
+        peak = 0
+
+        class FakeService:
+            async def parse_to_markdown(self, file_path):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return file_path
+
+        monkeypatch.setattr(documents_loader, "DOCLING_SERVICE", FakeService())
+        paths = write_files(tmp_path, ["x"] * 6, suffix=".docx")
+
+        asyncio.run(DocumentsLoader(paths).load_documents())
+
+        assert peak == 2
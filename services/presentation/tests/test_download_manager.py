@@ -0,0 +1,141 @@
+import asyncio
+import os
+
+from aiohttp import web
+
+from services.presentation.services import download_manager
+from services.presentation.services.download_manager import DownloadManager
+from services.presentation.utils import download_helpers
+
+
+class AssetServer:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, request: web.Request):
+        name = request.match_info["name"]
+        self.requests.append(name)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if name == "missing.jpg":
+            return web.Response(status=404)
+        if name == "noext":
+            return web.Response(body=b"png bytes", content_type="image/png")
+        # Identical content for the "copy" images
+        body = b"shared" if name.startswith("copy") else name.encode() * 100
+        return web.Response(body=body, content_type="image/jpeg")
+
+
+def run_with_server(server, scenario, tmp_path, monkeypatch, **manager_kwargs):
+    monkeypatch.setattr(
+        download_manager.TEMP_FILE_SERVICE, "base_dir", str(tmp_path / "temp")
+    )
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/images/{name}", server.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        manager = DownloadManager(**manager_kwargs)
+        try:
+            return await scenario(manager, f"http://127.0.0.1:{port}/images")
+        finally:
+            await manager.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestDownloadManager:
+    """Test shared, cached asset downloads"""
+
+    def test_identical_urls_downloaded_once(self, tmp_path, monkeypatch):
+        server = AssetServer(delay=0.05)
+        save_dir = str(tmp_path / "export")
+
+        async def scenario(manager, base_url):
+            return await asyncio.gather(
+                *[manager.download(f"{base_url}/photo.jpg", save_dir) for _ in range(5)]
+            )
+
+        paths = run_with_server(server, scenario, tmp_path, monkeypatch)
+        assert server.requests == ["photo.jpg"]
+        assert paths == [os.path.join(save_dir, "photo.jpg")] * 5
+        with open(paths[0], "rb") as file:
+            assert file.read() == b"photo.jpg" * 100
+
+    def test_export_reuses_prefetched_asset(self, tmp_path, monkeypatch):
+        server = AssetServer()
+
+        async def scenario(manager, base_url):
+            manager.prefetch(f"{base_url}/stock.jpg")
+            await asyncio.sleep(0.2)
+            first = await manager.download(f"{base_url}/stock.jpg", str(tmp_path / "a"))
+            second = await manager.download(f"{base_url}/stock.jpg", str(tmp_path / "b"))
+            return first, second
+
+        first, second = run_with_server(server, scenario, tmp_path, monkeypatch)
+        assert server.requests == ["stock.jpg"]
+        assert os.path.exists(first) and os.path.exists(second)
+
+    def test_concurrency_capped_per_host(self, tmp_path, monkeypatch):
+        server = AssetServer(delay=0.05)
+
+        async def scenario(manager, base_url):
+            return await asyncio.gather(
+                *[
+                    manager.download(f"{base_url}/{i}.jpg", str(tmp_path / "export"))
+                    for i in range(8)
+                ]
+            )
+
+        paths = run_with_server(
+            server, scenario, tmp_path, monkeypatch, per_host_concurrency=2
+        )
+        assert all(paths)
+        assert server.peak_in_flight == 2
+
+    def test_identical_content_stored_once(self, tmp_path, monkeypatch):
+        server = AssetServer()
+
+        async def scenario(manager, base_url):
+            await manager.download(f"{base_url}/copy1.jpg", str(tmp_path / "export"))
+            await manager.download(f"{base_url}/copy2.jpg", str(tmp_path / "export"))
+            return manager.cache_size
+
+        assert run_with_server(server, scenario, tmp_path, monkeypatch) == len(b"shared")
+
+    def test_least_recently_used_evicted(self, tmp_path, monkeypatch):
+        server = AssetServer()
+        save_dir = str(tmp_path / "export")
+
+        async def scenario(manager, base_url):
+            for name in ("a.jpg", "b.jpg", "a.jpg", "c.jpg", "a.jpg", "b.jpg"):
+                await manager.download(f"{base_url}/{name}", save_dir)
+
+        # Each asset is 500 bytes, so only two fit
+        run_with_server(server, scenario, tmp_path, monkeypatch, max_cache_bytes=1000)
+        assert server.requests == ["a.jpg", "b.jpg", "c.jpg", "b.jpg"]
+
+    def test_failures_and_filenames(self, tmp_path, monkeypatch):
+        server = AssetServer()
+
+        async def scenario(manager, base_url):
+            monkeypatch.setattr(download_helpers, "DOWNLOAD_MANAGER", manager)
+            return await download_helpers.download_files(
+                [f"{base_url}/missing.jpg", f"{base_url}/noext"], str(tmp_path / "export")
+            )
+
+        missing, no_extension = run_with_server(server, scenario, tmp_path, monkeypatch)
+        assert missing is None
+        assert no_extension.endswith(".png")
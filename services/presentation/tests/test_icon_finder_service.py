@@ -0,0 +1,102 @@
+import asyncio
+
+from services.presentation.services.icon_finder_service import IconFinderService
+
+
+class FakeEmbeddingFunction:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def query(self, query_embeddings, n_results):
+        self.calls.append((len(query_embeddings), n_results))
+        return {
+            "ids": [
+                [f"icon-{int(embedding[0])}-{i}-bold" for i in range(n_results)]
+                for embedding in query_embeddings
+            ]
+        }
+
+
+def make_service(**kwargs):
+    service = IconFinderService(**kwargs)
+    service.embedding_function = FakeEmbeddingFunction()
+    service.collection = FakeCollection()
+    return service
+
+
+class TestIconFinderService:
+    """Test batched, cached icon search"""
+
+    def test_concurrent_queries_share_one_batch(self):
+        service = make_service()
+
+        async def main():
+            return await asyncio.gather(
+                service.search_icons_batch(["growth", "team"]),
+                service.search_icons("chart"),
+                service.search_icons("team"),
+            )
+
+        slide_icons, chart, team = asyncio.run(main())
+        assert len(service.embedding_function.calls) == 1
+        assert sorted(service.embedding_function.calls[0]) == ["chart", "growth", "team"]
+        assert service.collection.calls == [(3, 1)]
+        assert slide_icons == [
+            ["/static/icons/bold/icon-6-0-bold.svg"],
+            ["/static/icons/bold/icon-4-0-bold.svg"],
+        ]
+        assert chart == ["/static/icons/bold/icon-5-0-bold.svg"]
+        assert team == slide_icons[1]
+
+    def test_results_sliced_to_each_limit(self):
+        service = make_service()
+
+        async def main():
+            return await asyncio.gather(
+                service.search_icons("growth"), service.search_icons("team", 3)
+            )
+
+        growth, team = asyncio.run(main())
+        assert service.collection.calls == [(2, 3)]
+        assert len(growth) == 1
+        assert len(team) == 3
+
+    def test_repeated_queries_served_from_cache(self):
+        service = make_service(cache_max_entries=2)
+
+        async def main():
+            for query in ("growth", "team", "growth", "chart", "team"):
+                await service.search_icons(query)
+
+        asyncio.run(main())
+        assert service.embedding_function.calls == [
+            ["growth"],
+            ["team"],
+            ["chart"],
+            ["team"],
+        ]
+
+    def test_failed_batch_raises_for_every_query(self):
+        service = make_service()
+        service.collection.query = lambda **_: (_ for _ in ()).throw(
+            RuntimeError("index unavailable")
+        )
+
+        async def main():
+            return await asyncio.gather(
+                service.search_icons("growth"),
+                service.search_icons("team"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from services.presentation.services import layout_cache
+from services.presentation.services.layout_cache import LayoutCache
+
+
+def make_template(group, title="Intro"):
+    return {
+        "name": group,
+        "ordered": False,
+        "slides": [
+            {
+                "id": "intro-slide",
+                "json_schema": {
+                    "type": "object",
+                    "properties": {"title": {"type": "string", "description": title}},
+                },
+            }
+        ],
+    }
+
+
+class TemplateServer:
+    def __init__(self, send_etag=True):
+        self.send_etag = send_etag
+        self.templates = {"general": make_template("general")}
+        self.requests = 0
+        self.not_modified = 0
+
+    async def handle(self, request: web.Request):
+        self.requests += 1
+        group = request.query["group"]
+        if group not in self.templates:
+            return web.Response(status=404, text="not found")
+        body = json.dumps(self.templates[group])
+        etag = f'"{hash(body)}"'
+        if self.send_etag and request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304)
+        headers = {"ETag": etag} if self.send_etag else {}
+        return web.Response(text=body, content_type="application/json", headers=headers)
+
+
+def run_with_server(server: TemplateServer, scenario, monkeypatch):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/api/template", server.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(
+            layout_cache, "TEMPLATE_URL", f"http://127.0.0.1:{port}/api/template"
+        )
+        cache = LayoutCache(revalidate_after=60)
+        try:
+            return await scenario(cache)
+        finally:
+            await cache.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+class TestLayoutCache:
+    """Test the in-process template layout cache"""
+
+    def test_cached_layout_is_shared(self, monkeypatch):
+        server = TemplateServer()
+
+        async def scenario(cache):
+            return await cache.get("general"), await cache.get("general")
+
+        first, second = run_with_server(server, scenario, monkeypatch)
+        assert first is second
+        assert server.requests == 1
+
+    def test_revalidates_with_etag(self, monkeypatch):
+        server = TemplateServer()
+
+        async def scenario(cache):
+            first = await cache.get("general")
+            cache.revalidate_after = 0
+            unchanged = await cache.get("general")
+            server.templates["general"] = make_template("general", "Changed")
+            changed = await cache.get("general")
+            return first, unchanged, changed
+
+        first, unchanged, changed = run_with_server(server, scenario, monkeypatch)
+        assert unchanged is first
+        assert server.not_modified == 1
+        assert changed is not first
+        assert changed.slides[0].json_schema["properties"]["title"]["description"] == "Changed"
+
+    def test_revalidates_by_content_without_etag(self, monkeypatch):
+        server = TemplateServer(send_etag=False)
+
+        async def scenario(cache):
+            first = await cache.get("general")
+            cache.revalidate_after = 0
+            return first, await cache.get("general")
+
+        first, unchanged = run_with_server(server, scenario, monkeypatch)
+        assert unchanged is first
+        assert server.requests == 2
+
+    def test_invalidate_refetches(self, monkeypatch):
+        server = TemplateServer()
+        server.templates["custom-1"] = make_template("custom-1")
+
+        async def scenario(cache):
+            first = await cache.get("custom-1")
+            server.templates["custom-1"] = make_template("custom-1", "Saved")
+            cache.invalidate("custom-1")
+            return first, await cache.get("custom-1")
+
+        first, refreshed = run_with_server(server, scenario, monkeypatch)
+        assert refreshed is not first
+        assert refreshed.slides[0].json_schema["properties"]["title"]["description"] == "Saved"
+
+    def test_missing_template_raises_404(self, monkeypatch):
+        server = TemplateServer()
+
+        async def scenario(cache):
+            try:
+                await cache.get("unknown")
+            except Exception as e:
+                return e
+
+        error = run_with_server(server, scenario, monkeypatch)
+        assert error.status_code == 404
@@ -0,0 +1,46 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.services.llm_client import LLMClient
+from services.presentation.services.llm_client_registry import LLMClientRegistry
+
+
+class TestLLMClientRegistry:
+    """Test process-wide sharing of provider clients"""
+
+    def test_client_shared_per_provider_url_and_key(self):
+        registry = LLMClientRegistry()
+
+        first = registry.get_client(LLMProvider.OPENAI, api_key="key-1")
+        second = registry.get_client(LLMProvider.OPENAI, api_key="key-1")
+
+        assert first is second
+
+    def test_new_client_for_changed_key_or_url(self):
+        registry = LLMClientRegistry()
+
+        client = registry.get_client(LLMProvider.CUSTOM, "http://llm-a/v1", "key-1")
+
+        assert client is not registry.get_client(LLMProvider.CUSTOM, "http://llm-a/v1", "key-2")
+        assert client is not registry.get_client(LLMProvider.CUSTOM, "http://llm-b/v1", "key-1")
+
+    def test_sdk_retries_disabled(self):
+        registry = LLMClientRegistry()
+
+        assert registry.get_client(LLMProvider.ANTHROPIC, api_key="key-1").max_retries == 0
+        assert registry.get_client(LLMProvider.OPENAI, api_key="key-1").max_retries == 0
+
+    def test_close_releases_clients(self):
+        registry = LLMClientRegistry()
+        client = registry.get_client(LLMProvider.ANTHROPIC, api_key="key-1")
+
+        asyncio.run(registry.close())
+
+        assert client.is_closed()
+        assert registry.get_client(LLMProvider.ANTHROPIC, api_key="key-1") is not client
+
+    def test_llm_clients_share_provider_client(self):
+        with patch.dict(os.environ, {"LLM": "openai", "OPENAI_API_KEY": "key-1"}):
+            assert LLMClient()._client is LLMClient()._client
@@ -0,0 +1,154 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.models.llm_message import LLMSystemMessage, LLMUserMessage
+from services.presentation.models.sql.llm_response_cache import LLMResponseCacheEntry
+from services.presentation.services import llm_response_cache
+from services.presentation.services.llm_response_cache import LLMResponseCache
+from services.presentation.utils.llm_calls import generate_slide_content
+
+
+@pytest.fixture
+def session_maker(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: SQLModel.metadata.create_all(
+                    sync_conn, tables=[LLMResponseCacheEntry.__table__]
+                )
+            )
+
+    asyncio.run(create_tables())
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(llm_response_cache, "async_session_maker", maker)
+    return maker
+
+
+def make_messages(outline="Revenue grew 20%", indent=""):
+    return [
+        LLMSystemMessage(content=f"{indent}Generate structured slide.\n\n{indent}# Tone\n{indent}casual"),
+        LLMUserMessage(content=f"{indent}## Slide Outline\n{indent}{outline}"),
+    ]
+
+
+SCHEMA = {"type": "object", "properties": {"title": {"type": "string"}}}
+
+
+class TestLLMResponseCache:
+    """Test the content-addressed structured response cache"""
+
+    def test_key_ignores_prompt_formatting(self):
+        cache = LLMResponseCache()
+
+        key = cache.get_key("openai", "gpt-4.1", make_messages(), SCHEMA)
+
+        assert key == cache.get_key("openai", "gpt-4.1", make_messages(indent="    "), SCHEMA)
+        assert key != cache.get_key("openai", "gpt-4.1", make_messages("Costs fell"), SCHEMA)
+        assert key != cache.get_key("openai", "gpt-4o", make_messages(), SCHEMA)
+        assert key != cache.get_key("openai", "gpt-4.1", make_messages(), {"type": "object"})
+
+    def test_hit_after_set(self, session_maker):
+        cache = LLMResponseCache()
+        key = cache.get_key("openai", "gpt-4.1", make_messages(), SCHEMA)
+
+        async def main():
+            miss = await cache.get(key)
+            await cache.set(key, {"title": "Revenue"})
+            return miss, await cache.get(key)
+
+        assert asyncio.run(main()) == (None, {"title": "Revenue"})
+
+    def test_expired_entry_is_a_miss(self, session_maker):
+        cache = LLMResponseCache(ttl=-1)
+
+        async def main():
+            await cache.set("llm_response_cache:expired", {"title": "Old"})
+            return await cache.get("llm_response_cache:expired")
+
+        assert asyncio.run(main()) is None
+
+    def test_oldest_entries_evicted_over_limit(self, session_maker):
+        cache = LLMResponseCache(max_entries=10)
+
+        async def main():
+            for i in range(11):
+                await cache.set(f"llm_response_cache:{i}", {"title": str(i)})
+            async with session_maker() as session:
+                return set(await session.scalars(select(LLMResponseCacheEntry.key)))
+
+        keys = asyncio.run(main())
+        assert len(keys) == 9
+        assert "llm_response_cache:0" not in keys
+        assert "llm_response_cache:10" in keys
+
+    def test_expired_entries_evicted(self, session_maker):
+        cache = LLMResponseCache(max_entries=10)
+
+        async def main():
+            cache.ttl = -1
+            await cache.set("llm_response_cache:expired", {"title": "Old"})
+            cache.ttl = 60
+            await cache.set("llm_response_cache:fresh", {"title": "New"})
+            async with session_maker() as session:
+                return set(await session.scalars(select(LLMResponseCacheEntry.key)))
+
+        assert asyncio.run(main()) == {"llm_response_cache:fresh"}
+
+    def test_eviction_runs_every_tenth_of_limit(self, session_maker, mocker):
+        cache = LLMResponseCache(max_entries=20)
+        evict = mocker.spy(cache, "_evict")
+
+        async def main():
+            for i in range(5):
+                await cache.set(f"llm_response_cache:{i}", {"title": str(i)})
+
+        asyncio.run(main())
+        assert evict.call_count == 2
+
+    def test_slide_cache_key_stable_across_days(self, monkeypatch):
+        keys = []
+
+        class FakeCache(LLMResponseCache):
+            enabled = True
+
+            async def get(self, key):
+                keys.append(key)
+                return {"title": "Revenue"}
+
+        def fixed_datetime(day):
+            class FixedDatetime(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return datetime(2026, 10, day)
+
+            return FixedDatetime
+
+        monkeypatch.setattr(generate_slide_content, "LLM_RESPONSE_CACHE", FakeCache())
+        monkeypatch.setattr(generate_slide_content, "LLMClient", lambda: None)
+        monkeypatch.setattr(generate_slide_content, "get_model", lambda: "gpt-4.1")
+        monkeypatch.setattr(generate_slide_content, "get_llm_provider", lambda: LLMProvider.OPENAI)
+        monkeypatch.setattr(
+            generate_slide_content,
+            "compile_slide_schema",
+            lambda slide_layout, provider: SimpleNamespace(response_schema=SCHEMA),
+        )
+        outline = SimpleNamespace(content="Revenue grew 20%")
+
+        for day in (16, 17):
+            monkeypatch.setattr(generate_slide_content, "datetime", fixed_datetime(day))
+            asyncio.run(
+                generate_slide_content.get_slide_content_and_cache_status(
+                    None, outline, "English"
+                )
+            )
+
+        assert len(keys) == 2
+        assert keys[0] == keys[1]
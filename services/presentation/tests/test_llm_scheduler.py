@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+import pytest
+
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.services import llm_scheduler
+from services.presentation.services.llm_scheduler import (
+    LLMScheduler,
+    get_provider_budget,
+    get_retry_after,
+    set_llm_flow,
+)
+
+
+def make_scheduler(max_concurrent=2, requests_per_minute=None, tokens_per_minute=None):
+    return LLMScheduler(
+        {
+            LLMProvider.OPENAI.value: {
+                "max_concurrent": max_concurrent,
+                "requests_per_minute": requests_per_minute,
+                "tokens_per_minute": tokens_per_minute,
+            }
+        }
+    )
+
+
+class RateLimitError(Exception):
+    def __init__(self, headers):
+        self.status_code = 429
+        self.response = type("Response", (), {"headers": headers})()
+
+
+class TestLLMScheduler:
+    """Test global admission control for LLM requests"""
+
+    def test_in_flight_requests_are_bounded(self):
+        scheduler = make_scheduler(max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        async def main():
+            await asyncio.gather(
+                *(scheduler.run(LLMProvider.OPENAI, 1, call) for _ in range(6))
+            )
+
+        asyncio.run(main())
+        assert peak == 2
+
+    def test_slot_is_reused_without_waiting_for_batch(self):
+        scheduler = make_scheduler(max_concurrent=2)
+        events = []
+
+        def make_call(name, duration):
+            async def call():
+                events.append(f"start {name}")
+                await asyncio.sleep(duration)
+                events.append(f"end {name}")
+
+            return call
+
+        async def main():
+            await asyncio.gather(
+                scheduler.run(LLMProvider.OPENAI, 1, make_call("slow", 0.2)),
+                scheduler.run(LLMProvider.OPENAI, 1, make_call("fast", 0.01)),
+                scheduler.run(LLMProvider.OPENAI, 1, make_call("next", 0.01)),
+            )
+
+        asyncio.run(main())
+        assert events.index("start next") < events.index("end slow")
+
+    def test_flows_are_served_round_robin(self):
+        scheduler = make_scheduler(max_concurrent=1)
+        started = []
+
+        def make_call(name):
+            async def call():
+                started.append(name)
+                await asyncio.sleep(0.01)
+
+            return call
+
+        async def submit(flow, names):
+            set_llm_flow(flow)
+            await asyncio.gather(
+                *(scheduler.run(LLMProvider.OPENAI, 1, make_call(n)) for n in names)
+            )
+
+        async def main():
+            big = asyncio.create_task(submit("big-deck", ["a1", "a2", "a3", "a4"]))
+            await asyncio.sleep(0.005)
+            small = asyncio.create_task(submit("small-deck", ["b1"]))
+            await asyncio.gather(big, small)
+
+        asyncio.run(main())
+        assert started.index("b1") < started.index("a3")
+
+    def test_request_budget_delays_requests(self, monkeypatch):
+        monkeypatch.setattr(llm_scheduler, "WINDOW_SECONDS", 0.2)
+        scheduler = make_scheduler(max_concurrent=10, requests_per_minute=2)
+
+        async def call():
+            return time.monotonic()
+
+        async def main():
+            start = time.monotonic()
+            times = await asyncio.gather(
+                *(scheduler.run(LLMProvider.OPENAI, 1, call) for _ in range(3))
+            )
+            return [t - start for t in times]
+
+        elapsed = asyncio.run(main())
+        assert elapsed[2] >= 0.15
+
+    def test_rate_limit_is_retried_after_retry_after(self):
+        scheduler = make_scheduler()
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RateLimitError({"retry-after-ms": "100"})
+            return "ok"
+
+        async def main():
+            start = time.monotonic()
+            result = await scheduler.run(LLMProvider.OPENAI, 1, call)
+            return result, time.monotonic() - start
+
+        result, elapsed = asyncio.run(main())
+        assert result == "ok"
+        assert attempts == 2
+        assert elapsed >= 0.1
+
+    def test_other_errors_are_not_retried(self):
+        scheduler = make_scheduler()
+
+        async def call():
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            asyncio.run(scheduler.run(LLMProvider.OPENAI, 1, call))
+        assert scheduler._get_queue(LLMProvider.OPENAI).in_flight == 0
+
+    def test_stream_holds_slot_until_exhausted(self):
+        scheduler = make_scheduler(max_concurrent=1)
+
+        async def chunks():
+            for chunk in ("a", "b"):
+                yield chunk
+
+        async def main():
+            queue = scheduler._get_queue(LLMProvider.OPENAI)
+            received = []
+            async for chunk in scheduler.stream(LLMProvider.OPENAI, 1, chunks):
+                received.append((chunk, queue.in_flight))
+            return received, queue.in_flight
+
+        received, in_flight_after = asyncio.run(main())
+        assert received == [("a", 1), ("b", 1)]
+        assert in_flight_after == 0
+
+    def test_get_retry_after(self):
+        assert get_retry_after(ValueError()) is None
+        assert get_retry_after(RateLimitError({"retry-after": "3"})) == 3
+        assert get_retry_after(RateLimitError({"retry-after-ms": "1500"})) == 1.5
+
+    def test_budgets_overridden_from_environment(self, monkeypatch):
+        monkeypatch.setenv("LLM_ANTHROPIC_REQUESTS_PER_MINUTE", "4000")
+        monkeypatch.setenv("LLM_ANTHROPIC_TOKENS_PER_MINUTE", "none")
+        monkeypatch.setenv("LLM_ANTHROPIC_MAX_CONCURRENT", "many")
+
+        budget = get_provider_budget(LLMProvider.ANTHROPIC.value)
+
+        assert budget["requests_per_minute"] == 4000
+        assert budget["tokens_per_minute"] is None
+        # Invalid values keep the default
+        assert budget["max_concurrent"] == 8
+
+    def test_default_scheduler_reads_environment_budgets(self, monkeypatch):
+        monkeypatch.setenv("LLM_OLLAMA_MAX_CONCURRENT", "6")
+
+        queue = LLMScheduler()._get_queue(LLMProvider.OLLAMA)
+
+        assert queue.max_concurrent == 6
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.presentation.services import documents_loader, pdf_page_renderer
+from services.presentation.services.documents_loader import DocumentsLoader
+from services.presentation.services.pdf_page_renderer import PdfPageRenderer
+
+PAGE_COUNT = 6
+
+
+@pytest.fixture
+def renderer(tmp_path, monkeypatch):
+    """PdfPageRenderer on a thread pool with a fake page renderer."""
+    rendered = []
+
+    def fake_render(file_path, page_number, resolution, image_path):
+        # The last page is slow to render
+        time.sleep(0.2 if page_number == PAGE_COUNT else 0.01)
+        with open(image_path, "w") as image:
+            image.write(f"{page_number}@{resolution}")
+        rendered.append((page_number, resolution))
+        return 0.01
+
+    monkeypatch.setattr(pdf_page_renderer, "render_pdf_page", fake_render)
+    monkeypatch.setattr(pdf_page_renderer, "get_pdf_page_count", lambda _: PAGE_COUNT)
+    monkeypatch.setattr(pdf_page_renderer.TEMP_FILE_SERVICE, "base_dir", str(tmp_path / "temp"))
+
+    renderer = PdfPageRenderer(max_workers=PAGE_COUNT, cache_max_documents=2)
+    renderer._pool = ThreadPoolExecutor(max_workers=PAGE_COUNT)
+    renderer.rendered = rendered
+    yield renderer
+    renderer.close()
+
+
+def make_pdf(tmp_path, name="deck.pdf", content="pdf"):
+    path = tmp_path / name
+    path.write_text(content)
+    output_dir = tmp_path / f"out_{name}"
+    output_dir.mkdir()
+    return str(path), str(output_dir)
+
+
+class TestPdfPageRenderer:
+    """Test parallel, cached PDF page rendering"""
+
+    def test_pages_streamed_as_ready(self, renderer, tmp_path):
+        pdf_path, output_dir = make_pdf(tmp_path)
+
+        async def main():
+            return [
+                page async for page, _ in renderer.render_pages(pdf_path, output_dir)
+            ]
+
+        order = asyncio.run(main())
+        assert sorted(order) == list(range(1, PAGE_COUNT + 1))
+        assert order[0] == 1
+        assert order[-1] == PAGE_COUNT
+
+    def test_render_all_in_page_order(self, renderer, tmp_path):
+        pdf_path, output_dir = make_pdf(tmp_path)
+
+        paths = asyncio.run(renderer.render_all(pdf_path, output_dir))
+
+        assert paths == [
+            os.path.join(output_dir, f"page_{page}.png") for page in range(1, PAGE_COUNT + 1)
+        ]
+        with open(paths[2]) as image:
+            assert image.read() == "3@150"
+
+    def test_page_range_and_resolution(self, renderer, tmp_path):
+        pdf_path, output_dir = make_pdf(tmp_path)
+
+        paths = asyncio.run(renderer.render_all(pdf_path, output_dir, pages=[2, 3], resolution=48))
+
+        assert [os.path.basename(path) for path in paths] == ["page_2.png", "page_3.png"]
+        assert sorted(renderer.rendered) == [(2, 48), (3, 48)]
+
+    def test_cached_by_document_hash_and_dpi(self, renderer, tmp_path):
+        pdf_path, output_dir = make_pdf(tmp_path)
+        copy_path, copy_output_dir = make_pdf(tmp_path, "copy.pdf")
+
+        async def main():
+            await renderer.render_all(pdf_path, output_dir, pages=[1, 2])
+            await renderer.render_all(copy_path, copy_output_dir, pages=[1, 2, 3])
+            await renderer.render_all(pdf_path, output_dir, pages=[1], resolution=48)
+
+        asyncio.run(main())
+        assert renderer.rendered.count((1, 150)) == 1
+        assert (3, 150) in renderer.rendered
+        assert (1, 48) in renderer.rendered
+        assert os.path.exists(os.path.join(copy_output_dir, "page_1.png"))
+
+    def test_least_recently_used_document_evicted(self, renderer, tmp_path):
+        documents = [make_pdf(tmp_path, f"{i}.pdf", f"pdf {i}") for i in range(3)]
+
+        async def main():
+            for pdf_path, output_dir in documents:
+                await renderer.render_all(pdf_path, output_dir, pages=[1])
+            await renderer.render_all(*documents[0], pages=[1])
+
+        asyncio.run(main())
+        assert renderer.rendered.count((1, 150)) == 4
+
+    def test_loader_defaults_temp_dir_for_images(self, renderer, tmp_path, monkeypatch):
+        pdf_path, _ = make_pdf(tmp_path)
+        monkeypatch.setattr(documents_loader, "PDF_PAGE_RENDERER", renderer)
+
+        loader = DocumentsLoader([pdf_path])
+        asyncio.run(loader.load_documents(load_text=False, load_images=True))
+
+        assert len(loader.images[0]) == PAGE_COUNT
+        assert all(
+            path.startswith(str(tmp_path / "temp")) for path in loader.images[0]
+        )
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+
+ENTRYPOINT = "services.presentation.tests.worker_pool_entrypoint"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+def write_pdf(path, page_count=2):
+    """Minimal valid PDF with blank pages."""
+    page_ids = [3 + i for i in range(page_count)]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % i for i in page_ids), page_count),
+    ] + [b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 100] >>"] * page_count
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(pdf)
+
+
+class TestWorkerPool:
+    """Test pool workers of a service started with `python -m`"""
+
+    def test_workers_do_not_import_entrypoint(self, tmp_path):
+        pdf_path = tmp_path / "deck.pdf"
+        write_pdf(pdf_path)
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        import_log = tmp_path / "imports.log"
+        temp_dir = tmp_path / "temp"
+        marker = temp_dir / "upload.pdf"
+        temp_dir.mkdir()
+        marker.write_text("uploaded by another request")
+
+        env = {
+            **os.environ,
+            "ENTRYPOINT_IMPORT_LOG": str(import_log),
+            "TEMP_DIRECTORY": str(temp_dir),
+            "PYTHONPATH": REPO_ROOT,
+        }
+        result = subprocess.run(
+            [sys.executable, "-m", ENTRYPOINT, str(pdf_path), str(output_dir)],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == [
+            str(output_dir / "page_1.png"),
+            str(output_dir / "page_2.png"),
+        ]
+        # Only the parent imported the entrypoint, as __main__
+        assert [line.split()[0] for line in import_log.read_text().splitlines()] == ["__main__"]
+        # Nothing in the temp dir was wiped along the way
+        assert marker.read_text() == "uploaded by another request"
@@ -0,0 +1,27 @@
+"""
+Stand-in for the service entrypoint, run as ``python -m`` by
+test_worker_pool.py. Every import of this module is logged, so the test
+can tell whether pool workers re-imported the entrypoint.
+"""
+
+import asyncio
+import os
+import sys
+
+with open(os.environ["ENTRYPOINT_IMPORT_LOG"], "a") as log:
+    log.write(f"{__name__} {os.getpid()}\n")
+
+from services.presentation.services.pdf_page_renderer import PDF_PAGE_RENDERER
+
+
+async def main(pdf_path: str, output_dir: str):
+    PDF_PAGE_RENDERER.start()
+    try:
+        for image_path in await PDF_PAGE_RENDERER.render_all(pdf_path, output_dir):
+            print(image_path)
+    finally:
+        PDF_PAGE_RENDERER.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1], sys.argv[2]))
@@ -1,16 +1,76 @@
 import asyncio
+import threading
 from typing import AsyncGenerator, Callable, Iterator, TypeVar
 
 T = TypeVar("T")
 
+# Items buffered ahead of a slow consumer before the producer thread waits
+DEFAULT_MAX_BUFFER = 16
+
+_DONE = object()
+
 
 def iterator_to_async(
     func: Callable[..., Iterator[T]],
+    max_buffer: int = DEFAULT_MAX_BUFFER,
 ) -> Callable[..., AsyncGenerator[T, None]]:
+    """
+    Run a blocking iterator (e.g. a provider SDK stream) on its own thread
+    and hand its items to the event loop through a bounded buffer, so waiting
+    for the next chunk never blocks the loop.
+
+    Closing or cancelling the async generator (e.g. when an SSE client
+    disconnects) stops the producer, which closes the iterator as soon as
+    its current ``next()`` returns.
+    """
+
     async def wrapper(*args, **kwargs) -> AsyncGenerator[T, None]:
-        iterator = func(*args, **kwargs)
-        for item in iterator:
-            yield item
-            await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(max_buffer)
+        stopped = threading.Event()
+
+        def emit(item, error=None) -> bool:
+            while not slots.acquire(timeout=0.1):
+                if stopped.is_set():
+                    return False
+            if stopped.is_set():
+                return False
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+            except RuntimeError:
+                # Event loop already closed
+                return False
+            return True
+
+        def produce():
+            try:
+                iterator = func(*args, **kwargs)
+                try:
+                    for item in iterator:
+                        if not emit(item):
+                            break
+                finally:
+                    close = getattr(iterator, "close", None)
+                    if close is not None:
+                        close()
+            except BaseException as e:
+                emit(_DONE, e)
+            else:
+                emit(_DONE)
+
+        # A dedicated thread, so long streams don't hold default executor workers
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                item, error = await queue.get()
+                slots.release()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            stopped.set()
 
     return wrapper
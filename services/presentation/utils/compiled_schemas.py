@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from services.presentation.enums.llm_provider import LLMProvider
+from services.presentation.models.presentation_layout import (
+    PresentationLayoutModel,
+    SlideLayoutModel,
+)
+from services.presentation.utils.llm_provider import get_llm_provider
+from services.presentation.utils.schema_utils import (
+    add_field_in_schema,
+    flatten_json_schema,
+    remove_fields_from_schema,
+    remove_titles_from_schema,
+)
+
+SPEAKER_NOTE_FIELD = {
+    "__speaker_note__": {
+        "type": "string",
+        "minLength": 100,
+        "maxLength": 250,
+        "description": "Speaker note for the slide",
+    }
+}
+
+
+@dataclass
+class CompiledSlideSchema:
+    # Layout json_schema this entry was compiled from, to detect edited layouts
+    source_schema: dict
+    # Slide content response schema (asset urls removed, speaker note added)
+    response_schema: dict
+    # Flattened, title-less response schema for Google function declarations
+    parameters_schema: Optional[dict]
+
+
+# (layout group, slide layout id, provider) -> compiled schema
+COMPILED_SLIDE_SCHEMAS: Dict[Tuple[str, str, str], CompiledSlideSchema] = {}
+
+# id(response_schema) -> compiled schema, so LLMClient can find the
+# precompiled provider schema for a response format it is given.
+# Entries in COMPILED_SLIDE_SCHEMAS keep these ids alive.
+_COMPILED_BY_RESPONSE_SCHEMA: Dict[int, CompiledSlideSchema] = {}
+
+
+def compile_slide_schema(
+    slide_layout: SlideLayoutModel, provider: LLMProvider
+) -> CompiledSlideSchema:
+    response_schema = remove_fields_from_schema(
+        slide_layout.json_schema, ["__image_url__", "__icon_url__"]
+    )
+    response_schema = add_field_in_schema(response_schema, SPEAKER_NOTE_FIELD, True)
+    return CompiledSlideSchema(
+        source_schema=slide_layout.json_schema,
+        response_schema=response_schema,
+        parameters_schema=(
+            remove_titles_from_schema(flatten_json_schema(response_schema))
+            if provider == LLMProvider.GOOGLE
+            else None
+        ),
+    )
+
+
+def get_compiled_slide_schema(
+    layout_group: str,
+    slide_layout: SlideLayoutModel,
+    provider: Optional[LLMProvider] = None,
+) -> CompiledSlideSchema:
+    provider = provider or get_llm_provider()
+    key = (layout_group, slide_layout.id, provider.value)
+
+    compiled = COMPILED_SLIDE_SCHEMAS.get(key)
+    if compiled is None or compiled.source_schema != slide_layout.json_schema:
+        if compiled is not None:
+            _COMPILED_BY_RESPONSE_SCHEMA.pop(id(compiled.response_schema), None)
+        compiled = compile_slide_schema(slide_layout, provider)
+        COMPILED_SLIDE_SCHEMAS[key] = compiled
+        _COMPILED_BY_RESPONSE_SCHEMA[id(compiled.response_schema)] = compiled
+    return compiled
+
+
+def precompile_layout_schemas(
+    layout: PresentationLayoutModel, provider: Optional[LLMProvider] = None
+):
+    try:
+        provider = provider or get_llm_provider()
+    except HTTPException:
+        # No LLM selected yet, schemas are compiled on first use instead
+        return
+    for slide_layout in layout.slides:
+        get_compiled_slide_schema(layout.name, slide_layout, provider)
+
+
+def invalidate_layout_schemas(layout_group: str):
+    for key in [key for key in COMPILED_SLIDE_SCHEMAS if key[0] == layout_group]:
+        compiled = COMPILED_SLIDE_SCHEMAS.pop(key)
+        _COMPILED_BY_RESPONSE_SCHEMA.pop(id(compiled.response_schema), None)
+
+
+def get_parameters_schema(response_schema: dict) -> dict:
+    """Flattened, title-less ``response_schema``, precompiled for layout schemas."""
+    compiled = _COMPILED_BY_RESPONSE_SCHEMA.get(id(response_schema))
+    if (
+        compiled is not None
+        and compiled.response_schema is response_schema
+        and compiled.parameters_schema is not None
+    ):
+        return compiled.parameters_schema
+    return remove_titles_from_schema(flatten_json_schema(response_schema))
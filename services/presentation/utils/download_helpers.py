@@ -1,58 +1,14 @@
 import asyncio
-import os
-import mimetypes
 from typing import List, Optional
-from urllib.parse import urlparse
 
-import aiohttp
-
-import uuid
+from services.presentation.services.download_manager import DOWNLOAD_MANAGER
 
 
 async def download_file(
     url: str, save_directory: str, headers: Optional[dict] = None
 ) -> Optional[str]:
     try:
-        os.makedirs(save_directory, exist_ok=True)
-
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-
-        if not filename or "." not in filename:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.head(url, headers=headers) as response:
-                    if response.status == 200:
-                        content_disposition = response.headers.get(
-                            "Content-Disposition", ""
-                        )
-                        if "filename=" in content_disposition:
-                            filename = content_disposition.split("filename=")[1].strip(
-                                "\"'"
-                            )
-                        else:
-                            content_type = response.headers.get("Content-Type", "")
-                            if content_type:
-                                extension = mimetypes.guess_extension(
-                                    content_type.split(";")[0]
-                                )
-                                if extension:
-                                    filename = f"{uuid.uuid4()}{extension}"
-
-        filename = filename or str(uuid.uuid4())
-        save_path = os.path.join(save_directory, filename)
-
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            file.write(chunk)
-                    print(f"File downloaded successfully: {save_path}")
-                    return save_path
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return None
-
+        return await DOWNLOAD_MANAGER.download(url, save_directory, headers)
     except Exception as e:
         print(f"Error downloading file from {url}: {e}")
         return None
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import shutil
 from typing import BinaryIO
 import uuid
 
@@ -42,3 +44,20 @@ def set_file_ext(file_path: str, ext: str) -> str:
     if get_file_ext_or_none(file_path):
         return f"{os.path.splitext(file_path)[0]}{ext}"
     return f"{file_path}{ext}"
+
+
+def get_file_hash(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_or_copy_file(source: str, destination: str):
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
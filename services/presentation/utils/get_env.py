@@ -95,3 +95,12 @@ def get_extended_reasoning_env():
 
 def get_web_grounding_env():
     return os.getenv("WEB_GROUNDING")
+
+
+def get_llm_response_cache_env():
+    return os.getenv("LLM_RESPONSE_CACHE")
+
+
+def get_llm_budget_env(provider: str, budget: str):
+    # e.g. LLM_ANTHROPIC_REQUESTS_PER_MINUTE
+    return os.getenv(f"LLM_{provider.upper()}_{budget.upper()}")
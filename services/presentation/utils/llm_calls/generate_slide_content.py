@@ -1,12 +1,16 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 from services.presentation.models.llm_message import LLMSystemMessage, LLMUserMessage
 from services.presentation.models.presentation_layout import SlideLayoutModel
 from services.presentation.models.presentation_outline_model import SlideOutlineModel
 from services.presentation.services.llm_client import LLMClient
+from services.presentation.services.llm_response_cache import LLM_RESPONSE_CACHE
 from services.presentation.utils.llm_client_error_handler import handle_llm_client_exceptions
-from services.presentation.utils.llm_provider import get_model
-from services.presentation.utils.schema_utils import add_field_in_schema, remove_fields_from_schema
+from services.presentation.utils.compiled_schemas import (
+    compile_slide_schema,
+    get_compiled_slide_schema,
+)
+from services.presentation.utils.llm_provider import get_llm_provider, get_model
 
 
 def get_system_prompt(
@@ -64,10 +68,10 @@ def get_system_prompt(
     """
 
 
-def get_user_prompt(outline: str, language: str):
+def get_user_prompt(outline: str, language: str, current_date: Optional[str] = None):
     return f"""
-        ## Current Date and Time
-        {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        {"## Current Date" if current_date else ""}
+        {current_date or ""}
 
         ## Icon Query And Image Prompt Language
         English
@@ -86,6 +90,7 @@ def get_messages(
     tone: Optional[str] = None,
     verbosity: Optional[str] = None,
     instructions: Optional[str] = None,
+    current_date: Optional[str] = None,
 ):
 
     return [
@@ -93,7 +98,7 @@ def get_messages(
             content=get_system_prompt(tone, verbosity, instructions),
         ),
         LLMUserMessage(
-            content=get_user_prompt(outline, language),
+            content=get_user_prompt(outline, language, current_date),
         ),
     ]
 
@@ -105,40 +110,68 @@ async def get_slide_content_from_type_and_outline(
     tone: Optional[str] = None,
     verbosity: Optional[str] = None,
     instructions: Optional[str] = None,
+    layout_group: Optional[str] = None,
 ):
+    response, _ = await get_slide_content_and_cache_status(
+        slide_layout, outline, language, tone, verbosity, instructions, layout_group
+    )
+    return response
+
+
+async def get_slide_content_and_cache_status(
+    slide_layout: SlideLayoutModel,
+    outline: SlideOutlineModel,
+    language: str,
+    tone: Optional[str] = None,
+    verbosity: Optional[str] = None,
+    instructions: Optional[str] = None,
+    layout_group: Optional[str] = None,
+) -> Tuple[dict, bool]:
+    """Returns the slide content and whether it was served from LLM_RESPONSE_CACHE."""
     client = LLMClient()
     model = get_model()
+    provider = get_llm_provider()
 
-    response_schema = remove_fields_from_schema(
-        slide_layout.json_schema, ["__image_url__", "__icon_url__"]
+    # Schemas are compiled once per layout and shared, so they must not be mutated
+    compiled_schema = (
+        get_compiled_slide_schema(layout_group, slide_layout, provider)
+        if layout_group
+        else compile_slide_schema(slide_layout, provider)
     )
-    response_schema = add_field_in_schema(
-        response_schema,
-        {
-            "__speaker_note__": {
-                "type": "string",
-                "minLength": 100,
-                "maxLength": 250,
-                "description": "Speaker note for the slide",
-            }
-        },
-        True,
+    response_schema = compiled_schema.response_schema
+    messages = get_messages(
+        outline.content,
+        language,
+        tone,
+        verbosity,
+        instructions,
+        current_date=datetime.now().strftime("%Y-%m-%d"),
     )
 
+    cache_key = None
+    if LLM_RESPONSE_CACHE.enabled:
+        # Keyed without the current date, so entries live for the whole TTL
+        # instead of changing every day
+        cache_key = LLM_RESPONSE_CACHE.get_key(
+            provider.value,
+            model,
+            get_messages(outline.content, language, tone, verbosity, instructions),
+            response_schema,
+        )
+        cached_response = await LLM_RESPONSE_CACHE.get(cache_key)
+        if cached_response is not None:
+            return cached_response, True
+
     try:
         response = await client.generate_structured(
             model=model,
-            messages=get_messages(
-                outline.content,
-                language,
-                tone,
-                verbosity,
-                instructions,
-            ),
+            messages=messages,
             response_format=response_schema,
             strict=False,
         )
-        return response
-
     except Exception as e:
         raise handle_llm_client_exceptions(e)
+
+    if cache_key:
+        await LLM_RESPONSE_CACHE.set(cache_key, response)
+    return response, False
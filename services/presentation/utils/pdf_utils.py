@@ -0,0 +1,27 @@
+import os
+import time
+
+import pdfplumber
+
+# Runs in PdfPageRenderer worker processes and is preloaded by their fork
+# server (utils/worker_pool.py), so this module must stay free of import-time
+# side effects
+
+
+def render_pdf_page(
+    file_path: str, page_number: int, resolution: int, image_path: str
+) -> float:
+    start = time.perf_counter()
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    with pdfplumber.open(file_path, pages=[page_number]) as pdf:
+        image = pdf.pages[0].to_image(resolution=resolution)
+        # Write under a temporary name so readers never see a partial image
+        partial_path = f"{image_path}.{os.getpid()}.partial.png"
+        image.save(partial_path)
+        os.replace(partial_path, image_path)
+    return time.perf_counter() - start
+
+
+def get_pdf_page_count(file_path: str) -> int:
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
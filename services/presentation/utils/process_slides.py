@@ -29,14 +29,15 @@ async def process_slide_and_fetch_assets(
             )
         )
 
-    for icon_path in icon_paths:
-        __icon_query__parent = get_dict_at_path(slide.content, icon_path)
-        async_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(__icon_query__parent["__icon_query__"])
-        )
+    icon_queries = [
+        get_dict_at_path(slide.content, icon_path)["__icon_query__"]
+        for icon_path in icon_paths
+    ]
+    async_tasks.append(ICON_FINDER_SERVICE.search_icons_batch(icon_queries))
 
-    results = await asyncio.gather(*async_tasks)
+    *results, icon_results = await asyncio.gather(*async_tasks)
     results.reverse()
+    icon_results.reverse()
 
     return_assets = []
     for image_path in image_paths:
@@ -51,7 +52,7 @@ async def process_slide_and_fetch_assets(
 
     for icon_path in icon_paths:
         icon_dict = get_dict_at_path(slide.content, icon_path)
-        icon_dict["__icon_url__"] = results.pop()[0]
+        icon_dict["__icon_url__"] = icon_results.pop()[0]
         set_dict_at_path(slide.content, icon_path, icon_dict)
 
     return return_assets
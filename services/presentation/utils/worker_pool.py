@@ -0,0 +1,55 @@
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.context import ForkServerContext, ForkServerProcess
+from typing import Callable, Optional
+
+# Imported once by the fork server, so each worker starts with them loaded.
+# Worker modules must stay free of import-time side effects.
+WORKER_PRELOAD_MODULES = [
+    "services.presentation.utils.pdf_utils",
+    "services.presentation.services.docling_service",
+]
+
+_launch_lock = threading.Lock()
+
+
+@contextmanager
+def _detached_main_module():
+    # multiprocessing re-imports the parent's __main__ in every child
+    # (as __mp_main__). The service runs as `python -m ...main`, so that
+    # would load the whole app in each worker; hide it while launching.
+    with _launch_lock:
+        main_module = sys.modules["__main__"]
+        sys.modules["__main__"] = types.ModuleType("__main__")
+        try:
+            yield
+        finally:
+            sys.modules["__main__"] = main_module
+
+
+class _WorkerProcess(ForkServerProcess):
+    @staticmethod
+    def _Popen(process_obj):
+        with _detached_main_module():
+            return ForkServerProcess._Popen(process_obj)
+
+
+class _WorkerContext(ForkServerContext):
+    Process = _WorkerProcess
+
+
+def create_worker_pool(
+    max_workers: int, initializer: Optional[Callable[[], None]] = None
+) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers are forked from a fork server that only
+    preloads WORKER_PRELOAD_MODULES, never the service entrypoint.
+    """
+    context = _WorkerContext()
+    context.set_forkserver_preload(WORKER_PRELOAD_MODULES)
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=context, initializer=initializer
+    )
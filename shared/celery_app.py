@@ -3,6 +3,7 @@ Celery application configuration.
 """
 
 from celery import Celery
+from celery.schedules import crontab
 from shared.config.settings import settings
 
 # Create Celery application
@@ -26,8 +27,17 @@ celery_app.conf.update(
     worker_max_tasks_per_child=1000,
 )
 
+# Periodic tasks run by celery-beat
+celery_app.conf.beat_schedule = {
+    "maintain-log-partitions": {
+        "task": "shared.tasks.maintain_log_partitions",
+        "schedule": crontab(hour=3, minute=0),
+    },
+}
+
 # Auto-discover tasks from all services
 celery_app.autodiscover_tasks([
+    "shared",
     "services.ai",
     "services.documents",
     "services.financial",
@@ -104,6 +104,12 @@ class Settings(BaseSettings):
     ai_service_url: str = Field(default="http://localhost:8007")
     presentation_service_url: str = Field(default="http://localhost:8008")
 
+    # Log tables partitioned by month (maintained by the Celery beat task)
+    log_partition_months_ahead: int = Field(default=3)
+    audit_logs_retention_days: int = Field(default=365)
+    audit_trail_retention_days: int = Field(default=1825)
+    agent_logs_retention_days: int = Field(default=90)
+
     # Sentry
     sentry_dsn: Optional[str] = Field(default=None)
 
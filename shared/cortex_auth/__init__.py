@@ -41,6 +41,9 @@ from .exceptions import (
 # Configuration
 from .config import AuthSettings, settings
 
+# Verification keys
+from .keys import KeyStore, get_key_store, key_id, parse_public_key
+
 # Utilities
 from .utils import (
     create_user_from_token,
@@ -92,6 +95,11 @@ __all__ = [
     # Configuration
     "AuthSettings",
     "settings",
+    # Verification keys
+    "KeyStore",
+    "get_key_store",
+    "key_id",
+    "parse_public_key",
     # Utilities
     "decode_token",
     "create_user_from_token",
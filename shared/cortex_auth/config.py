@@ -27,6 +27,13 @@ class AuthSettings(BaseSettings):
     auth_public_key_path: Optional[str] = None
     auth_public_key: Optional[str] = None
 
+    # Directory of additional trusted public keys (*.pem), e.g. the previous
+    # key during a rotation overlap window
+    auth_public_key_dir: Optional[str] = None
+
+    # Seconds between checks of the key files for changes (0 = every token)
+    auth_key_reload_interval_seconds: float = 5.0
+
     # Token issuer validation
     auth_issuer: str = "cortex-auth-service"
 
@@ -86,28 +93,43 @@ class AuthSettings(BaseSettings):
             Absolute path to public key file
         """
         if self.auth_public_key_path:
-            path = Path(self.auth_public_key_path)
-            # If relative path, resolve from project root
-            if not path.is_absolute():
-                # Try to find project root (contains pyproject.toml)
-                current = Path.cwd()
-                while current != current.parent:
-                    if (current / "pyproject.toml").exists():
-                        return current / path
-                    current = current.parent
-                # Fallback to current directory
-                return Path.cwd() / path
-            return path
+            return self._resolve_project_path(Path(self.auth_public_key_path))
 
         # Default path: keys/jwt-public.pem from project root
+        return self._resolve_project_path(Path("keys") / "jwt-public.pem")
+
+    def resolve_key_dir(self) -> Optional[Path]:
+        """
+        Resolve the directory of additional trusted public keys.
+
+        Returns:
+            Absolute path to the key directory, or None if not configured
+        """
+        if not self.auth_public_key_dir:
+            return None
+        return self._resolve_project_path(Path(self.auth_public_key_dir))
+
+    @staticmethod
+    def _resolve_project_path(path: Path) -> Path:
+        """
+        Resolve a relative path from the project root.
+
+        Returns:
+            Absolute path (relative paths are joined to the nearest directory
+            containing pyproject.toml, or the current directory)
+        """
+        if path.is_absolute():
+            return path
+
+        # Try to find project root (contains pyproject.toml)
         current = Path.cwd()
         while current != current.parent:
             if (current / "pyproject.toml").exists():
-                return current / "keys" / "jwt-public.pem"
+                return current / path
             current = current.parent
 
         # Fallback to current directory
-        return Path.cwd() / "keys" / "jwt-public.pem"
+        return Path.cwd() / path
 
 
 # Global settings instance
@@ -0,0 +1,213 @@
+"""
+Verification key store for JWT validation.
+
+Public keys are parsed once into reusable verifier objects instead of being
+read from disk and re-parsed for every token. The key files are watched
+(mtime, size and inode) and reloaded when they change, e.g. after the auth
+service rotates its key pair. Several keys can be trusted at once; a token's
+``kid`` header selects the key it is verified with.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from jose import jwk, jwt
+from jose.backends.base import Key
+
+from .config import AuthSettings
+
+logger = logging.getLogger(__name__)
+
+ALGORITHM = "RS256"
+
+
+@lru_cache(maxsize=32)
+def parse_public_key(public_key: str) -> Key:
+    """
+    Parse an RSA public key into a reusable verifier.
+
+    Args:
+        public_key: RSA public key in PEM format
+
+    Returns:
+        Parsed key, memoized by its PEM text
+    """
+    return jwk.construct(public_key, ALGORITHM)
+
+
+def key_id(key: Key) -> str:
+    """
+    Compute the ``kid`` of a public key.
+
+    The ``kid`` is the RFC 7638 JWK thumbprint (SHA-256, base64url), so the
+    auth service and every verifier derive the same ID from the key alone.
+
+    Args:
+        key: Parsed RSA public key
+
+    Returns:
+        Key ID string
+    """
+    jwk_dict = key.to_dict()
+    members = json.dumps(
+        {"e": jwk_dict["e"], "kty": jwk_dict["kty"], "n": jwk_dict["n"]},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(members.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+class KeyStore:
+    """
+    Parsed verification keys, reloaded when their source files change.
+
+    Keys come from AUTH_PUBLIC_KEY (or the AUTH_PUBLIC_KEY_PATH file) plus
+    every ``*.pem`` file in AUTH_PUBLIC_KEY_DIR, indexed by ``kid``. Sources
+    are checked at most once per AUTH_KEY_RELOAD_INTERVAL_SECONDS, and
+    immediately when a token names a ``kid`` that is not loaded.
+    """
+
+    def __init__(self, auth_settings: AuthSettings):
+        self.settings = auth_settings
+        self.reload_interval = auth_settings.auth_key_reload_interval_seconds
+        self._key_path = None if auth_settings.auth_public_key else auth_settings._resolve_key_path()
+        self._key_dir = auth_settings.resolve_key_dir()
+        self._keys: dict[str, Key] = {}
+        self._all_keys: tuple[Key, ...] = ()
+        self._sources: tuple | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def kids(self) -> list[str]:
+        """IDs of the currently trusted keys."""
+        self._refresh()
+        return list(self._keys)
+
+    def get_key(self, token: str) -> Key | tuple[Key, ...]:
+        """
+        Get the key(s) to verify a token with.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            The key matching the token's ``kid``, or every trusted key if the
+            token has no ``kid`` or names an unknown one
+
+        Raises:
+            ValueError: If no key has ever been loaded successfully
+            JWTError: If the token header is malformed
+        """
+        self._refresh()
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            return self._all_keys
+
+        key = self._keys.get(kid)
+        if key is None:
+            # An unknown kid usually means the keys rotated since the last check
+            self._refresh(force=True)
+            key = self._keys.get(kid)
+        return key if key is not None else self._all_keys
+
+    def reload(self) -> None:
+        """Re-check the key sources now instead of waiting for the next interval."""
+        self._refresh(force=True)
+
+    def _refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+
+        with self._lock:
+            self._next_check = now + self.reload_interval
+            sources = self._snapshot_sources()
+            if sources == self._sources:
+                return
+
+            try:
+                keys = self._load_keys()
+            except ValueError:
+                if not self._keys:
+                    self._next_check = 0.0
+                    raise
+                # Keep verifying with the previous keys, e.g. while a rotation
+                # is still writing the new file
+                logger.warning("Failed to reload public keys; keeping previous keys", exc_info=True)
+                return
+
+            self._keys = keys
+            self._all_keys = tuple(keys.values())
+            self._sources = sources
+            logger.info(f"Loaded {len(keys)} public key(s) for JWT validation: {list(keys)}")
+
+    def _source_files(self) -> list[Path]:
+        files = [self._key_path] if self._key_path is not None else []
+        if self._key_dir is not None and self._key_dir.is_dir():
+            files.extend(sorted(self._key_dir.glob("*.pem")))
+        return files
+
+    def _snapshot_sources(self) -> tuple:
+        snapshot = []
+        for path in self._source_files():
+            try:
+                stat = os.stat(path)
+                snapshot.append((str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except OSError:
+                snapshot.append((str(path), None, None, None))
+        return tuple(snapshot)
+
+    def _load_keys(self) -> dict[str, Key]:
+        try:
+            primary = parse_public_key(self.settings.get_public_key())
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to parse public key: {e}")
+
+        keys = {key_id(primary): primary}
+
+        for path in self._source_files():
+            if path == self._key_path:
+                continue
+            try:
+                key = parse_public_key(path.read_text().strip())
+            except Exception as e:
+                logger.warning(f"Skipping unreadable public key {path}: {e}")
+                continue
+            keys.setdefault(key_id(key), key)
+
+        return keys
+
+
+_key_store: KeyStore | None = None
+_key_store_lock = threading.Lock()
+
+
+def get_key_store(auth_settings: AuthSettings) -> KeyStore:
+    """
+    Get the shared key store for a settings instance.
+
+    Args:
+        auth_settings: Settings the keys are loaded from
+
+    Returns:
+        KeyStore, created once and reused while the settings object is unchanged
+    """
+    global _key_store
+    store = _key_store
+    if store is None or store.settings is not auth_settings:
+        with _key_store_lock:
+            if _key_store is None or _key_store.settings is not auth_settings:
+                _key_store = KeyStore(auth_settings)
+            store = _key_store
+    return store
@@ -0,0 +1,61 @@
+"""Microbenchmark for token decoding.
+
+Compares decode_token with the cached key store against the previous
+per-call path, which re-read the public key file and re-parsed the PEM.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from jose import jwt
+
+from cortex_auth import utils
+from cortex_auth.config import AuthSettings
+from cortex_auth.utils import decode_token
+
+DECODES = 500
+
+
+def _previous_decode(token: str, auth_settings: AuthSettings) -> dict:
+    """The previous per-call path: read the key file, then decode with the PEM text."""
+    return jwt.decode(
+        token,
+        auth_settings.get_public_key(),
+        algorithms=["RS256"],
+        options={"verify_aud": False},
+    )
+
+
+def _decodes_per_second(fn, token: str) -> float:
+    start = time.perf_counter()
+    for _ in range(DECODES):
+        fn(token)
+    return DECODES / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+class TestDecodePerformance:
+    """Token decode throughput with and without the cached key store."""
+
+    def test_cached_key_store_throughput(self, temp_public_key_file, create_jwt_token, valid_token_payload, monkeypatch):
+        """Decoding with parsed, cached keys should beat re-reading and re-parsing the key."""
+        file_settings = AuthSettings(
+            auth_public_key=None,
+            auth_public_key_path=temp_public_key_file,
+        )
+        monkeypatch.setattr(utils, "settings", file_settings)
+        token = create_jwt_token(valid_token_payload)
+        decode_token(token)  # Warm the key store
+
+        previous = np.median([
+            _decodes_per_second(lambda t: _previous_decode(t, file_settings), token) for _ in range(3)
+        ])
+        cached = np.median([_decodes_per_second(decode_token, token) for _ in range(3)])
+
+        print(f"\n=== Token Decode Performance ({DECODES} decodes) ===")
+        print(f"Re-read + re-parse key: {previous:8.0f} decodes/s ({1e6 / previous:6.1f} µs/decode)")
+        print(f"Cached key store:       {cached:8.0f} decodes/s ({1e6 / cached:6.1f} µs/decode)")
+        print(f"Speedup:                {cached / previous:8.2f}x")
+
+        assert cached > previous, "Cached key store slower than re-parsing the key per decode"
@@ -0,0 +1,244 @@
+"""
+Tests for the cortex-auth verification key store.
+
+Tests key parsing and memoization, kid derivation, multi-key selection
+by kid, and reloading when key files change.
+"""
+
+import os
+
+import pytest
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from cortex_auth import utils
+from cortex_auth.config import AuthSettings
+from cortex_auth.exceptions import TokenInvalidError
+from cortex_auth.keys import KeyStore, get_key_store, key_id, parse_public_key
+from cortex_auth.utils import decode_token
+
+
+def _generate_key_pair() -> dict:
+    private_key = rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=2048,
+        backend=default_backend()
+    )
+    return {
+        "private_key": private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ).decode(),
+        "public_key": private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode(),
+    }
+
+
+@pytest.fixture(scope="module")
+def next_rsa_keys():
+    """Second RSA key pair, e.g. the one a rotation switches to."""
+    return _generate_key_pair()
+
+
+@pytest.fixture
+def sign(valid_token_payload):
+    """Factory fixture to sign the valid payload with a given key pair and kid."""
+    def _sign(keys: dict, kid: str | None = None) -> str:
+        payload = valid_token_payload.copy()
+        payload["iat"] = payload["iat"].timestamp()
+        payload["exp"] = payload["exp"].timestamp()
+        headers = {"kid": kid} if kid else None
+        return jwt.encode(payload, keys["private_key"], algorithm="RS256", headers=headers)
+
+    return _sign
+
+
+@pytest.fixture
+def file_settings(temp_public_key_file):
+    """Settings that load the public key from a file, checked on every call."""
+    return AuthSettings(
+        auth_public_key=None,
+        auth_public_key_path=temp_public_key_file,
+        auth_key_reload_interval_seconds=0,
+    )
+
+
+def _rewrite(path: str, content: str) -> None:
+    """Replace a key file and make sure its mtime moves forward."""
+    stat = os.stat(path)
+    with open(path, "w") as f:
+        f.write(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestParsePublicKey:
+    """Tests for parse_public_key() and key_id()."""
+
+    def test_parsed_key_is_reused(self, rsa_keys):
+        """Test that the same PEM text is only parsed once."""
+        assert parse_public_key(rsa_keys["public_key"]) is parse_public_key(rsa_keys["public_key"])
+
+    def test_key_id_is_stable_per_key(self, rsa_keys, next_rsa_keys):
+        """Test that kid is derived from the key material alone."""
+        first = key_id(parse_public_key(rsa_keys["public_key"]))
+
+        assert first == key_id(parse_public_key(rsa_keys["public_key"] + "\n"))
+        assert first != key_id(parse_public_key(next_rsa_keys["public_key"]))
+        assert "=" not in first
+
+
+class TestKeyStore:
+    """Tests for KeyStore loading, selection and reloading."""
+
+    def test_inline_key(self, mock_settings, rsa_keys):
+        """Test that AUTH_PUBLIC_KEY is loaded without touching disk."""
+        store = KeyStore(mock_settings)
+
+        assert store.kids == [key_id(parse_public_key(rsa_keys["public_key"]))]
+
+    def test_missing_key_file_raises(self, tmp_path):
+        """Test that a missing key file is a configuration error."""
+        store = KeyStore(AuthSettings(
+            auth_public_key=None,
+            auth_public_key_path=str(tmp_path / "missing.pem"),
+        ))
+
+        with pytest.raises(ValueError):
+            store.kids
+
+    def test_key_file_read_once_per_interval(self, temp_public_key_file, mocker):
+        """Test that the key file is not re-read for every token."""
+        store = KeyStore(AuthSettings(
+            auth_public_key=None,
+            auth_public_key_path=temp_public_key_file,
+            auth_key_reload_interval_seconds=60,
+        ))
+        get_public_key = mocker.spy(AuthSettings, "get_public_key")
+
+        for _ in range(10):
+            store.kids
+
+        assert get_public_key.call_count == 1
+
+    def test_unchanged_file_not_reparsed(self, file_settings, mocker):
+        """Test that an unchanged key file is only stat'ed on each check."""
+        store = KeyStore(file_settings)
+        store.kids
+        get_public_key = mocker.spy(AuthSettings, "get_public_key")
+
+        store.reload()
+        store.reload()
+
+        assert get_public_key.call_count == 0
+
+    def test_reload_on_rotation(self, file_settings, rsa_keys, next_rsa_keys, sign, monkeypatch):
+        """Test that tokens signed with a rotated key verify once the file changes."""
+        monkeypatch.setattr(utils, "settings", file_settings)
+        old_token = sign(rsa_keys)
+        new_token = sign(next_rsa_keys)
+
+        assert decode_token(old_token)["jti"] == "test-jwt-id"
+        with pytest.raises(TokenInvalidError):
+            decode_token(new_token)
+
+        _rewrite(file_settings.auth_public_key_path, next_rsa_keys["public_key"])
+
+        assert decode_token(new_token)["jti"] == "test-jwt-id"
+        with pytest.raises(TokenInvalidError):
+            decode_token(old_token)
+
+    def test_keeps_previous_keys_while_file_missing(self, file_settings, rsa_keys):
+        """Test that a key file removed mid-rotation does not drop the loaded keys."""
+        store = KeyStore(file_settings)
+        kids = store.kids
+
+        os.remove(file_settings.auth_public_key_path)
+
+        assert store.kids == kids
+
+    def test_unknown_kid_forces_reload(self, temp_public_key_file, next_rsa_keys, sign):
+        """Test that a token naming an unknown kid re-checks the key files immediately."""
+        store = KeyStore(AuthSettings(
+            auth_public_key=None,
+            auth_public_key_path=temp_public_key_file,
+            auth_key_reload_interval_seconds=3600,
+        ))
+        store.kids
+        new_key = parse_public_key(next_rsa_keys["public_key"])
+
+        _rewrite(temp_public_key_file, next_rsa_keys["public_key"])
+
+        selected = store.get_key(sign(next_rsa_keys, kid=key_id(new_key)))
+
+        assert key_id(selected) == key_id(new_key)
+
+
+class TestMultipleKeys:
+    """Tests for trusting several keys during a rotation overlap."""
+
+    @pytest.fixture
+    def overlap_settings(self, tmp_path, rsa_keys, next_rsa_keys, monkeypatch):
+        """Current key inline, previous key in AUTH_PUBLIC_KEY_DIR."""
+        key_dir = tmp_path / "trusted"
+        key_dir.mkdir()
+        (key_dir / "previous.pem").write_text(next_rsa_keys["public_key"])
+        (key_dir / "notes.txt").write_text("not a key")
+
+        overlap = AuthSettings(
+            auth_public_key=rsa_keys["public_key"],
+            auth_public_key_dir=str(key_dir),
+        )
+        monkeypatch.setattr(utils, "settings", overlap)
+        return overlap
+
+    def test_all_keys_loaded(self, overlap_settings, rsa_keys, next_rsa_keys):
+        """Test that the primary key and every *.pem in the key dir are trusted."""
+        kids = get_key_store(overlap_settings).kids
+
+        assert set(kids) == {
+            key_id(parse_public_key(rsa_keys["public_key"])),
+            key_id(parse_public_key(next_rsa_keys["public_key"])),
+        }
+
+    def test_kid_selects_key(self, overlap_settings, next_rsa_keys, sign):
+        """Test that a token's kid selects exactly one verification key."""
+        previous = parse_public_key(next_rsa_keys["public_key"])
+        token = sign(next_rsa_keys, kid=key_id(previous))
+
+        assert key_id(get_key_store(overlap_settings).get_key(token)) == key_id(previous)
+        assert decode_token(token)["jti"] == "test-jwt-id"
+
+    def test_token_without_kid_tries_all_keys(self, overlap_settings, rsa_keys, next_rsa_keys, sign):
+        """Test that tokens issued before kid support still verify."""
+        assert decode_token(sign(rsa_keys))["jti"] == "test-jwt-id"
+        assert decode_token(sign(next_rsa_keys))["jti"] == "test-jwt-id"
+
+    def test_kid_mismatch_rejected(self, overlap_settings, rsa_keys, next_rsa_keys, sign):
+        """Test that a token is not accepted under another trusted key's kid."""
+        token = sign(rsa_keys, kid=key_id(parse_public_key(next_rsa_keys["public_key"])))
+
+        with pytest.raises(TokenInvalidError):
+            decode_token(token)
+
+    def test_untrusted_key_rejected(self, overlap_settings, sign):
+        """Test that a token signed by an unknown key is rejected."""
+        with pytest.raises(TokenInvalidError):
+            decode_token(sign(_generate_key_pair()))
+
+
+class TestGetKeyStore:
+    """Tests for the shared key store."""
+
+    def test_store_reused_for_same_settings(self, mock_settings):
+        """Test that one store is shared while the settings are unchanged."""
+        assert get_key_store(mock_settings) is get_key_store(mock_settings)
+
+    def test_store_replaced_for_new_settings(self, mock_settings, file_settings):
+        """Test that replacing the settings object replaces the store."""
+        assert get_key_store(mock_settings) is not get_key_store(file_settings)
+        assert get_key_store(file_settings).settings is file_settings
@@ -13,6 +13,7 @@ from jose.exceptions import ExpiredSignatureError
 
 from .config import settings
 from .exceptions import IssuerInvalidError, TokenExpiredError, TokenInvalidError
+from .keys import get_key_store, parse_public_key
 from .models import User
 
 
@@ -20,6 +21,9 @@ def decode_token(token: str, public_key: str | None = None) -> dict[str, Any]:
     """
     Decode and validate JWT with RS256 public key.
 
+    Public keys are parsed once and reused. Without an explicit key, the
+    token is verified against the shared key store (selected by ``kid``).
+
     Args:
         token: JWT token string
         public_key: Optional RSA public key (uses settings if not provided)
@@ -31,15 +35,20 @@ def decode_token(token: str, public_key: str | None = None) -> dict[str, Any]:
         TokenInvalidError: If token is malformed or signature is invalid
         TokenExpiredError: If token has expired
         IssuerInvalidError: If token issuer is invalid
+        ValueError: If no public key can be loaded from settings
     """
-    if public_key is None:
-        public_key = settings.get_public_key()
+    key_store = get_key_store(settings) if public_key is None else None
 
     try:
+        if key_store is not None:
+            verification_key = key_store.get_key(token)
+        else:
+            verification_key = parse_public_key(public_key)
+
         # Decode JWT with RS256 algorithm
         payload = jwt.decode(
             token,
-            public_key,
+            verification_key,
             algorithms=["RS256"],
             options={"verify_aud": False},  # No audience claim in our tokens
         )
@@ -63,6 +72,9 @@ def decode_token(token: str, public_key: str | None = None) -> dict[str, Any]:
         raise
     except IssuerInvalidError:
         raise
+    except ValueError:
+        # No usable public key configured
+        raise
     except ExpiredSignatureError:
         # Jose's built-in expiration check detected expired token
         raise TokenExpiredError("Token has expired")
@@ -14,6 +14,8 @@ class AgentLog(Base, BaseModelMixin):
     """Agent Log model."""
 
     __tablename__ = "agent_logs"
+    # Range-partitioned by month on created_at in PostgreSQL (primary key
+    # (id, created_at)); old months are dropped by shared.tasks
 
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"))
     agent_type = Column(String(50), nullable=False, index=True)  # ranker, generator, actuator, validator, extractor, conversational, orchestrator
@@ -34,6 +36,8 @@ class AuditTrail(Base, BaseModelMixin):
     """Audit Trail model."""
 
     __tablename__ = "audit_trail"
+    # Range-partitioned by month on created_at in PostgreSQL (primary key
+    # (id, created_at)); old months are dropped by shared.tasks
 
     company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("user_profiles.id", ondelete="SET NULL"))
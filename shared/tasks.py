@@ -0,0 +1,78 @@
+"""
+Database maintenance tasks shared by all services.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from shared.celery_app import celery_app
+from shared.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Log tables partitioned by month -> partition column
+PARTITIONED_LOG_TABLES = {
+    "audit_logs": "timestamp",
+    "audit_trail": "created_at",
+    "agent_logs": "created_at",
+}
+
+
+def get_retention_days() -> dict[str, int]:
+    """Days of rows kept in each partitioned log table."""
+    return {
+        "audit_logs": settings.audit_logs_retention_days,
+        "audit_trail": settings.audit_trail_retention_days,
+        "agent_logs": settings.agent_logs_retention_days,
+    }
+
+
+async def maintain_partitions() -> dict[str, dict[str, int]]:
+    """
+    Create upcoming monthly partitions and drop the expired ones.
+
+    Retention detaches and drops whole partitions (months entirely older than
+    the retention period), so it costs the same whatever the table size.
+    """
+    engine = create_async_engine(settings.database_url)
+    now = datetime.now(timezone.utc)
+    retention_days = get_retention_days()
+    report = {}
+
+    try:
+        for table, column in PARTITIONED_LOG_TABLES.items():
+            # One transaction per table, so locks are held briefly
+            async with engine.begin() as conn:
+                created = await conn.scalar(
+                    text("SELECT create_monthly_partitions(:table, :column, :months_ahead)"),
+                    {
+                        "table": table,
+                        "column": column,
+                        "months_ahead": settings.log_partition_months_ahead,
+                    },
+                )
+                dropped = await conn.scalar(
+                    text("SELECT drop_monthly_partitions_before(:table, :column, :cutoff)"),
+                    {
+                        "table": table,
+                        "column": column,
+                        "cutoff": now - timedelta(days=retention_days[table]),
+                    },
+                )
+            report[table] = {"created": created, "dropped": dropped}
+    finally:
+        await engine.dispose()
+
+    return report
+
+
+@celery_app.task
+def maintain_log_partitions() -> dict[str, dict[str, int]]:
+    """Daily partition maintenance of the log tables."""
+    report = asyncio.run(maintain_partitions())
+    logger.info(f"Log partitions maintained: {report}")
+    return report
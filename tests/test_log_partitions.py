@@ -0,0 +1,54 @@
+"""Unit tests for log table partition maintenance."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared import tasks
+from shared.config.settings import settings
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Engine whose transactions record the partition functions called."""
+    conn = MagicMock()
+    conn.scalar = AsyncMock(return_value=1)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock(return_value=conn)
+    transaction.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.begin.return_value = transaction
+    engine.dispose = AsyncMock()
+    engine.conn = conn
+    monkeypatch.setattr(tasks, "create_async_engine", lambda url: engine)
+    return engine
+
+
+class TestMaintainPartitions:
+    """Retention of every log table is enforced by one task, from settings."""
+
+    @pytest.mark.asyncio
+    async def test_one_short_transaction_per_table(self, engine):
+        """Test each table is maintained in its own transaction."""
+        report = await tasks.maintain_partitions()
+
+        assert set(report) == set(tasks.PARTITIONED_LOG_TABLES)
+        assert engine.begin.call_count == len(tasks.PARTITIONED_LOG_TABLES)
+        engine.dispose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_audit_logs_cutoff_from_settings(self, engine, monkeypatch):
+        """Test audit_logs partitions are dropped at the configured retention."""
+        monkeypatch.setattr(settings, "audit_logs_retention_days", 30)
+
+        await tasks.maintain_partitions()
+
+        drops = [
+            call.args[1]
+            for call in engine.conn.scalar.call_args_list
+            if "drop_monthly_partitions_before" in str(call.args[0])
+        ]
+        cutoff = next(params["cutoff"] for params in drops if params["table"] == "audit_logs")
+        expected = datetime.now(timezone.utc) - timedelta(days=30)
+        assert abs((cutoff - expected).total_seconds()) < 60